@@ -11,6 +11,7 @@ import (
 	"google.golang.org/grpc"
 	"google.golang.org/grpc/codes"
 	"google.golang.org/grpc/credentials/insecure"
+	_ "google.golang.org/grpc/encoding/gzip" // lets clients opt into gzip-compressed calls
 	"google.golang.org/grpc/status"
 	"google.golang.org/grpc/test/bufconn"
 )
@@ -17,6 +17,7 @@ from graphton.core.template import (
     extract_template_vars,
     has_templates,
     substitute_templates,
+    substitute_templates_batch,
 )
 
 __version__ = "0.1.0"
@@ -28,5 +29,6 @@ __all__ = [
     "extract_template_vars",
     "has_templates",
     "substitute_templates",
+    "substitute_templates_batch",
 ]
 
@@ -305,7 +305,7 @@ def create_deep_agent(
     if mcp_servers and mcp_tools:
         # Import MCP modules only when needed
         from graphton.core.middleware import McpToolsLoader
-        from graphton.core.tool_wrappers import create_tool_wrapper
+        from graphton.core.tool_wrappers import create_tool_wrappers_for_server
         
         # Validate that both parameters are provided together
         if not mcp_servers:
@@ -348,10 +348,10 @@ def create_deep_agent(
         # Use eager wrappers now that tools are loaded at creation time
         mcp_tool_wrappers: list[BaseTool] = []
         for server_name, tool_names in mcp_tools.items():
-            for tool_name in tool_names:
-                # Tools are always loaded (or deferred), so use eager wrappers
-                wrapper = create_tool_wrapper(tool_name, mcp_middleware)
-                mcp_tool_wrappers.append(wrapper)  # type: ignore[arg-type]
+            # Tools are always loaded (or deferred), so use eager wrappers
+            mcp_tool_wrappers.extend(
+                create_tool_wrappers_for_server(server_name, tool_names, mcp_middleware)
+            )
         
         # Add MCP tools and middleware to the agent
         tools_list.extend(mcp_tool_wrappers)
@@ -17,6 +17,7 @@ Key features:
 import hashlib
 import json
 import logging
+import sys
 from collections import deque
 from typing import Any
 
@@ -81,9 +82,13 @@ class LoopDetectionMiddleware(AgentMiddleware):
         self.enabled = enabled
         
         # Per-invocation state (cleared between agent runs)
-        self._tool_history: deque[tuple[str, str]] = deque(maxlen=history_size)
+        # Tool names and parameter hashes kept in parallel deques (index i
+        # in both describes the same call) to avoid a tuple per entry
+        self._hist_names: deque[str] = deque(maxlen=history_size)
+        self._hist_hashes: deque[str] = deque(maxlen=history_size)
         self._intervention_count = 0
         self._stopped = False
+        self._last_processed_message: AIMessage | None = None
         
         logger.info(
             f"Loop detection middleware initialized: "
@@ -122,15 +127,18 @@ class LoopDetectionMiddleware(AgentMiddleware):
             Tuple of (is_loop, tool_name, consecutive_count)
 
         """
-        if not self._tool_history:
+        if not self._hist_names:
             return False, "", 0
         
         # Get the most recent tool call
-        recent_tool, recent_hash = self._tool_history[-1]
+        recent_tool = self._hist_names[-1]
+        recent_hash = self._hist_hashes[-1]
         
         # Count consecutive identical calls working backwards
-        consecutive_count = 1
-        for tool_name, param_hash in reversed(list(self._tool_history)[:-1]):
+        consecutive_count = 0
+        for tool_name, param_hash in zip(
+            reversed(self._hist_names), reversed(self._hist_hashes)
+        ):
             if tool_name == recent_tool and param_hash == recent_hash:
                 consecutive_count += 1
             else:
@@ -146,15 +154,17 @@ class LoopDetectionMiddleware(AgentMiddleware):
             Tuple of (is_excessive, tool_name, total_count)
 
         """
-        if not self._tool_history:
+        if not self._hist_names:
             return False, "", 0
         
         # Count occurrences of each tool+params combination
-        recent_tool, recent_hash = self._tool_history[-1]
-        recent_signature = (recent_tool, recent_hash)
+        recent_tool = self._hist_names[-1]
+        recent_hash = self._hist_hashes[-1]
         
         total_count = sum(
-            1 for sig in self._tool_history if sig == recent_signature
+            1
+            for tool_name, param_hash in zip(self._hist_names, self._hist_hashes)
+            if param_hash == recent_hash and tool_name == recent_tool
         )
         
         is_excessive = total_count >= self.total_threshold
@@ -225,9 +235,11 @@ class LoopDetectionMiddleware(AgentMiddleware):
             return None
         
         # Clear state for new execution
-        self._tool_history.clear()
+        self._hist_names.clear()
+        self._hist_hashes.clear()
         self._intervention_count = 0
         self._stopped = False
+        self._last_processed_message = None
         
         logger.debug("Loop detection state initialized for new execution")
         return None
@@ -258,76 +270,94 @@ class LoopDetectionMiddleware(AgentMiddleware):
         if not messages:
             return None
         
-        # Look for tool calls in the most recent AIMessage
-        for msg in reversed(messages):
-            if isinstance(msg, AIMessage) and hasattr(msg, "tool_calls"):
-                tool_calls = msg.tool_calls or []
+        # Find the most recent AIMessage
+        last_ai_message = next(
+            (msg for msg in reversed(messages) if isinstance(msg, AIMessage)),
+            None,
+        )
+        if last_ai_message is None:
+            return None
+        
+        # Already tracked on a previous step - don't count its tool calls twice
+        if last_ai_message is self._last_processed_message:
+            return None
+        self._last_processed_message = last_ai_message
+        
+        # Most steps produce plain text - nothing to track
+        tool_calls = last_ai_message.tool_calls
+        if not tool_calls:
+            return None
+        
+        # Track each tool call
+        for tool_call in tool_calls:
+            # ToolCall always carries name/args; skip anything malformed
+            try:
+                raw_name = tool_call["name"]
+                tool_args = tool_call["args"]
+            except KeyError:
+                continue
+            
+            # Interned so history comparisons hit the identity fast path
+            tool_name = sys.intern(raw_name)
+            param_hash = self._hash_params(tool_args)
+            
+            # Add to history
+            self._hist_names.append(tool_name)
+            self._hist_hashes.append(param_hash)
+            
+            logger.debug(
+                f"Tracked tool call: {tool_name} (hash: {param_hash}), "
+                f"history size: {len(self._hist_names)}"
+            )
+            
+            # Check for loops
+            consecutive_loop, cons_tool, cons_count = self._detect_consecutive_loops()
+            total_loop, total_tool, total_count = self._detect_total_repetitions()
+            
+            if total_loop:
+                # Critical: total repetitions exceeded - force stop
+                logger.warning(
+                    f"LOOP DETECTED - Total threshold exceeded: "
+                    f"{total_tool} called {total_count} times (threshold: {self.total_threshold})"
+                )
                 
-                # Track each tool call
-                for tool_call in tool_calls:
-                    tool_name = tool_call.get("name", "unknown")
-                    tool_args = tool_call.get("args", {})
-                    param_hash = self._hash_params(tool_args)
-                    
-                    # Add to history
-                    self._tool_history.append((tool_name, param_hash))
-                    
-                    logger.debug(
-                        f"Tracked tool call: {tool_name} (hash: {param_hash}), "
-                        f"history size: {len(self._tool_history)}"
-                    )
-                    
-                    # Check for loops
-                    consecutive_loop, cons_tool, cons_count = self._detect_consecutive_loops()
-                    total_loop, total_tool, total_count = self._detect_total_repetitions()
-                    
-                    if total_loop:
-                        # Critical: total repetitions exceeded - force stop
-                        logger.warning(
-                            f"LOOP DETECTED - Total threshold exceeded: "
-                            f"{total_tool} called {total_count} times (threshold: {self.total_threshold})"
-                        )
-                        
-                        intervention = self._create_intervention_message(
-                            total_tool, cons_count, total_count, is_final=True
-                        )
-                        
-                        # Inject intervention message into state
-                        state["messages"].append(intervention)
-                        self._intervention_count += 1
-                        self._stopped = True
-                        
-                        logger.info(
-                            "Loop detection: Final intervention injected, execution will stop"
-                        )
-                        
-                        return {"messages": state["messages"]}
-                    
-                    elif consecutive_loop and self._intervention_count == 0:
-                        # Warning: consecutive repetitions - first intervention
-                        logger.warning(
-                            f"LOOP WARNING - Consecutive threshold reached: "
-                            f"{cons_tool} called {cons_count} times in a row "
-                            f"(threshold: {self.consecutive_threshold})"
-                        )
-                        
-                        intervention = self._create_intervention_message(
-                            cons_tool, cons_count, total_count, is_final=False
-                        )
-                        
-                        # Inject warning message
-                        state["messages"].append(intervention)
-                        self._intervention_count += 1
-                        
-                        logger.info(
-                            f"Loop detection: Warning intervention injected "
-                            f"(intervention #{self._intervention_count})"
-                        )
-                        
-                        return {"messages": state["messages"]}
+                intervention = self._create_intervention_message(
+                    total_tool, cons_count, total_count, is_final=True
+                )
                 
-                # Only process the most recent AIMessage
-                break
+                # Inject intervention message into state
+                state["messages"].append(intervention)
+                self._intervention_count += 1
+                self._stopped = True
+                
+                logger.info(
+                    "Loop detection: Final intervention injected, execution will stop"
+                )
+                
+                return {"messages": state["messages"]}
+            
+            elif consecutive_loop and self._intervention_count == 0:
+                # Warning: consecutive repetitions - first intervention
+                logger.warning(
+                    f"LOOP WARNING - Consecutive threshold reached: "
+                    f"{cons_tool} called {cons_count} times in a row "
+                    f"(threshold: {self.consecutive_threshold})"
+                )
+                
+                intervention = self._create_intervention_message(
+                    cons_tool, cons_count, total_count, is_final=False
+                )
+                
+                # Inject warning message
+                state["messages"].append(intervention)
+                self._intervention_count += 1
+                
+                logger.info(
+                    f"Loop detection: Warning intervention injected "
+                    f"(intervention #{self._intervention_count})"
+                )
+                
+                return {"messages": state["messages"]}
         
         return None
     
@@ -350,10 +380,10 @@ class LoopDetectionMiddleware(AgentMiddleware):
             return None
         
         # Log final statistics
-        if self._tool_history:
+        if self._hist_names:
             logger.info(
                 f"Loop detection summary: "
-                f"{len(self._tool_history)} tool calls tracked, "
+                f"{len(self._hist_names)} tool calls tracked, "
                 f"{self._intervention_count} interventions, "
                 f"stopped={self._stopped}"
             )
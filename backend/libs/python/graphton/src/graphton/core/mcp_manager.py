@@ -88,7 +88,9 @@ async def load_mcp_tools(
         # No modification needed - configs are already complete with auth
         mcp_client = MultiServerMCPClient(servers)
         
-        # Get all tools from all servers
+        # Get all tools from all servers. The adapter fans out one
+        # load task per server and gathers them, so connect latency is
+        # bounded by the slowest server rather than the sum of all.
         all_tools = await mcp_client.get_tools()
         
         logger.info(
@@ -118,13 +120,14 @@ async def load_mcp_tools(
             )
         
         # Log what we're returning
-        loaded_names = [t.name for t in filtered_tools]
-        logger.info(
-            f"Loaded {len(filtered_tools)} MCP tool(s): {loaded_names}"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Loaded {len(filtered_tools)} MCP tool(s): "
+                f"{[t.name for t in filtered_tools]}"
+            )
         
         # Check if any requested tools were not found
-        found_names = set(loaded_names)
+        found_names = {t.name for t in filtered_tools}
         missing_tools = requested_tools - found_names
         if missing_tools:
             logger.warning(
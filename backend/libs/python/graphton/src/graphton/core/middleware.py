@@ -234,3 +234,39 @@ class McpToolsLoader(AgentMiddleware):
             )
         
         return self._tools_cache[tool_name]
+    
+    def get_tools_bulk(self, tool_names: list[str]) -> dict[str, Any]:
+        """Get several cached MCP tools by name in one pass.
+        
+        Equivalent to calling get_tool() for each name, but reports every
+        missing tool in a single error instead of failing on the first.
+        
+        Args:
+            tool_names: Names of the tools to retrieve
+            
+        Returns:
+            Mapping of tool name to MCP tool instance, in tool_names order
+            
+        Raises:
+            RuntimeError: If tools haven't been loaded yet
+            ValueError: If any tool name is not found in cache
+            
+        Example:
+            >>> tools = middleware.get_tools_bulk(["list_organizations", "get_user"])
+
+        """
+        if not self._tools_loaded:
+            raise RuntimeError(
+                "MCP tools not loaded yet. This indicates initialization failure "
+                "or that middleware.before_agent() hasn't been called yet."
+            )
+        
+        cache = self._tools_cache
+        missing = [name for name in tool_names if name not in cache]
+        if missing:
+            raise ValueError(
+                f"Tools {missing} not found in cache. "
+                f"Available tools: {list(cache.keys())}"
+            )
+        
+        return {name: cache[name] for name in tool_names}
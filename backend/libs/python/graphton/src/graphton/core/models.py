@@ -4,12 +4,15 @@ This module provides utilities to parse model name strings into LangChain model
 eliminating boilerplate for model instantiation and providing sensible defaults.
 """
 
-from typing import Any
+from __future__ import annotations
 
-from langchain_anthropic import ChatAnthropic
-from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_ollama import ChatOllama
-from langchain_openai import ChatOpenAI
+import functools
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from langchain_core.language_models.chat_models import BaseChatModel
 
 # Model name mapping for Anthropic models (friendly name -> full model ID)
 ANTHROPIC_MODEL_MAP = {
@@ -26,15 +29,30 @@ OLLAMA_MODEL_MAP = {
     "codellama": "codellama:13b",
 }
 
-# Default parameters for different providers
-ANTHROPIC_DEFAULTS = {
-    "max_tokens": 20000,  # Deep Agents need high token limits for reasoning
+# Model name prefixes that identify Ollama-served models
+OLLAMA_PREFIXES = (
+    "qwen", "llama", "deepseek", "codellama", "mistral",
+    "phi", "gemma", "yi", "solar", "orca", "vicuna",
+)
+
+# Model name prefix -> provider, used to infer the provider of bare model names
+_PREFIX_TO_PROVIDER: dict[str, str] = {
+    "claude": "anthropic",
+    "gpt": "openai",
+    "o1": "openai",
+    **dict.fromkeys(OLLAMA_PREFIXES, "ollama"),
 }
+_PREFIX_LENGTHS = sorted({len(prefix) for prefix in _PREFIX_TO_PROVIDER})
+
+# Default parameters for different providers (read-only; copied per build)
+ANTHROPIC_DEFAULTS: Mapping[str, Any] = MappingProxyType({
+    "max_tokens": 20000,  # Deep Agents need high token limits for reasoning
+})
 
-OLLAMA_DEFAULTS = {
+OLLAMA_DEFAULTS: Mapping[str, Any] = MappingProxyType({
     "base_url": "http://localhost:11434",
     "temperature": 0.0,
-}
+})
 
 
 def _infer_provider(model_name: str) -> str:
@@ -50,22 +68,12 @@ def _infer_provider(model_name: str) -> str:
         ValueError: If provider cannot be inferred from model name
     
     """
-    # Check Anthropic models
-    if model_name.startswith("claude"):
-        return "anthropic"
-    
-    # Check OpenAI models
-    if model_name.startswith("gpt") or model_name.startswith("o1"):
-        return "openai"
-    
-    # Check Ollama models (common prefixes)
-    ollama_prefixes = [
-        "qwen", "llama", "deepseek", "codellama", "mistral",
-        "phi", "gemma", "yi", "solar", "orca", "vicuna",
-    ]
-    for prefix in ollama_prefixes:
-        if model_name.lower().startswith(prefix):
-            return "ollama"
+    # Case-fold once, then probe each known prefix length with a dict lookup
+    folded = model_name.casefold()
+    for length in _PREFIX_LENGTHS:
+        provider = _PREFIX_TO_PROVIDER.get(folded[:length])
+        if provider is not None:
+            return provider
     
     # If no provider can be inferred, raise an error
     raise ValueError(
@@ -75,6 +83,105 @@ def _infer_provider(model_name: str) -> str:
     )
 
 
+def _build_anthropic(
+    model_name: str,
+    max_tokens: int | None,
+    temperature: float | None,
+    model_kwargs: dict[str, Any],
+) -> BaseChatModel:
+    """Build a ChatAnthropic instance with Graphton defaults applied."""
+    from langchain_anthropic import ChatAnthropic
+    
+    # Map friendly name to full model ID
+    full_model_name = ANTHROPIC_MODEL_MAP.get(model_name, model_name)
+    
+    # Build model parameters with defaults
+    model_params: dict[str, Any] = {**ANTHROPIC_DEFAULTS}
+    
+    # Apply user overrides
+    if max_tokens is not None:
+        model_params["max_tokens"] = max_tokens
+    if temperature is not None:
+        model_params["temperature"] = temperature
+    
+    # Merge additional kwargs
+    model_params.update(model_kwargs)
+    
+    return ChatAnthropic(
+        model=full_model_name,  # type: ignore[call-arg]
+        **model_params,
+    )
+
+
+def _build_openai(
+    model_name: str,
+    max_tokens: int | None,
+    temperature: float | None,
+    model_kwargs: dict[str, Any],
+) -> BaseChatModel:
+    """Build a ChatOpenAI instance; OpenAI has no Graphton defaults."""
+    from langchain_openai import ChatOpenAI
+    
+    # OpenAI uses different parameter names and patterns
+    openai_params: dict[str, Any] = {}
+    
+    # Apply user overrides
+    if max_tokens is not None:
+        openai_params["max_tokens"] = max_tokens
+    if temperature is not None:
+        openai_params["temperature"] = temperature
+    
+    # Merge additional kwargs
+    openai_params.update(model_kwargs)
+    
+    return ChatOpenAI(
+        model=model_name,
+        **openai_params,
+    )
+
+
+def _build_ollama(
+    model_name: str,
+    max_tokens: int | None,
+    temperature: float | None,
+    model_kwargs: dict[str, Any],
+) -> BaseChatModel:
+    """Build a ChatOllama instance with Graphton defaults applied."""
+    from langchain_ollama import ChatOllama
+    
+    # Map friendly name to full model ID
+    full_model_name = OLLAMA_MODEL_MAP.get(model_name, model_name)
+    
+    # Build model parameters with defaults
+    ollama_params: dict[str, Any] = {**OLLAMA_DEFAULTS}
+    
+    # Apply user overrides (Ollama uses num_predict instead of max_tokens)
+    if max_tokens is not None:
+        ollama_params["num_predict"] = max_tokens
+    if temperature is not None:
+        ollama_params["temperature"] = temperature
+    
+    # Merge additional kwargs
+    ollama_params.update(model_kwargs)
+    
+    return ChatOllama(
+        model=full_model_name,
+        **ollama_params,
+    )
+
+
+# Provider -> builder. Each builder imports its SDK on first use, so only
+# the provider actually in use is loaded
+_PROVIDER_BUILDERS: dict[
+    str,
+    Callable[[str, int | None, float | None, dict[str, Any]], BaseChatModel],
+] = {
+    "anthropic": _build_anthropic,
+    "openai": _build_openai,
+    "ollama": _build_ollama,
+}
+
+
 def parse_model_string(
     model: str,
     max_tokens: int | None = None,
@@ -111,7 +218,8 @@ def parse_model_string(
         **model_kwargs: Additional model-specific parameters
     
     Returns:
-        LangChain model instance (ChatAnthropic, ChatOpenAI, or ChatOllama)
+        LangChain model instance (ChatAnthropic, ChatOpenAI, or ChatOllama).
+        Calls with identical hashable arguments return the same cached instance.
     
     Raises:
         ValueError: If model string format is invalid or unsupported
@@ -127,7 +235,43 @@ def parse_model_string(
     if not model or not model.strip():
         raise ValueError("Model name cannot be empty")
     
-    model = model.strip()
+    frozen_kwargs = tuple(sorted(model_kwargs.items()))
+    try:
+        hash(frozen_kwargs)
+    except TypeError:
+        # Unhashable kwargs (e.g. client or callback objects) bypass the cache
+        return _build_model.__wrapped__(model.strip(), max_tokens, temperature, frozen_kwargs)
+    
+    return _build_model(model.strip(), max_tokens, temperature, frozen_kwargs)
+
+
+@functools.lru_cache(maxsize=64)
+def _build_model(
+    model: str,
+    max_tokens: int | None,
+    temperature: float | None,
+    frozen_kwargs: tuple[tuple[str, Any], ...],
+) -> BaseChatModel:
+    """Build a model instance from normalized parse_model_string inputs.
+    
+    Cached so agents rebuilt with the same model configuration reuse one
+    client instance instead of reconstructing it (and its HTTP client)
+    on every call.
+    
+    Args:
+        model: Stripped model name string
+        max_tokens: Override default max_tokens for the model
+        temperature: Override default temperature for the model
+        frozen_kwargs: Sorted (key, value) pairs of additional model parameters
+    
+    Returns:
+        LangChain model instance (ChatAnthropic, ChatOpenAI, or ChatOllama)
+    
+    Raises:
+        ValueError: If model string format is invalid or unsupported
+    
+    """
+    model_kwargs = dict(frozen_kwargs)
     
     # Handle provider-prefixed format (e.g., "anthropic:claude-sonnet-4.5", "ollama:qwen2.5-coder:7b")
     if ":" in model:
@@ -135,7 +279,7 @@ def parse_model_string(
         potential_provider = parts[0].lower()
         
         # Check if first part is a known provider
-        if potential_provider in ["anthropic", "openai", "ollama"]:
+        if potential_provider in _PROVIDER_BUILDERS:
             provider = potential_provider
             model_name = parts[1].strip()
         else:
@@ -146,72 +290,11 @@ def parse_model_string(
         model_name = model
         provider = _infer_provider(model_name)
     
-    # Parse Anthropic models
-    if provider == "anthropic":
-        # Map friendly name to full model ID
-        full_model_name = ANTHROPIC_MODEL_MAP.get(model_name, model_name)
-        
-        # Build model parameters with defaults
-        model_params: dict[str, Any] = {**ANTHROPIC_DEFAULTS}
-        
-        # Apply user overrides
-        if max_tokens is not None:
-            model_params["max_tokens"] = max_tokens
-        if temperature is not None:
-            model_params["temperature"] = temperature
-        
-        # Merge additional kwargs
-        model_params.update(model_kwargs)
-        
-        return ChatAnthropic(
-            model=full_model_name,  # type: ignore[call-arg]
-            **model_params,
-        )
-    
-    # Parse OpenAI models
-    elif provider == "openai":
-        # OpenAI uses different parameter names and patterns
-        openai_params: dict[str, Any] = {}
-        
-        # Apply user overrides
-        if max_tokens is not None:
-            openai_params["max_tokens"] = max_tokens
-        if temperature is not None:
-            openai_params["temperature"] = temperature
-        
-        # Merge additional kwargs
-        openai_params.update(model_kwargs)
-        
-        return ChatOpenAI(
-            model=model_name,
-            **openai_params,
-        )
-    
-    # Parse Ollama models
-    elif provider == "ollama":
-        # Map friendly name to full model ID
-        full_model_name = OLLAMA_MODEL_MAP.get(model_name, model_name)
-        
-        # Build model parameters with defaults
-        ollama_params: dict[str, Any] = {**OLLAMA_DEFAULTS}
-        
-        # Apply user overrides (Ollama uses num_predict instead of max_tokens)
-        if max_tokens is not None:
-            ollama_params["num_predict"] = max_tokens
-        if temperature is not None:
-            ollama_params["temperature"] = temperature
-        
-        # Merge additional kwargs
-        ollama_params.update(model_kwargs)
-        
-        return ChatOllama(
-            model=full_model_name,
-            **ollama_params,
-        )
-    
-    else:
+    builder = _PROVIDER_BUILDERS.get(provider)
+    if builder is None:
         raise ValueError(
             f"Unsupported provider '{provider}'. "
             "Supported providers: anthropic, openai, ollama"
         )
-
+    
+    return builder(model_name, max_tokens, temperature, model_kwargs)
@@ -11,11 +11,77 @@ The enhancement philosophy:
 - User instructions come first, capability context added after
 """
 
+import functools
+
+# Capability awareness sections, appended after the user's instructions
+PLANNING_SECTION = (
+    "**Planning System**: For complex or multi-step tasks, you have access to a "
+    "planning system (write_todos, read_todos). Use it to break down work, track "
+    "progress, and manage task complexity. Skip it for simple single-step tasks."
+)
+
+FILE_SYSTEM_SECTION = (
+    "**File System**: You have file system tools (ls, read_file, write_file, "
+    "edit_file, glob, grep) for managing information across your work. Use the "
+    "file system to store large content, offload context, and maintain state "
+    "between operations. All file paths must start with '/'."
+)
+
+MCP_TOOLS_SECTION = (
+    "**MCP Tools**: You have access to MCP (Model Context Protocol) tools "
+    "configured specifically for this agent. These are domain-specific tools "
+    "for specialized operations. Use them to accomplish tasks that require "
+    "external system integration or specialized capabilities."
+)
+
+EXECUTE_TOOL_SECTION = (
+    "**Execute Tool**: You have access to a secure sandbox environment "
+    "where you can run shell commands using the execute tool. Use this for "
+    "running scripts, tests, builds, package installations, and other command-line "
+    "operations. The sandbox is isolated and secure."
+)
+
+
+# Section name -> paragraph, in the order sections are rendered
+CAPABILITY_SECTIONS: dict[str, str] = {
+    "planning": PLANNING_SECTION,
+    "file_system": FILE_SYSTEM_SECTION,
+    "mcp_tools": MCP_TOOLS_SECTION,
+    "execute": EXECUTE_TOOL_SECTION,
+}
+
+# Planning and file system awareness are always included by default
+DEFAULT_SECTIONS = frozenset({"planning", "file_system"})
+
+_CAPABILITY_CONTEXT_TEMPLATE = "\n\n## Your Capabilities\n\n{sections}"
+
+
+@functools.cache
+def _render_capability_context(sections: frozenset[str]) -> str:
+    """Render the capability awareness block for a set of section names.
+    
+    Cached per section set, so each distinct combination is rendered once
+    per process.
+    
+    Args:
+        sections: Names from CAPABILITY_SECTIONS to include
+    
+    Returns:
+        Capability context, starting with its section heading
+
+    """
+    return _CAPABILITY_CONTEXT_TEMPLATE.format_map({
+        "sections": "\n\n".join(
+            text for name, text in CAPABILITY_SECTIONS.items() if name in sections
+        ),
+    })
+
 
 def enhance_user_instructions(
     user_instructions: str,
     has_mcp_tools: bool = False,
     has_sandbox: bool = False,
+    sections: frozenset[str] | None = None,
 ) -> str:
     """Enhance user instructions with awareness of Deep Agents capabilities.
     
@@ -36,11 +102,18 @@ def enhance_user_instructions(
             adds awareness about domain-specific MCP capabilities.
         has_sandbox: Whether the agent has sandbox backend configured. When True,
             adds awareness about execute tool for running shell commands.
+        sections: Explicit set of CAPABILITY_SECTIONS names to render. When
+            given, has_mcp_tools and has_sandbox are ignored. An empty set
+            returns user_instructions unchanged.
     
     Returns:
         Enhanced instructions combining user content with capability awareness.
         Structure: [User Instructions] + [Capability Context]
     
+    Raises:
+        ValueError: If user_instructions is empty or sections names an
+            unknown section
+    
     Examples:
         Basic enhancement without MCP tools:
         
@@ -68,47 +141,23 @@ def enhance_user_instructions(
     if not user_instructions or not user_instructions.strip():
         raise ValueError("user_instructions cannot be empty")
     
-    # Build capability awareness section
-    capability_sections = []
-    
-    # Always include planning system awareness
-    capability_sections.append(
-        "**Planning System**: For complex or multi-step tasks, you have access to a "
-        "planning system (write_todos, read_todos). Use it to break down work, track "
-        "progress, and manage task complexity. Skip it for simple single-step tasks."
-    )
-    
-    # Always include file system awareness
-    capability_sections.append(
-        "**File System**: You have file system tools (ls, read_file, write_file, "
-        "edit_file, glob, grep) for managing information across your work. Use the "
-        "file system to store large content, offload context, and maintain state "
-        "between operations. All file paths must start with '/'."
-    )
-    
-    # Conditionally include MCP tools awareness
-    if has_mcp_tools:
-        capability_sections.append(
-            "**MCP Tools**: You have access to MCP (Model Context Protocol) tools "
-            "configured specifically for this agent. These are domain-specific tools "
-            "for specialized operations. Use them to accomplish tasks that require "
-            "external system integration or specialized capabilities."
-        )
-    
-    # Conditionally include execute tool awareness
-    if has_sandbox:
-        capability_sections.append(
-            "**Execute Tool**: You have access to a secure sandbox environment "
-            "where you can run shell commands using the execute tool. Use this for "
-            "running scripts, tests, builds, package installations, and other command-line "
-            "operations. The sandbox is isolated and secure."
-        )
+    if sections is None:
+        sections = DEFAULT_SECTIONS
+        if has_mcp_tools:
+            sections |= {"mcp_tools"}
+        if has_sandbox:
+            sections |= {"execute"}
+    else:
+        unknown = sections - CAPABILITY_SECTIONS.keys()
+        if unknown:
+            raise ValueError(
+                f"Unknown capability sections: {sorted(unknown)}. "
+                f"Supported sections: {', '.join(CAPABILITY_SECTIONS)}"
+            )
+        if not sections:
+            return user_instructions
     
     # Combine user instructions with capability awareness
-    capability_context = "\n\n## Your Capabilities\n\n" + "\n\n".join(capability_sections)
+    capability_context = _render_capability_context(frozenset(sections))
     
     return user_instructions + "\n" + capability_context
-
-
-
-
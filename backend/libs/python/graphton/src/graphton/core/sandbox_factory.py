@@ -7,9 +7,36 @@ MCP server/tool configuration in Graphton.
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
-from deepagents.backends.protocol import BackendProtocol  # type: ignore[import-untyped]
+if TYPE_CHECKING:
+    from deepagents.backends.protocol import BackendProtocol  # type: ignore[import-untyped]
+
+
+def _build_filesystem_backend(config: dict[str, Any]) -> BackendProtocol:
+    """Build the local enhanced FilesystemBackend with execute() support."""
+    from graphton.core.backends import FilesystemBackend
+    
+    root_dir = config.get("root_dir", ".")
+    return FilesystemBackend(root_dir=root_dir)
+
+
+def _build_daytona_backend(config: dict[str, Any]) -> BackendProtocol:
+    """Delegate to the specialized Daytona backend module."""
+    from graphton.core.backends.daytona import create_daytona_backend
+    
+    return create_daytona_backend(config)
+
+
+# Backend type -> builder; each builder imports its backend module on demand
+_BACKEND_BUILDERS: dict[str, Callable[[dict[str, Any]], BackendProtocol]] = {
+    "filesystem": _build_filesystem_backend,
+    "daytona": _build_daytona_backend,
+}
+
+# Recognized backend types that are not implemented yet
+_COMING_SOON_TYPES = frozenset({"modal", "runloop", "harbor"})
 
 
 def create_sandbox_backend(config: dict[str, Any]) -> BackendProtocol:
@@ -88,40 +115,17 @@ def create_sandbox_backend(config: dict[str, Any]) -> BackendProtocol:
             "Supported types: filesystem, modal, runloop, daytona, harbor"
         )
     
-    if backend_type == "filesystem":
-        # Use local enhanced FilesystemBackend with execute() support
-        from graphton.core.backends import FilesystemBackend
-        
-        root_dir = config.get("root_dir", ".")
-        return FilesystemBackend(root_dir=root_dir)
-    
-    elif backend_type == "daytona":
-        # Delegate to specialized Daytona backend module
-        from graphton.core.backends.daytona import create_daytona_backend
-        
-        return create_daytona_backend(config)
+    builder = _BACKEND_BUILDERS.get(backend_type)
+    if builder is not None:
+        return builder(config)
     
-    elif backend_type == "modal":
+    if backend_type in _COMING_SOON_TYPES:
         raise ValueError(
-            "Modal sandbox support coming soon. "
+            f"{backend_type.capitalize()} sandbox support coming soon. "
             "For now, use 'filesystem' type for local execution."
         )
     
-    elif backend_type == "runloop":
-        raise ValueError(
-            "Runloop sandbox support coming soon. "
-            "For now, use 'filesystem' type for local execution."
-        )
-    
-    elif backend_type == "harbor":
-        raise ValueError(
-            "Harbor sandbox support coming soon. "
-            "For now, use 'filesystem' type for local execution."
-        )
-    
-    else:
-        raise ValueError(
-            f"Unsupported sandbox type: {backend_type}. "
-            f"Supported types: filesystem, modal, runloop, daytona, harbor"
-        )
-
+    raise ValueError(
+        f"Unsupported sandbox type: {backend_type}. "
+        f"Supported types: filesystem, modal, runloop, daytona, harbor"
+    )
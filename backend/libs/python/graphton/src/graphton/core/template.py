@@ -23,16 +23,45 @@ Example:
 """
 
 import re
+import sys
+from collections.abc import Iterator
 from typing import Any
 
-# Regex pattern to match {{VAR_NAME}} with optional whitespace
-TEMPLATE_PATTERN = re.compile(r"\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}")
+# Regex pattern to match {{VAR_NAME}} with optional whitespace. Variable names
+# are ASCII-only already; re.ASCII keeps \s on the ASCII table as well
+TEMPLATE_PATTERN = re.compile(r"\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}", re.ASCII)
+
+
+def _iter_strings(config: Any) -> Iterator[str]:  # noqa: ANN401
+    """Yield every string leaf of a config structure in document order.
+    
+    Uses an explicit work stack rather than recursion, so deeply nested
+    configs cost no Python frames and cannot hit the recursion limit.
+    
+    Args:
+        config: Configuration dict, list, string, or other value
+        
+    Yields:
+        String values found in the structure
+
+    """
+    stack = [config]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            yield node
+        elif isinstance(node, dict):
+            # Reversed so children pop off the stack in their original order
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+        # For other types (int, bool, None, etc.), no templates possible
 
 
 def extract_template_vars(config: Any) -> set[str]:  # noqa: ANN401
     """Extract all template variable names from a configuration.
     
-    Recursively traverses the config structure (dicts, lists, strings) and
+    Traverses the config structure (dicts, lists, strings) and
     extracts all template variable names matching the pattern {{VAR_NAME}}.
     
     Args:
@@ -55,22 +84,14 @@ def extract_template_vars(config: Any) -> set[str]:  # noqa: ANN401
     """
     variables: set[str] = set()
     
-    if isinstance(config, dict):
-        # Recursively process all dict values
-        for value in config.values():
-            variables.update(extract_template_vars(value))
-    
-    elif isinstance(config, list):
-        # Recursively process all list items
-        for item in config:
-            variables.update(extract_template_vars(item))
-    
-    elif isinstance(config, str):
-        # Extract variable names from template placeholders
-        matches = TEMPLATE_PATTERN.findall(config)
-        variables.update(matches)
-    
-    # For other types (int, bool, None, etc.), no templates possible
+    for value in _iter_strings(config):
+        # Most leaves (URLs, flags, names) hold no placeholder at all
+        if "{{" not in value:
+            continue
+        
+        # Extract variable names from template placeholders, interned since
+        # the same few names recur across configs
+        variables.update(map(sys.intern, TEMPLATE_PATTERN.findall(value)))
     
     return variables
 
@@ -91,7 +112,11 @@ def has_templates(config: Any) -> bool:  # noqa: ANN401
         True
 
     """
-    return bool(extract_template_vars(config))
+    # Stop at the first placeholder instead of collecting all of them
+    return any(
+        TEMPLATE_PATTERN.search(value) is not None
+        for value in _iter_strings(config)
+    )
 
 
 def substitute_templates(config: Any, values: dict[str, str]) -> Any:  # noqa: ANN401
@@ -105,7 +130,9 @@ def substitute_templates(config: Any, values: dict[str, str]) -> Any:  # noqa: A
         values: Dictionary mapping variable names to their values
         
     Returns:
-        New config structure with all templates substituted
+        Config structure with all templates substituted. Only the dicts and
+        lists on the path to a templated string are copied; untemplated
+        subtrees are shared with the input config.
         
     Raises:
         ValueError: If required variables are missing from values dict
@@ -123,23 +150,123 @@ def substitute_templates(config: Any, values: dict[str, str]) -> Any:  # noqa: A
         'Bearer abc123'
 
     """
-    # Check for missing variables upfront
-    required_vars = extract_template_vars(config)
-    provided_vars = set(values.keys())
-    missing_vars = required_vars - provided_vars
+    # Templateless configs (static tool definitions) come back untouched
+    if not has_templates(config):
+        return config
+    
+    # Substitute and collect missing variables in a single pass
+    missing_vars: set[str] = set()
+    result = _substitute_recursive(config, values, missing_vars)
     
     if missing_vars:
-        raise ValueError(
-            f"Missing required template variables: {sorted(missing_vars)}. "
-            f"Provide these variables in config['configurable']: "
-            f"{', '.join(sorted(missing_vars))}"
-        )
+        raise _missing_vars_error(missing_vars)
     
-    # Perform substitution
-    return _substitute_recursive(config, values)
+    return result
 
 
-def _substitute_recursive(config: Any, values: dict[str, str]) -> Any:  # noqa: ANN401
+def substitute_templates_batch(
+    configs: list[Any],
+    values: dict[str, str],
+) -> list[Any]:
+    """Substitute template variables in several configs sharing one values dict.
+    
+    Equivalent to calling substitute_templates on each config, but missing
+    variables are collected across the whole batch and reported in a single
+    error instead of failing on the first config.
+    
+    Args:
+        configs: Configuration values to process
+        values: Dictionary mapping variable names to their values
+        
+    Returns:
+        List of substituted configs, in the same order as the input
+        
+    Raises:
+        ValueError: If required variables are missing from values dict
+        
+    Example:
+        >>> configs = [
+        ...     {"headers": {"Authorization": "Bearer {{TOKEN}}"}},
+        ...     {"url": "https://api.example.com"},
+        ... ]
+        >>> results = substitute_templates_batch(configs, {"TOKEN": "abc123"})
+        >>> results[0]["headers"]["Authorization"]
+        'Bearer abc123'
+
+    """
+    missing_vars: set[str] = set()
+    results = [
+        _substitute_recursive(config, values, missing_vars)
+        for config in configs
+    ]
+    
+    if missing_vars:
+        raise _missing_vars_error(missing_vars)
+    
+    return results
+
+
+def _missing_vars_error(missing_vars: set[str]) -> ValueError:
+    """Build the error raised when template variables have no value."""
+    return ValueError(
+        f"Missing required template variables: {sorted(missing_vars)}. "
+        f"Provide these variables in config['configurable']: "
+        f"{', '.join(sorted(missing_vars))}"
+    )
+
+
+def _substitute_string(
+    config: str,
+    values: dict[str, str],
+    missing: set[str],
+) -> str:
+    """Substitute template variables in a single string.
+    
+    Walks the matches with finditer and joins the pieces once, rather than
+    calling back into Python from TEMPLATE_PATTERN.sub for every match.
+    Placeholders without a value are left verbatim and their names recorded
+    in `missing`.
+    
+    Args:
+        config: String to process
+        values: Dictionary mapping variable names to their values
+        missing: Accumulator for variable names not present in values
+        
+    Returns:
+        String with templates substituted
+
+    """
+    parts: list[str] = []
+    pos = 0
+    for match in TEMPLATE_PATTERN.finditer(config):
+        start, end = match.span()
+        var_name = sys.intern(match.group(1))
+        if var_name in values:
+            value = values[var_name]
+        else:
+            missing.add(var_name)
+            value = match.group(0)
+        
+        # Whole string is one placeholder - no pieces to join
+        if start == 0 and end == len(config):
+            return value
+        
+        parts.append(config[pos:start])
+        parts.append(value)
+        pos = end
+    
+    if not parts:
+        return config
+    
+    parts.append(config[pos:])
+    return "".join(parts)
+
+
+def _substitute_recursive(
+    config: Any,  # noqa: ANN401
+    values: dict[str, str],
+    missing: set[str],
+) -> Any:  # noqa: ANN401
     """Recursively substitute templates in config structure.
     
     Internal helper function that performs the actual substitution.
@@ -147,33 +274,42 @@ def _substitute_recursive(config: Any, values: dict[str, str]) -> Any:  # noqa:
     Args:
         config: Configuration value to process
         values: Dictionary mapping variable names to their values
+        missing: Accumulator for variable names not present in values
         
     Returns:
-        New config value with templates substituted
+        Config value with templates substituted. Containers with no templated
+        descendants are returned unchanged rather than copied.
 
     """
     if isinstance(config, dict):
-        # Create new dict with substituted values
-        return {
-            key: _substitute_recursive(value, values)
-            for key, value in config.items()
-        }
+        # Copy the dict only once a value actually changes
+        new_dict: dict[Any, Any] | None = None
+        for key, value in config.items():
+            new_value = _substitute_recursive(value, values, missing)
+            if new_value is not value:
+                if new_dict is None:
+                    new_dict = dict(config)
+                new_dict[key] = new_value
+        return config if new_dict is None else new_dict
     
     elif isinstance(config, list):
-        # Create new list with substituted items
-        return [
-            _substitute_recursive(item, values)
-            for item in config
-        ]
+        # Copy the list only once an item actually changes
+        new_list: list[Any] | None = None
+        for index, item in enumerate(config):
+            new_item = _substitute_recursive(item, values, missing)
+            if new_item is not item:
+                if new_list is None:
+                    new_list = list(config)
+                new_list[index] = new_item
+        return config if new_list is None else new_list
     
     elif isinstance(config, str):
-        # Substitute all template variables in string
-        def replacer(match: re.Match[str]) -> str:
-            var_name = match.group(1)
-            # Values dict should contain the variable (validated upfront)
-            return values.get(var_name, match.group(0))
+        # Skip the regex entirely for plain strings
+        if "{{" not in config:
+            return config
         
-        return TEMPLATE_PATTERN.sub(replacer, config)
+        # Substitute all template variables in string
+        return _substitute_string(config, values, missing)
     
     else:
         # For other types (int, bool, None, etc.), return as-is
@@ -201,23 +337,17 @@ def validate_template_syntax(config: Any) -> list[str]:  # noqa: ANN401
     errors: list[str] = []
     
     # Check for potential malformed templates
-    if isinstance(config, str):
-        # Look for single braces that might be typos
-        if '{' in config and not TEMPLATE_PATTERN.search(config):
-            if config.count('{') != config.count('}'):
+    for value in _iter_strings(config):
+        # Look for single braces that might be typos. Count first: the
+        # regex only needs to run for the rare string with unbalanced braces
+        open_count = value.count('{')
+        if open_count and open_count != value.count('}'):
+            if not TEMPLATE_PATTERN.search(value):
                 errors.append(
-                    f"Malformed template in '{config}': "
+                    f"Malformed template in '{value}': "
                     "unbalanced braces. Use {{{{VAR_NAME}}}} syntax."
                 )
     
-    elif isinstance(config, dict):
-        for key, value in config.items():
-            errors.extend(validate_template_syntax(value))
-    
-    elif isinstance(config, list):
-        for item in config:
-            errors.extend(validate_template_syntax(item))
-    
     return errors
 
 
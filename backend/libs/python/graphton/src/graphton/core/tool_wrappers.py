@@ -1,7 +1,7 @@
 """Tool wrapper generator for MCP tools.
 
-This module dynamically creates @tool decorated wrapper functions for MCP tools.
-The wrappers delegate to actual MCP tools loaded by the middleware, eliminating
+This module creates wrapper tools (MCPToolProxy instances) for MCP tools. The
+wrappers delegate to actual MCP tools loaded by the middleware, eliminating
 the need for manual wrapper code in each agent.
 
 For dynamic MCP configurations (with template variables), this module provides
@@ -13,19 +13,114 @@ import logging
 from collections.abc import Callable
 from typing import Any
 
-from langchain_core.tools import tool
+from langchain_core.tools import BaseTool, tool
 
 logger = logging.getLogger(__name__)
 
+# Keys LangChain may wrap the real tool arguments in (double-nesting)
+_NESTING_KEYS = frozenset(("input", "kwargs"))
+
+
+def _log_tool_schema(mcp_tool: Any) -> None:  # noqa: ANN401
+    """Log the MCP tool's expected schema (once per resolved tool)."""
+    if hasattr(mcp_tool, 'args_schema'):
+        logger.debug("Tool args_schema: %s", mcp_tool.args_schema)
+    if hasattr(mcp_tool, 'name'):
+        logger.debug("Tool name from object: %s", mcp_tool.name)
+
+
+class MCPToolProxy(BaseTool):
+    """LangChain tool that delegates invocations to a loaded MCP tool.
+    
+    A single class backs every eager MCP tool wrapper; instances differ only
+    in their name, description, args_schema and the MCP tool they forward
+    to. This avoids running the @tool decorator (and building a fresh
+    closure and input schema) for each wrapped tool.
+    
+    Attributes:
+        mcp_tool: MCP tool resolved from the middleware cache
+    
+    """
+    
+    mcp_tool: Any
+    
+    def _run(self, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        raise NotImplementedError("MCP tools only support async invocation.")
+    
+    async def _arun(self, **kwargs: Any) -> Any:  # noqa: ANN401
+        """Invoke the MCP tool with the provided arguments."""
+        tool_name = self.name
+        actual_tool = self.mcp_tool
+        logger.debug("Invoking MCP tool '%s'", tool_name)
+        
+        # Invoke the MCP tool resolved (and validated) at wrapper creation
+        try:
+            # Diagnostic logging of the exact argument structure. Gated so the
+            # formatting cost is only paid when DEBUG is enabled
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            if debug_enabled:
+                logger.debug("=== MCP Tool Invocation Diagnostics for '%s' ===", tool_name)
+                logger.debug("kwargs keys: %s", list(kwargs))
+                logger.debug("kwargs value: %r", kwargs)
+            
+            # Check for double-nesting and unwrap if needed (FIX for argument marshalling)
+            # (**kwargs is always a dict, so only a single-key call can be nested)
+            actual_args = kwargs
+            if len(kwargs) == 1:
+                ((key, inner),) = kwargs.items()
+                if key in _NESTING_KEYS:
+                    logger.warning("⚠️  Double-nesting detected: unwrapping '%s' key", key)
+                    actual_args = inner
+            
+            if debug_enabled:
+                logger.debug("Calling mcp_tool.ainvoke() with (after unwrapping): %r", actual_args)
+            result = await actual_tool.ainvoke(actual_args)
+            if debug_enabled:
+                logger.debug("✅ MCP tool '%s' returned successfully", tool_name)
+                logger.debug("Result type: %s", type(result).__name__)
+                logger.debug("=== End Diagnostics for '%s' ===", tool_name)
+            return result
+        except Exception as e:
+            logger.error(
+                f"MCP tool '{tool_name}' invocation failed: {e}",
+                exc_info=True
+            )
+            raise RuntimeError(
+                f"MCP tool '{tool_name}' invocation failed: {e}"
+            ) from e
+
+
+def _build_proxy(tool_name: str, actual_tool: Any) -> MCPToolProxy:  # noqa: ANN401
+    """Build the wrapper tool for an already-resolved MCP tool."""
+    # Copy metadata from the original tool for LangChain integration. The
+    # args_schema object is shared by reference; copying it would re-derive
+    # the Pydantic model for every wrapper
+    wrapper = MCPToolProxy(
+        name=tool_name,
+        description=actual_tool.description,
+        args_schema=getattr(actual_tool, 'args_schema', None),
+        mcp_tool=actual_tool,
+    )
+    
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Created wrapper for MCP tool '%s' with description: %.100s...",
+            tool_name,
+            actual_tool.description or "None",
+        )
+        _log_tool_schema(actual_tool)
+    
+    return wrapper
+
 
 def create_tool_wrapper(
     tool_name: str,
     middleware_instance: Any,  # noqa: ANN401
-) -> Callable[..., Any]:
-    """Create a wrapper function for an MCP tool.
+) -> MCPToolProxy:
+    """Create a wrapper tool for an MCP tool.
     
     The generated wrapper:
-    1. Gets the actual MCP tool from middleware cache
+    1. Uses the MCP tool fetched from the middleware cache at creation time
     2. Invokes the tool with provided arguments
     3. Returns the tool result
     
@@ -36,10 +131,10 @@ def create_tool_wrapper(
         middleware_instance: McpToolsLoader instance with cached tools
         
     Returns:
-        A @tool decorated function that delegates to the MCP tool
+        An MCPToolProxy that delegates to the MCP tool
         
     Raises:
-        RuntimeError: If tool metadata cannot be copied from original
+        RuntimeError: If the tool is not available in the middleware cache
         
     Example:
         >>> from graphton.core.middleware import McpToolsLoader
@@ -47,7 +142,7 @@ def create_tool_wrapper(
         >>> 
         >>> # Assume middleware is initialized and tools are loaded
         >>> wrapper = create_tool_wrapper("list_organizations", middleware)
-        >>> result = wrapper()  # Invokes actual MCP tool
+        >>> result = await wrapper.ainvoke({})  # Invokes actual MCP tool
 
     """
     # Pre-validate that tool exists in middleware cache
@@ -60,91 +155,7 @@ def create_tool_wrapper(
             f"Cannot create wrapper for tool '{tool_name}': {e}"
         ) from e
     
-    # Create the wrapper function
-    @tool
-    async def wrapper(**kwargs: Any) -> Any:  # noqa: ANN401
-        """Auto-generated wrapper for MCP tool.
-        
-        This wrapper:
-        - Gets the actual MCP tool from middleware
-        - Invokes the tool with arguments
-        - Returns the result
-        """
-        logger.debug(f"Invoking MCP tool '{tool_name}'")
-        
-        # Get actual MCP tool from middleware cache
-        try:
-            mcp_tool = middleware_instance.get_tool(tool_name)
-        except (RuntimeError, ValueError) as e:
-            logger.error(f"Failed to get tool '{tool_name}' from cache: {e}")
-            raise RuntimeError(
-                f"Tool '{tool_name}' not available. "
-                "Ensure middleware loaded tools successfully."
-            ) from e
-        
-        # Invoke the actual MCP tool with provided arguments
-        try:
-            # Phase 1 Diagnostic Logging: Capture exact argument structure
-            logger.info(f"=== MCP Tool Invocation Diagnostics for '{tool_name}' ===")
-            logger.info(f"kwargs type: {type(kwargs)}")
-            logger.info(f"kwargs value: {kwargs}")
-            logger.info(f"kwargs keys: {list(kwargs.keys()) if isinstance(kwargs, dict) else 'N/A - not a dict'}")
-            
-            # Inspect the MCP tool's expected schema
-            if hasattr(mcp_tool, 'args_schema'):
-                logger.info(f"Tool args_schema: {mcp_tool.args_schema}")
-            if hasattr(mcp_tool, 'name'):
-                logger.info(f"Tool name from object: {mcp_tool.name}")
-            
-            # Check for double-nesting and unwrap if needed (FIX for argument marshalling)
-            actual_args = kwargs
-            if isinstance(kwargs, dict):
-                if len(kwargs) == 1 and 'input' in kwargs:
-                    logger.warning("⚠️  Double-nesting detected: unwrapping 'input' key")
-                    logger.info(f"Value inside 'input': {kwargs.get('input')}")
-                    actual_args = kwargs['input']
-                elif len(kwargs) == 1 and 'kwargs' in kwargs:
-                    logger.warning("⚠️  Double-nesting detected: unwrapping 'kwargs' key")
-                    logger.info(f"Value inside 'kwargs': {kwargs.get('kwargs')}")
-                    actual_args = kwargs['kwargs']
-            
-            logger.info(f"Calling mcp_tool.ainvoke() with (after unwrapping): {actual_args}")
-            result = await mcp_tool.ainvoke(actual_args)
-            logger.info(f"✅ MCP tool '{tool_name}' returned successfully")
-            logger.info(f"Result type: {type(result)}")
-            logger.info(f"=== End Diagnostics for '{tool_name}' ===")
-            return result
-        except Exception as e:
-            logger.error(
-                f"MCP tool '{tool_name}' invocation failed: {e}",
-                exc_info=True
-            )
-            raise RuntimeError(
-                f"MCP tool '{tool_name}' invocation failed: {e}"
-            ) from e
-    
-    # Copy metadata from original tool for better LangChain integration
-    try:
-        # Set the tool name
-        wrapper.name = tool_name  # type: ignore[attr-defined]
-        wrapper.description = actual_tool.description  # type: ignore[attr-defined]
-        
-        # If the tool has additional metadata, preserve it
-        if hasattr(actual_tool, 'args_schema'):
-            wrapper.args_schema = actual_tool.args_schema  # type: ignore[attr-defined]
-        
-        logger.debug(
-            f"Created wrapper for MCP tool '{tool_name}' with "
-            f"description: {actual_tool.description[:100] if actual_tool.description else 'None'}..."
-        )
-        
-    except Exception as e:
-        logger.warning(
-            f"Failed to copy metadata from tool '{tool_name}': {e}. "
-            "Wrapper will work but may have incomplete metadata."
-        )
-    
-    return wrapper  # type: ignore[return-value]
+    return _build_proxy(tool_name, actual_tool)
 
 
 def create_lazy_tool_wrapper(
@@ -160,9 +171,13 @@ def create_lazy_tool_wrapper(
     
     The generated wrapper:
     1. On first invocation: Gets the actual tool from middleware (now loaded)
+       and caches it for subsequent calls
     2. Invokes the tool with provided arguments
     3. Returns the tool result
     
+    The cached tool can be dropped with `wrapper._invalidate()`, e.g. after
+    the middleware reloads its tools.
+    
     Args:
         tool_name: Name of the MCP tool to wrap
         middleware_instance: McpToolsLoader instance (tools loaded at runtime)
@@ -184,6 +199,13 @@ def create_lazy_tool_wrapper(
         >>> result = wrapper()
     
     """
+    # Resolved MCP tool, filled on the first successful invocation
+    resolved_tool: list[Any] = [None]
+    
+    def invalidate() -> None:
+        """Drop the cached tool so the next invocation resolves it again."""
+        resolved_tool[0] = None
+    
     # Create the lazy wrapper function
     # Note: We do NOT access middleware_instance.get_tool() here
     # That would fail in dynamic mode since tools aren't loaded yet
@@ -196,53 +218,53 @@ def create_lazy_tool_wrapper(
         - Invokes the tool with arguments
         - Returns the result
         """
-        logger.debug(f"Invoking MCP tool '{tool_name}' (lazy mode)")
+        logger.debug("Invoking MCP tool '%s' (lazy mode)", tool_name)
         
-        # NOW get the actual MCP tool from middleware cache
+        # On first invocation, get the actual MCP tool from middleware cache
         # At this point, middleware.before_agent() has run and loaded tools
-        try:
-            mcp_tool = middleware_instance.get_tool(tool_name)
-        except (RuntimeError, ValueError) as e:
-            logger.error(
-                f"Failed to get tool '{tool_name}' from cache in lazy mode: {e}. "
-                f"This likely means middleware.before_agent() hasn't been called yet."
-            )
-            raise RuntimeError(
-                f"Tool '{tool_name}' not available. "
-                "Ensure middleware loaded tools successfully before invoking."
-            ) from e
+        mcp_tool = resolved_tool[0]
+        if mcp_tool is None:
+            try:
+                mcp_tool = middleware_instance.get_tool(tool_name)
+            except (RuntimeError, ValueError) as e:
+                logger.error(
+                    f"Failed to get tool '{tool_name}' from cache in lazy mode: {e}. "
+                    f"This likely means middleware.before_agent() hasn't been called yet."
+                )
+                raise RuntimeError(
+                    f"Tool '{tool_name}' not available. "
+                    "Ensure middleware loaded tools successfully before invoking."
+                ) from e
+            resolved_tool[0] = mcp_tool
+            if logger.isEnabledFor(logging.DEBUG):
+                _log_tool_schema(mcp_tool)
         
         # Invoke the actual MCP tool with provided arguments
         try:
-            # Phase 1 Diagnostic Logging: Capture exact argument structure (lazy mode)
-            logger.info(f"=== MCP Tool Invocation Diagnostics for '{tool_name}' (LAZY MODE) ===")
-            logger.info(f"kwargs type: {type(kwargs)}")
-            logger.info(f"kwargs value: {kwargs}")
-            logger.info(f"kwargs keys: {list(kwargs.keys()) if isinstance(kwargs, dict) else 'N/A - not a dict'}")
-            
-            # Inspect the MCP tool's expected schema
-            if hasattr(mcp_tool, 'args_schema'):
-                logger.info(f"Tool args_schema: {mcp_tool.args_schema}")
-            if hasattr(mcp_tool, 'name'):
-                logger.info(f"Tool name from object: {mcp_tool.name}")
+            # Diagnostic logging of the exact argument structure. Gated so the
+            # formatting cost is only paid when DEBUG is enabled
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            if debug_enabled:
+                logger.debug("=== MCP Tool Invocation Diagnostics for '%s' (LAZY MODE) ===", tool_name)
+                logger.debug("kwargs keys: %s", list(kwargs))
+                logger.debug("kwargs value: %r", kwargs)
             
             # Check for double-nesting and unwrap if needed (FIX for argument marshalling)
+            # (**kwargs is always a dict, so only a single-key call can be nested)
             actual_args = kwargs
-            if isinstance(kwargs, dict):
-                if len(kwargs) == 1 and 'input' in kwargs:
-                    logger.warning("⚠️  Double-nesting detected: unwrapping 'input' key")
-                    logger.info(f"Value inside 'input': {kwargs.get('input')}")
-                    actual_args = kwargs['input']
-                elif len(kwargs) == 1 and 'kwargs' in kwargs:
-                    logger.warning("⚠️  Double-nesting detected: unwrapping 'kwargs' key")
-                    logger.info(f"Value inside 'kwargs': {kwargs.get('kwargs')}")
-                    actual_args = kwargs['kwargs']
+            if len(kwargs) == 1:
+                ((key, inner),) = kwargs.items()
+                if key in _NESTING_KEYS:
+                    logger.warning("⚠️  Double-nesting detected: unwrapping '%s' key", key)
+                    actual_args = inner
             
-            logger.info(f"Calling mcp_tool.ainvoke() with (after unwrapping): {actual_args}")
+            if debug_enabled:
+                logger.debug("Calling mcp_tool.ainvoke() with (after unwrapping): %r", actual_args)
             result = await mcp_tool.ainvoke(actual_args)
-            logger.info(f"✅ MCP tool '{tool_name}' returned successfully (lazy mode)")
-            logger.info(f"Result type: {type(result)}")
-            logger.info(f"=== End Diagnostics for '{tool_name}' (LAZY MODE) ===")
+            if debug_enabled:
+                logger.debug("✅ MCP tool '%s' returned successfully (lazy mode)", tool_name)
+                logger.debug("Result type: %s", type(result).__name__)
+                logger.debug("=== End Diagnostics for '%s' (LAZY MODE) ===", tool_name)
             return result
         except Exception as e:
             logger.error(
@@ -261,6 +283,9 @@ def create_lazy_tool_wrapper(
             f"MCP tool '{tool_name}' (loaded dynamically at invocation)"
         )
         
+        # Lets the middleware force re-resolution if it ever reloads tools
+        lazy_wrapper._invalidate = invalidate  # type: ignore[attr-defined]
+        
         logger.debug(
             f"Created lazy wrapper for MCP tool '{tool_name}' (dynamic mode). "
             "Tool will be resolved on first invocation."
@@ -279,8 +304,8 @@ def create_tool_wrappers_for_server(
     server_name: str,
     tool_names: list[str],
     middleware_instance: Any,  # noqa: ANN401
-) -> list[Callable[..., Any]]:
-    """Create wrapper functions for all tools from an MCP server.
+) -> list[MCPToolProxy]:
+    """Create wrapper tools for all tools from an MCP server.
     
     Convenience function to create multiple wrappers at once.
     
@@ -290,7 +315,7 @@ def create_tool_wrappers_for_server(
         middleware_instance: McpToolsLoader instance with cached tools
         
     Returns:
-        List of wrapper functions
+        List of wrapper tools
         
     Raises:
         RuntimeError: If any wrapper fails to be created
@@ -305,19 +330,21 @@ def create_tool_wrappers_for_server(
         2
 
     """
-    wrappers = []
+    # Resolve every tool with one cache pass, reporting all missing names
+    try:
+        actual_tools = middleware_instance.get_tools_bulk(tool_names)
+    except (RuntimeError, ValueError) as e:
+        logger.error(
+            f"Failed to create wrappers for server '{server_name}': {e}"
+        )
+        raise RuntimeError(
+            f"Failed to create tool wrappers for server '{server_name}': {e}"
+        ) from e
     
-    for tool_name in tool_names:
-        try:
-            wrapper = create_tool_wrapper(tool_name, middleware_instance)
-            wrappers.append(wrapper)
-        except Exception as e:
-            logger.error(
-                f"Failed to create wrapper for '{tool_name}' from server '{server_name}': {e}"
-            )
-            raise RuntimeError(
-                f"Failed to create tool wrappers for server '{server_name}': {e}"
-            ) from e
+    wrappers = [
+        _build_proxy(tool_name, actual_tool)
+        for tool_name, actual_tool in actual_tools.items()
+    ]
     
     logger.info(
         f"Created {len(wrappers)} tool wrapper(s) for server '{server_name}': "
@@ -0,0 +1,31 @@
+"""Unit tests for capability-aware instruction enhancement."""
+
+import pytest
+
+from graphton.core.prompt_enhancement import enhance_user_instructions
+
+INSTRUCTIONS = "You are a helpful research assistant."
+
+
+class TestEnhanceUserInstructionsSections:
+    """Tests for the explicit sections argument."""
+
+    def test_selected_sections_are_rendered(self) -> None:
+        """Test that only the named sections follow the capabilities heading."""
+        enhanced = enhance_user_instructions(INSTRUCTIONS, sections=frozenset({"execute"}))
+
+        assert enhanced.startswith(INSTRUCTIONS)
+        assert "## Your Capabilities" in enhanced
+        assert "**Execute Tool**" in enhanced
+        assert "**Planning System**" not in enhanced
+
+    def test_empty_sections_return_instructions_unchanged(self) -> None:
+        """Test that an empty set adds no capability context or bare heading."""
+        enhanced = enhance_user_instructions(INSTRUCTIONS, sections=frozenset())
+
+        assert enhanced == INSTRUCTIONS
+
+    def test_unknown_section_raises(self) -> None:
+        """Test that an unknown section name is rejected."""
+        with pytest.raises(ValueError, match="Unknown capability sections"):
+            enhance_user_instructions(INSTRUCTIONS, sections=frozenset({"bogus"}))
@@ -0,0 +1,178 @@
+"""On-disk cache for content-addressed skill artifacts."""
+
+import hashlib
+import logging
+import os
+import re
+import stat
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Storage keys end in the SHA-256 of the artifact ZIP (skills/<hash>.zip)
+_KEY_DIGEST = re.compile(r"([0-9a-f]{64})\.zip$")
+
+# Temp files older than this are left over from a crashed write
+_STALE_TMP_SECONDS = 3600
+
+
+class ArtifactDiskCache:
+    """
+    Size-bounded disk cache of artifact bytes keyed by storage key.
+
+    Storage keys are content-addressed (skills/<sha256 of the ZIP>.zip),
+    so entries never go stale and only need evicting for space. Files are
+    named by the SHA-256 of the key, which keeps untrusted keys from
+    escaping the cache directory. Writes are atomic (temp file + rename),
+    and eviction removes least recently used files first, using mtime,
+    which reads refresh.
+
+    Cached ZIPs are extracted and their scripts made executable, so the
+    cache trusts nothing on disk: reads are checked against the digest in
+    the storage key, and the directory must be private to the current
+    user. Keys without a digest are never cached.
+
+    Methods do blocking file I/O; call them via asyncio.to_thread().
+    """
+
+    def __init__(self, root: str, max_bytes: int):
+        """
+        Initialize the cache.
+
+        Args:
+            root: Directory to store artifacts in (created if missing)
+            max_bytes: Total size the cache is trimmed to after each write
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._root_ready = False
+
+    def _path(self, storage_key: str) -> Path:
+        digest = hashlib.sha256(storage_key.encode()).hexdigest()
+        return self.root / f"{digest}.zip"
+
+    def _check_root(self, create: bool) -> bool:
+        """Return True if the cache directory exists and only we can write to it."""
+        if self._root_ready:
+            return True
+        try:
+            if create:
+                self.root.mkdir(mode=0o700, parents=True, exist_ok=True)
+            st = os.lstat(self.root)
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            logger.warning(f"Artifact cache directory {self.root} unusable: {e}")
+            return False
+
+        if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid():
+            logger.warning(
+                f"Artifact cache directory {self.root} is not a directory owned by "
+                f"this user; not caching artifacts"
+            )
+            return False
+        if st.st_mode & 0o077:
+            try:
+                os.chmod(self.root, 0o700)
+            except OSError as e:
+                logger.warning(f"Failed to restrict artifact cache directory {self.root}: {e}")
+                return False
+
+        self._root_ready = True
+        return True
+
+    def get(self, storage_key: str) -> Optional[bytes]:
+        """Return cached artifact bytes, or None on a miss."""
+        digest = _key_digest(storage_key)
+        if digest is None or not self._check_root(create=False):
+            return None
+
+        path = self._path(storage_key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Failed to read cached artifact {storage_key}: {e}")
+            return None
+
+        if hashlib.sha256(data).hexdigest() != digest:
+            logger.warning(f"Cached artifact {storage_key} failed its hash check; discarding")
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return None
+
+        try:
+            os.utime(path)  # mark as recently used
+        except OSError:
+            pass
+        return data
+
+    def put(self, storage_key: str, data: bytes) -> None:
+        """Store artifact bytes, then evict old entries over max_bytes."""
+        if _key_digest(storage_key) is None or not self._check_root(create=True):
+            return
+
+        path = self._path(storage_key)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to cache artifact {storage_key}: {e}")
+            return
+
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        total = 0
+        stale_before = time.time() - _STALE_TMP_SECONDS
+        try:
+            with os.scandir(self.root) as it:
+                for entry in it:
+                    try:
+                        st = entry.stat()
+                        if entry.name.endswith(".tmp"):
+                            # Left behind by a write that crashed before its rename
+                            if st.st_mtime < stale_before:
+                                os.unlink(entry.path)
+                            continue
+                    except OSError:
+                        continue
+                    if entry.name.endswith(".zip"):
+                        entries.append((st.st_mtime, st.st_size, entry.path))
+                        total += st.st_size
+        except OSError as e:
+            logger.warning(f"Failed to scan artifact cache {self.root}: {e}")
+            return
+
+        if total <= self.max_bytes:
+            return
+
+        # Oldest first
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+                total -= size
+            except OSError:
+                pass
+
+
+def _key_digest(storage_key: str) -> Optional[str]:
+    """Return the artifact SHA-256 embedded in a storage key, if any."""
+    match = _KEY_DIGEST.search(storage_key)
+    return match.group(1) if match else None
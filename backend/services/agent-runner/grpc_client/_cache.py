@@ -0,0 +1,133 @@
+"""TTL-bounded LRU cache for read-by-ID gRPC client methods."""
+
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Union
+
+
+def async_ttl_lru(
+    maxsize: int = 512,
+    ttl: Union[float, Callable[[Any], float]] = 30.0,
+    key: Optional[Callable[[Any], Hashable]] = None,
+    max_bytes: Optional[int] = None,
+):
+    """
+    Cache the results of an async client method taking one request argument.
+
+    Entries are keyed by ``(client class name, client api_key, key(arg))``
+    so clients authenticated with different API keys never share results.
+    Entries expire ``ttl`` seconds after they were stored and the least
+    recently used entry is evicted once ``maxsize`` is reached. Calls that
+    raise are not cached, so NOT_FOUND and transient errors are retried.
+
+    Concurrent calls for the same key share a single in-flight request
+    (single-flight), so a fan-out over duplicate IDs issues one RPC per ID.
+
+    Cached responses are shared between callers and must be treated as
+    read-only.
+
+    The decorated method gains ``cache_clear()`` and ``invalidate(client, arg)``
+    for callers that modify the underlying resource.
+
+    Args:
+        maxsize: Maximum number of cached responses
+        ttl: Seconds a cached response stays valid, or a callable returning
+            it for a given client (for per-instance configuration)
+        key: Maps the request argument to a hashable cache key (defaults to
+            the argument itself)
+        max_bytes: Optional bound on the summed len() of cached responses,
+            for methods returning bytes; a response larger than the bound
+            is returned but not cached
+    """
+    def decorator(fn):
+        cache: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        in_flight: dict[Hashable, asyncio.Future] = {}
+        total_bytes = 0
+
+        def size_of(value) -> int:
+            return len(value) if max_bytes is not None else 0
+
+        def evict(cache_key) -> None:
+            nonlocal total_bytes
+            _, value = cache.pop(cache_key)
+            total_bytes -= size_of(value)
+
+        def make_key(client, arg) -> Hashable:
+            arg_key = key(arg) if key is not None else arg
+            return (type(client).__name__, client.api_key, arg_key)
+
+        @functools.wraps(fn)
+        async def wrapper(self, arg):
+            nonlocal total_bytes
+            cache_key = make_key(self, arg)
+            entry = cache.get(cache_key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    cache.move_to_end(cache_key)
+                    return value
+                evict(cache_key)
+
+            pending = in_flight.get(cache_key)
+            if pending is not None:
+                # Shield so a cancelled follower doesn't cancel the shared call
+                try:
+                    return await asyncio.shield(pending)
+                except asyncio.CancelledError:
+                    # The leader was cancelled (e.g. its fan-out failed fast),
+                    # not us: issue the call ourselves
+                    if pending.cancelled() and not asyncio.current_task().cancelling():
+                        return await wrapper(self, arg)
+                    raise
+
+            future = asyncio.get_running_loop().create_future()
+            in_flight[cache_key] = future
+            try:
+                value = await fn(self, arg)
+            except BaseException as e:
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+                    # Mark retrieved; the caller re-raises it below
+                    future.exception()
+                raise
+            else:
+                future.set_result(value)
+            finally:
+                del in_flight[cache_key]
+
+            size = size_of(value)
+            if max_bytes is not None and size > max_bytes:
+                # Caching it would flush every other entry
+                return value
+
+            entry_ttl = ttl(self) if callable(ttl) else ttl
+            if cache_key in cache:
+                evict(cache_key)
+            cache[cache_key] = (time.monotonic() + entry_ttl, value)
+            total_bytes += size
+            while cache and (
+                len(cache) > maxsize
+                or (max_bytes is not None and total_bytes > max_bytes)
+            ):
+                evict(next(iter(cache)))
+            return value
+
+        def invalidate(client, arg) -> None:
+            cache_key = make_key(client, arg)
+            if cache_key in cache:
+                evict(cache_key)
+
+        def cache_clear() -> None:
+            nonlocal total_bytes
+            cache.clear()
+            total_bytes = 0
+
+        wrapper.cache_clear = cache_clear
+        wrapper.invalidate = invalidate
+        return wrapper
+
+    return decorator
@@ -1,11 +1,10 @@
 """gRPC client for fetching Agent configuration."""
 
-import grpc
 from ai.stigmer.agentic.agent.v1 import query_pb2_grpc
 from ai.stigmer.agentic.agent.v1.api_pb2 import Agent
 from ai.stigmer.agentic.agent.v1.io_pb2 import AgentId
-from worker.config import Config
-from grpc_client.auth.client_interceptor import AuthClientInterceptor
+from grpc_client.channel_factory import get_channel
+from grpc_client._cache import async_ttl_lru
 
 
 class AgentClient:
@@ -18,27 +17,14 @@ class AgentClient:
         Args:
             api_key: Stigmer API key for authentication
         """
-        config = Config.load_from_env()
-        endpoint = config.stigmer_backend_endpoint
+        self.api_key = api_key
         
-        # Create interceptor with API key
-        interceptor = AuthClientInterceptor(api_key)
-        
-        # Create channel with interceptor
-        if endpoint.endswith(":443"):
-            self.channel = grpc.aio.secure_channel(
-                endpoint,
-                grpc.ssl_channel_credentials(),
-                interceptors=[interceptor]
-            )
-        else:
-            self.channel = grpc.aio.insecure_channel(
-                endpoint,
-                interceptors=[interceptor]
-            )
+        # Shared authenticated channel to the Stigmer backend
+        self.channel = get_channel(api_key)
         
         self.stub = query_pb2_grpc.AgentQueryControllerStub(self.channel)
     
+    @async_ttl_lru()
     async def get(self, agent_id: str) -> Agent:
         """Fetch agent by ID."""
         if not agent_id:
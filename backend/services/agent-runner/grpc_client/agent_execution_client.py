@@ -1,43 +1,39 @@
 """gRPC client for updating AgentExecution resources."""
 
-import grpc
 from ai.stigmer.agentic.agentexecution.v1 import command_pb2_grpc
 from ai.stigmer.agentic.agentexecution.v1.api_pb2 import AgentExecution, AgentExecutionStatus
 from ai.stigmer.agentic.agentexecution.v1.command_pb2 import AgentExecutionUpdateStatusInput
-from worker.config import Config
-from grpc_client.auth.client_interceptor import AuthClientInterceptor
+from grpc_client.channel_factory import get_channel
+from typing import Optional
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class AgentExecutionClient:
     """Client for sending status updates to AgentExecutionCommandController."""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, coalesce_window: Optional[float] = None):
         """
         Initialize AgentExecution client with authentication.
         
         Args:
             api_key: Stigmer API key for authentication
+            coalesce_window: If set, queue_status_update() batches updates and
+                sends only the latest status per execution after this many
+                seconds. If None, queue_status_update() sends immediately.
         """
-        config = Config.load_from_env()
-        endpoint = config.stigmer_backend_endpoint
-        
-        # Create interceptor with API key
-        interceptor = AuthClientInterceptor(api_key)
-        
-        # Create channel with interceptor
-        if endpoint.endswith(":443"):
-            self.channel = grpc.aio.secure_channel(
-                endpoint,
-                grpc.ssl_channel_credentials(),
-                interceptors=[interceptor]
-            )
-        else:
-            self.channel = grpc.aio.insecure_channel(
-                endpoint,
-                interceptors=[interceptor]
-            )
+        # Shared authenticated channel to the Stigmer backend
+        self.channel = get_channel(api_key)
         
         self.command_stub = command_pb2_grpc.AgentExecutionCommandControllerStub(self.channel)
+        
+        # Coalescing state (only used when coalesce_window is set)
+        self._coalesce_window = coalesce_window
+        self._pending: dict[str, AgentExecutionStatus] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._send_lock = asyncio.Lock()
     
     async def update_status(self, execution_id: str, status: AgentExecutionStatus) -> AgentExecution:
         """
@@ -47,6 +43,10 @@ class AgentExecutionClient:
         The BuildNewStateWithStatusStep in AgentExecutionUpdateStatusHandler will load the
         existing execution, authorize, and merge the status updates.
         
+        The update is sent immediately. Any queued update for the same execution
+        is dropped (status is cumulative, so this one supersedes it), and an
+        in-progress flush completes first so older statuses never land after it.
+        
         Args:
             execution_id: The execution ID to update
             status: The AgentExecutionStatus with updates (messages, tool_calls, phase, etc.)
@@ -57,6 +57,70 @@ class AgentExecutionClient:
         if not execution_id:
             raise ValueError("execution_id cannot be empty")
         
+        self._pending.pop(execution_id, None)
+        async with self._send_lock:
+            return await self._send(execution_id, status)
+    
+    async def queue_status_update(self, execution_id: str, status: AgentExecutionStatus) -> None:
+        """
+        Queue a status update, coalescing bursts into one RPC per execution.
+        
+        Within the coalesce window only the latest status for each execution is
+        sent. Failures are logged rather than raised, since a later update (or
+        the final update_status call) carries the same cumulative state.
+        
+        Args:
+            execution_id: The execution ID to update
+            status: The AgentExecutionStatus with updates
+        """
+        if self._coalesce_window is None:
+            await self.update_status(execution_id, status)
+            return
+        
+        if not execution_id:
+            raise ValueError("execution_id cannot be empty")
+        
+        self._pending[execution_id] = status
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_window())
+    
+    async def flush(self) -> None:
+        """Send all queued status updates now."""
+        async with self._send_lock:
+            drain, self._pending = self._pending, {}
+            if not drain:
+                return
+            
+            results = await asyncio.gather(
+                *[self._send(execution_id, status) for execution_id, status in drain.items()],
+                return_exceptions=True,
+            )
+        
+        for execution_id, result in zip(drain, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to send queued status update for {execution_id}: {result}")
+    
+    async def close(self) -> None:
+        """Stop the pending flush task, then send any still-queued updates.
+        
+        Call once the execution is done (including on cancellation) so the
+        coalescing window can't send a stale update after the caller returns.
+        """
+        task, self._flush_task = self._flush_task, None
+        if task is not None:
+            task.cancel()
+            # wait() doesn't raise, so our own cancellation still propagates
+            await asyncio.wait([task])
+        await self.flush()
+    
+    async def _flush_after_window(self) -> None:
+        try:
+            await asyncio.sleep(self._coalesce_window)
+        finally:
+            self._flush_task = None
+        await self.flush()
+    
+    async def _send(self, execution_id: str, status: AgentExecutionStatus) -> AgentExecution:
         # Build AgentExecutionUpdateStatusInput with execution_id and status
         # This is the new contract that avoids validation errors on incomplete metadata
         update_input = AgentExecutionUpdateStatusInput(
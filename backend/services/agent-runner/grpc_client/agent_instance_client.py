@@ -1,11 +1,10 @@
 """gRPC client for fetching AgentInstance configuration."""
 
-import grpc
 from ai.stigmer.agentic.agentinstance.v1 import query_pb2_grpc
 from ai.stigmer.agentic.agentinstance.v1.api_pb2 import AgentInstance
 from ai.stigmer.agentic.agentinstance.v1.io_pb2 import AgentInstanceId
-from worker.config import Config
-from grpc_client.auth.client_interceptor import AuthClientInterceptor
+from grpc_client.channel_factory import get_channel
+from grpc_client._cache import async_ttl_lru
 
 
 class AgentInstanceClient:
@@ -18,27 +17,14 @@ class AgentInstanceClient:
         Args:
             api_key: Stigmer API key for authentication
         """
-        config = Config.load_from_env()
-        endpoint = config.stigmer_backend_endpoint
+        self.api_key = api_key
         
-        # Create interceptor with API key
-        interceptor = AuthClientInterceptor(api_key)
-        
-        # Create channel with interceptor
-        if endpoint.endswith(":443"):
-            self.channel = grpc.aio.secure_channel(
-                endpoint,
-                grpc.ssl_channel_credentials(),
-                interceptors=[interceptor]
-            )
-        else:
-            self.channel = grpc.aio.insecure_channel(
-                endpoint,
-                interceptors=[interceptor]
-            )
+        # Shared authenticated channel to the Stigmer backend
+        self.channel = get_channel(api_key)
         
         self.stub = query_pb2_grpc.AgentInstanceQueryControllerStub(self.channel)
     
+    @async_ttl_lru()
     async def get(self, agent_instance_id: str) -> AgentInstance:
         """Fetch agent instance by ID."""
         if not agent_instance_id:
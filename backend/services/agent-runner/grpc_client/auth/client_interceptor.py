@@ -1,25 +1,15 @@
 """gRPC client interceptor for adding Stigmer API key authentication."""
 
+import collections
+import sys
 import grpc
-from typing import Any, Callable, Awaitable, Tuple, Optional, Sequence
+from typing import Any, Callable, Awaitable
 
 
-class _ClientCallDetails:
-    """Custom ClientCallDetails to allow metadata modification."""
-    
-    def __init__(
-        self,
-        method: str,
-        timeout: Optional[float],
-        metadata: Optional[Sequence[Tuple[str, str]]],
-        credentials: Optional[grpc.CallCredentials],
-        wait_for_ready: Optional[bool],
-    ):
-        self.method = method
-        self.timeout = timeout
-        self.metadata = metadata
-        self.credentials = credentials
-        self.wait_for_ready = wait_for_ready
+# Immutable ClientCallDetails replacement that allows metadata modification
+_CallDetails = collections.namedtuple(
+    "_CallDetails", "method timeout metadata credentials wait_for_ready"
+)
 
 
 class AuthClientInterceptor(
@@ -41,12 +31,15 @@ class AuthClientInterceptor(
         Args:
             api_key: Stigmer API key for authentication
         """
-        self.api_key = api_key
+        # Formatted and interned once; interceptors for the same key share
+        # the header string, which is appended to every call's metadata
+        self._bearer = sys.intern(f"Bearer {api_key}")
+        self._auth_pair = ("authorization", self._bearer)
     
     def _augment_call_details(
         self, 
         client_call_details: grpc.aio.ClientCallDetails
-    ) -> _ClientCallDetails:
+    ) -> _CallDetails:
         """
         Add authorization header to call metadata.
         
@@ -56,57 +49,35 @@ class AuthClientInterceptor(
         Returns:
             Modified call details with authorization metadata
         """
-        # Get current metadata or create empty list
-        metadata = list(client_call_details.metadata or [])
-        
-        # Add authorization header with API key
-        metadata.append(("authorization", f"Bearer {self.api_key}"))
+        # Append the authorization header to any existing metadata
+        metadata = client_call_details.metadata
+        if metadata is None:
+            metadata = (self._auth_pair,)
+        else:
+            metadata = (*metadata, self._auth_pair)
         
         # Create new call details with updated metadata
-        return _ClientCallDetails(
+        return _CallDetails(
             method=client_call_details.method,
             timeout=client_call_details.timeout,
-            metadata=tuple(metadata),
+            metadata=metadata,
             credentials=client_call_details.credentials,
             wait_for_ready=client_call_details.wait_for_ready,
         )
     
-    async def intercept_unary_unary(
-        self,
-        continuation: Callable[[grpc.aio.ClientCallDetails, Any], Awaitable[Any]],
-        client_call_details: grpc.aio.ClientCallDetails,
-        request: Any,
-    ) -> Any:
-        """Intercept unary-unary calls."""
-        new_details = self._augment_call_details(client_call_details)
-        return await continuation(new_details, request)
-    
-    async def intercept_unary_stream(
-        self,
-        continuation: Callable[[grpc.aio.ClientCallDetails, Any], Awaitable[Any]],
-        client_call_details: grpc.aio.ClientCallDetails,
-        request: Any,
-    ) -> Any:
-        """Intercept unary-stream calls."""
-        new_details = self._augment_call_details(client_call_details)
-        return await continuation(new_details, request)
-    
-    async def intercept_stream_unary(
+    async def _intercept(
         self,
         continuation: Callable[[grpc.aio.ClientCallDetails, Any], Awaitable[Any]],
         client_call_details: grpc.aio.ClientCallDetails,
-        request_iterator: Any,
+        request_or_iterator: Any,
     ) -> Any:
-        """Intercept stream-unary calls."""
-        new_details = self._augment_call_details(client_call_details)
-        return await continuation(new_details, request_iterator)
+        """Intercept a call of any arity, adding the authorization header."""
+        return await continuation(
+            self._augment_call_details(client_call_details), request_or_iterator
+        )
     
-    async def intercept_stream_stream(
-        self,
-        continuation: Callable[[grpc.aio.ClientCallDetails, Any], Awaitable[Any]],
-        client_call_details: grpc.aio.ClientCallDetails,
-        request_iterator: Any,
-    ) -> Any:
-        """Intercept stream-stream calls."""
-        new_details = self._augment_call_details(client_call_details)
-        return await continuation(new_details, request_iterator)
+    # grpc.aio passes the same positional arguments to every variant
+    intercept_unary_unary = _intercept
+    intercept_unary_stream = _intercept
+    intercept_stream_unary = _intercept
+    intercept_stream_stream = _intercept
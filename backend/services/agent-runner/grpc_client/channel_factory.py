@@ -0,0 +1,138 @@
+"""Shared gRPC channel factory for Stigmer backend clients."""
+
+import grpc
+from typing import Any, Sequence
+from worker.config import Config
+from grpc_client.auth.client_interceptor import AuthClientInterceptor
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Connection tuning shared by every channel to the Stigmer backend. The
+# keepalive interval matches grpc-go's default server enforcement minimum
+# (5 minutes); pinging more often gets the connection closed with GOAWAY.
+_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 300_000),
+    ("grpc.keepalive_timeout_ms", 20_000),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.max_receive_message_length", 64 * 1024 * 1024),
+]
+
+# Loopback endpoints that may be swapped for a Unix domain socket
+_LOOPBACK_PREFIXES = ("localhost:", "127.0.0.1:")
+
+# Gives a pooled channel its own subchannel (and so its own HTTP/2
+# connection) instead of sharing gRPC's global subchannel pool
+_POOLED_CHANNEL_OPTIONS = [("grpc.use_local_subchannel_pool", 1)]
+
+# One channel per (endpoint, api_key, pool index), shared by every client
+# built on it
+_channels: dict[tuple[str, str, int], grpc.aio.Channel] = {}
+
+
+def _build_channel(
+    endpoint: str,
+    interceptors: Sequence[grpc.aio.ClientInterceptor],
+    uds_path: str | None = None,
+    extra_options: Sequence[tuple[str, Any]] = (),
+) -> grpc.aio.Channel:
+    """
+    Open a channel to the Stigmer backend.
+
+    Endpoints on port 443 use TLS; anything else is plaintext (local dev).
+    A loopback endpoint is reached over the Unix socket at uds_path when one
+    is configured, skipping the TCP stack for same-host backends.
+
+    Args:
+        endpoint: host:port of the Stigmer backend
+        interceptors: Client interceptors to attach
+        uds_path: Optional Unix socket path of a same-host backend
+        extra_options: Channel options added to the shared defaults
+
+    Returns:
+        New gRPC channel
+    """
+    options = [*_CHANNEL_OPTIONS, *extra_options]
+    if uds_path and endpoint.startswith(_LOOPBACK_PREFIXES):
+        return grpc.aio.insecure_channel(
+            f"unix:{uds_path}",
+            options=options,
+            interceptors=interceptors,
+        )
+    if endpoint.endswith(":443"):
+        return grpc.aio.secure_channel(
+            endpoint,
+            grpc.ssl_channel_credentials(),
+            options=options,
+            interceptors=interceptors,
+        )
+    return grpc.aio.insecure_channel(
+        endpoint,
+        options=options,
+        interceptors=interceptors,
+    )
+
+
+def get_channel(api_key: str, index: int = 0) -> grpc.aio.Channel:
+    """
+    Get the shared authenticated channel to the Stigmer backend.
+
+    The first call for an (endpoint, api_key) pair opens the channel; later
+    calls reuse it, so all clients share one connection (and one TLS
+    handshake) instead of opening their own.
+
+    Args:
+        api_key: Stigmer API key for authentication
+        index: Pool slot; slots other than 0 get their own connection
+
+    Returns:
+        gRPC channel with the auth interceptor attached
+    """
+    config = Config.load_from_env()
+    endpoint = config.stigmer_backend_endpoint
+
+    key = (endpoint, api_key, index)
+    channel = _channels.get(key)
+    if channel is not None:
+        return channel
+
+    channel = _build_channel(
+        endpoint,
+        [AuthClientInterceptor(api_key)],
+        uds_path=config.stigmer_backend_uds_path,
+        extra_options=_POOLED_CHANNEL_OPTIONS if index else (),
+    )
+
+    _channels[key] = channel
+    logger.debug(f"Opened shared gRPC channel #{index} to {endpoint}")
+    return channel
+
+
+def get_channel_pool(api_key: str, size: int) -> list[grpc.aio.Channel]:
+    """
+    Get a pool of shared channels, each on its own HTTP/2 connection.
+
+    Spreading large concurrent fan-outs across several connections avoids
+    the per-connection stream limit and flow-control contention of one.
+    Slot 0 is the channel returned by get_channel().
+
+    Args:
+        api_key: Stigmer API key for authentication
+        size: Number of channels in the pool (at least 1)
+
+    Returns:
+        List of gRPC channels with the auth interceptor attached
+    """
+    return [get_channel(api_key, index) for index in range(max(size, 1))]
+
+
+async def close_all_channels() -> None:
+    """Close every shared channel. Call once during graceful shutdown."""
+    channels = list(_channels.values())
+    _channels.clear()
+
+    for channel in channels:
+        try:
+            await channel.close()
+        except Exception as e:
+            logger.warning(f"Error closing gRPC channel: {e}")
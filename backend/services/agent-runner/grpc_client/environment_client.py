@@ -5,8 +5,8 @@ from ai.stigmer.agentic.environment.v1 import query_pb2_grpc
 from ai.stigmer.agentic.environment.v1.api_pb2 import Environment
 from ai.stigmer.agentic.environment.v1.io_pb2 import EnvironmentId
 from ai.stigmer.commons.apiresource.io_pb2 import ApiResourceReference
-from worker.config import Config
-from grpc_client.auth.client_interceptor import AuthClientInterceptor
+from grpc_client.channel_factory import get_channel
+from grpc_client._cache import async_ttl_lru
 import logging
 import asyncio
 
@@ -23,27 +23,14 @@ class EnvironmentClient:
         Args:
             api_key: Stigmer API key for authentication
         """
-        config = Config.load_from_env()
-        endpoint = config.stigmer_backend_endpoint
+        self.api_key = api_key
         
-        # Create interceptor with API key
-        interceptor = AuthClientInterceptor(api_key)
-        
-        # Create channel with interceptor
-        if endpoint.endswith(":443"):
-            self.channel = grpc.aio.secure_channel(
-                endpoint,
-                grpc.ssl_channel_credentials(),
-                interceptors=[interceptor]
-            )
-        else:
-            self.channel = grpc.aio.insecure_channel(
-                endpoint,
-                interceptors=[interceptor]
-            )
+        # Shared authenticated channel to the Stigmer backend
+        self.channel = get_channel(api_key)
         
         self.stub = query_pb2_grpc.EnvironmentQueryServiceStub(self.channel)
     
+    @async_ttl_lru(key=lambda ref: ref.SerializeToString(deterministic=True))
     async def get_by_reference(self, ref: ApiResourceReference) -> Environment:
         """Fetch environment by ApiResourceReference.
         
@@ -91,17 +78,23 @@ class EnvironmentClient:
         logger.info(f"Fetching {len(refs)} environments: {[ref.slug for ref in refs]}")
         
         try:
-            # Fetch all environments in parallel, preserving order
-            environments = await asyncio.gather(
-                *[self.get_by_reference(ref) for ref in refs]
+            # Issue one RPC per distinct ref (the same environment is often
+            # referenced more than once), then fan results back out in order
+            ref_keys = [ref.SerializeToString(deterministic=True) for ref in refs]
+            unique_refs = dict(zip(ref_keys, refs))
+            
+            fetched = await asyncio.gather(
+                *[self.get_by_reference(ref) for ref in unique_refs.values()]
             )
+            by_key = dict(zip(unique_refs, fetched))
+            environments = [by_key[key] for key in ref_keys]
             
             logger.info(
                 f"Successfully fetched {len(environments)} environments: "
                 f"{[env.metadata.name for env in environments]}"
             )
             
-            return list(environments)
+            return environments
             
         except ValueError:
             # Re-raise ValueError (environment not found)
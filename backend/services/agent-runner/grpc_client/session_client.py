@@ -1,11 +1,9 @@
 """gRPC client for fetching and updating Session resources."""
 
-import grpc
 from ai.stigmer.agentic.session.v1 import command_pb2_grpc, query_pb2_grpc
 from ai.stigmer.agentic.session.v1.api_pb2 import Session
 from ai.stigmer.agentic.session.v1.io_pb2 import SessionId
-from worker.config import Config
-from grpc_client.auth.client_interceptor import AuthClientInterceptor
+from grpc_client.channel_factory import get_channel
 
 
 class SessionClient:
@@ -18,24 +16,8 @@ class SessionClient:
         Args:
             api_key: Stigmer API key for authentication
         """
-        config = Config.load_from_env()
-        endpoint = config.stigmer_backend_endpoint
-        
-        # Create interceptor with API key
-        interceptor = AuthClientInterceptor(api_key)
-        
-        # Create channel with interceptor
-        if endpoint.endswith(":443"):
-            self.channel = grpc.aio.secure_channel(
-                endpoint,
-                grpc.ssl_channel_credentials(),
-                interceptors=[interceptor]
-            )
-        else:
-            self.channel = grpc.aio.insecure_channel(
-                endpoint,
-                interceptors=[interceptor]
-            )
+        # Shared authenticated channel to the Stigmer backend
+        self.channel = get_channel(api_key)
         
         self.command_stub = command_pb2_grpc.SessionCommandControllerStub(self.channel)
         self.query_stub = query_pb2_grpc.SessionQueryControllerStub(self.channel)
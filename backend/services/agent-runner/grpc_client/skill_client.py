@@ -6,12 +6,53 @@ from ai.stigmer.agentic.skill.v1.io_pb2 import SkillId
 from ai.stigmer.agentic.skill.v1.api_pb2 import Skill
 from ai.stigmer.commons.apiresource.io_pb2 import ApiResourceReference
 from worker.config import Config
-from grpc_client.auth.client_interceptor import AuthClientInterceptor
+from grpc_client.channel_factory import get_channel_pool
+from grpc_client._cache import async_ttl_lru
+from grpc_client._artifact_cache import ArtifactDiskCache
 import logging
 import asyncio
+import itertools
+from typing import AsyncIterator
 
 logger = logging.getLogger(__name__)
 
+# Concurrent skill RPCs allowed per pooled channel, so large fan-outs queue
+# client-side instead of piling onto the HTTP/2 stream limit
+_MAX_INFLIGHT_PER_CHANNEL = 32
+
+# In-memory artifact cache budget; at the 64 MiB message limit, 32 entries
+# alone could otherwise pin 2 GiB
+_MAX_ARTIFACT_MEMORY_BYTES = 256 * 1024 * 1024
+
+# Compression for skill metadata RPCs, by SKILL_RPC_COMPRESSION value.
+# Artifacts are ZIPs (already compressed), so getArtifact never uses it
+_COMPRESSION_BY_NAME = {
+    "gzip": grpc.Compression.Gzip,
+    "none": grpc.Compression.NoCompression,
+}
+
+
+def _ref_key(ref: ApiResourceReference) -> tuple:
+    """Identity of a skill reference, for caching and de-duplication."""
+    return (ref.scope, ref.org, ref.kind, ref.slug, ref.version)
+
+
+async def _gather_fail_fast(coros) -> list:
+    """
+    Run coroutines concurrently, cancelling the rest on the first failure.
+    
+    Unlike asyncio.gather(), in-flight siblings don't keep running after an
+    error, so a failed fan-out returns as soon as one RPC fails. The first
+    error is re-raised unwrapped (not as an ExceptionGroup) so callers keep
+    catching ValueError / grpc.RpcError.
+    """
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(coro) for coro in coros]
+    except ExceptionGroup as eg:
+        raise eg.exceptions[0]
+    return [task.result() for task in tasks]
+
 
 class SkillClient:
     """Client for fetching skills from Stigmer backend."""
@@ -24,31 +65,96 @@ class SkillClient:
             api_key: Stigmer API key for authentication
         """
         config = Config.load_from_env()
-        endpoint = config.stigmer_backend_endpoint
         
-        # Create interceptor with API key
-        interceptor = AuthClientInterceptor(api_key)
+        # Pool of shared authenticated channels; skill fan-outs are spread
+        # round-robin across them so they don't contend on one connection
+        self.channels = get_channel_pool(api_key, config.skill_channel_pool_size)
+        self.stubs = [query_pb2_grpc.SkillQueryControllerStub(channel) for channel in self.channels]
+        self._rr = itertools.count()
+        self._fanout_sem = asyncio.Semaphore(_MAX_INFLIGHT_PER_CHANNEL * len(self.stubs))
+        self._metadata_compression = _COMPRESSION_BY_NAME.get(
+            config.skill_rpc_compression, grpc.Compression.NoCompression
+        )
+        
+        # Cache key scope and lifetime for skill lookups
+        self.api_key = api_key
+        self._cache_ttl = config.skill_cache_ttl
+        
+        # Artifacts survive across workflow runs on disk; storage keys are
+        # only known to callers that could already read the skill
+        self._artifact_cache = (
+            ArtifactDiskCache(config.skill_artifact_cache_dir, config.skill_artifact_cache_max_bytes)
+            if config.skill_artifact_cache_dir
+            else None
+        )
+    
+    async def warmup(self, timeout: float = 5.0) -> None:
+        """Connect every pooled channel ahead of the first RPC.
         
-        # Create channel with interceptor
-        if endpoint.endswith(":443"):
-            self.channel = grpc.aio.secure_channel(
-                endpoint,
-                grpc.ssl_channel_credentials(),
-                interceptors=[interceptor]
+        Channels connect lazily, so without this the first skill fetch on a
+        cold worker pays the TCP/TLS/HTTP2 handshake. Failing to connect
+        within timeout is logged, not raised: channels keep retrying and
+        RPCs connect on demand once the backend is reachable.
+        
+        Args:
+            timeout: Seconds to wait for the pool to become ready
+        """
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*[channel.channel_ready() for channel in self.channels]),
+                timeout=timeout,
             )
-        else:
-            self.channel = grpc.aio.insecure_channel(
-                endpoint,
-                interceptors=[interceptor]
+            logger.info("Skill client channels ready (%d)", len(self.channels))
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Skill client channels not ready after %.1fs; connecting on first use",
+                timeout,
             )
+    
+    def _stub(self) -> query_pb2_grpc.SkillQueryControllerStub:
+        """Pick the next stub from the channel pool (round-robin)."""
+        return self.stubs[next(self._rr) % len(self.stubs)]
+    
+    @async_ttl_lru(ttl=lambda client: client._cache_ttl)
+    async def get(self, skill_id: str) -> Skill:
+        """Fetch a single skill by ID.
+        
+        Results are cached for SKILL_CACHE_TTL seconds, and concurrent
+        lookups of the same ID share one RPC.
         
-        self.stub = query_pb2_grpc.SkillQueryControllerStub(self.channel)
+        Args:
+            skill_id: Skill ID (UUID)
+            
+        Returns:
+            Skill proto message
+            
+        Raises:
+            grpc.RpcError: If gRPC call fails
+            ValueError: If skill not found or access denied
+        """
+        request = SkillId(value=skill_id)
+        try:
+            async with self._fanout_sem:
+                return await self._stub().get(request, compression=self._metadata_compression)
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.NOT_FOUND:
+                logger.error(f"Skill {skill_id} not found")
+                raise ValueError(
+                    f"Skill {skill_id} not found or access denied. "
+                    "Ensure skill exists and you have permission to access it."
+                ) from e
+            else:
+                logger.error(f"Failed to fetch skill {skill_id}: {e}")
+                raise
     
     async def list_by_ids(self, skill_ids: list[str]) -> list[Skill]:
         """Fetch multiple skills by IDs.
         
         Note: Skills API doesn't have a batch listByIds RPC, so we fetch
-        skills individually and gather results.
+        skills individually and gather results. Each get() is cached and
+        single-flight, and the fan-out is bounded and spread over the
+        channel pool, so only uncached IDs cost a round trip. Switch to a
+        batch RPC here if SkillQueryController gains one.
         
         Args:
             skill_ids: List of skill IDs (UUIDs)
@@ -63,35 +169,23 @@ class SkillClient:
         if not skill_ids:
             return []
         
-        logger.info(f"Fetching {len(skill_ids)} skills: {skill_ids}")
-        
-        # Fetch all skills in parallel using get() RPC
-        async def fetch_skill(skill_id: str) -> Skill:
-            """Fetch a single skill by ID."""
-            request = SkillId(value=skill_id)
-            try:
-                return await self.stub.get(request)
-            except grpc.RpcError as e:
-                if e.code() == grpc.StatusCode.NOT_FOUND:
-                    logger.error(f"Skill {skill_id} not found")
-                    raise ValueError(
-                        f"Skill {skill_id} not found or access denied. "
-                        "Ensure skill exists and you have permission to access it."
-                    ) from e
-                else:
-                    logger.error(f"Failed to fetch skill {skill_id}: {e}")
-                    raise
+        logger.info("Fetching %d skills", len(skill_ids))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Skill IDs: %s", skill_ids)
         
         try:
-            # Fetch all skills in parallel
-            skills = await asyncio.gather(*[fetch_skill(skill_id) for skill_id in skill_ids])
+            # Fetch each distinct ID once in parallel (the same skill is often
+            # referenced more than once), then fan results back out in order
+            unique_ids = list(dict.fromkeys(skill_ids))
+            fetched = await _gather_fail_fast(self.get(skill_id) for skill_id in unique_ids)
+            by_id = dict(zip(unique_ids, fetched))
+            skills = [by_id[skill_id] for skill_id in skill_ids]
             
-            logger.info(
-                f"Successfully fetched {len(skills)} skills: "
-                f"{[s.metadata.name for s in skills]}"
-            )
+            logger.info("Successfully fetched %d skills", len(skills))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Fetched skills: %s", [s.metadata.name for s in skills])
             
-            return list(skills)
+            return skills
             
         except ValueError:
             # Re-raise ValueError (skill not found)
@@ -100,9 +194,42 @@ class SkillClient:
             logger.error(f"Failed to fetch skills: {e}")
             raise
     
+    async def iter_by_ids(self, skill_ids: list[str]) -> AsyncIterator[Skill]:
+        """Fetch multiple skills by IDs, yielding each as soon as it arrives.
+        
+        Unlike list_by_ids(), callers can start processing (e.g. extracting
+        artifacts) before the slowest fetch completes. Skills are yielded in
+        completion order, once per distinct ID. Fetches still pending when
+        the caller stops iterating or a fetch fails are cancelled.
+        
+        Args:
+            skill_ids: List of skill IDs (UUIDs)
+            
+        Yields:
+            Skill proto messages, in completion order
+            
+        Raises:
+            grpc.RpcError: If gRPC call fails
+            ValueError: If any skill not found or access denied
+        """
+        tasks = [asyncio.ensure_future(self.get(skill_id)) for skill_id in dict.fromkeys(skill_ids)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    @async_ttl_lru(
+        ttl=lambda client: client._cache_ttl,
+        key=_ref_key,
+    )
     async def get_by_reference(self, ref: ApiResourceReference) -> Skill:
         """Fetch skill by ApiResourceReference.
         
+        Results are cached for SKILL_CACHE_TTL seconds, and concurrent
+        lookups of the same reference share one RPC.
+        
         Args:
             ref: ApiResourceReference with scope, org, kind, and slug
             
@@ -114,7 +241,10 @@ class SkillClient:
             ValueError: If skill not found or access denied
         """
         try:
-            return await self.stub.getByReference(ref)
+            async with self._fanout_sem:
+                return await self._stub().getByReference(
+                    ref, compression=self._metadata_compression
+                )
         except grpc.RpcError as e:
             if e.code() == grpc.StatusCode.NOT_FOUND:
                 logger.error(f"Skill {ref.slug} not found")
@@ -142,20 +272,26 @@ class SkillClient:
         if not refs:
             return []
         
-        logger.info(f"Fetching {len(refs)} skills: {[ref.slug for ref in refs]}")
+        logger.info("Fetching %d skills", len(refs))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Skill refs: %s", [ref.slug for ref in refs])
         
         try:
-            # Fetch all skills in parallel
-            skills = await asyncio.gather(
-                *[self.get_by_reference(ref) for ref in refs]
+            # Fetch each distinct ref once in parallel, then fan results back
+            # out in order
+            ref_keys = [_ref_key(ref) for ref in refs]
+            unique_refs = dict(zip(ref_keys, refs))
+            fetched = await _gather_fail_fast(
+                self.get_by_reference(ref) for ref in unique_refs.values()
             )
+            by_key = dict(zip(unique_refs, fetched))
+            skills = [by_key[key] for key in ref_keys]
             
-            logger.info(
-                f"Successfully fetched {len(skills)} skills: "
-                f"{[s.metadata.name for s in skills]}"
-            )
+            logger.info("Successfully fetched %d skills", len(skills))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Fetched skills: %s", [s.metadata.name for s in skills])
             
-            return list(skills)
+            return skills
             
         except ValueError:
             # Re-raise ValueError (skill not found)
@@ -164,6 +300,9 @@ class SkillClient:
             logger.error(f"Failed to fetch skills: {e}")
             raise
     
+    # Storage keys are content-addressed (version hash), so artifacts never
+    # go stale; only LRU eviction (by count and total size) bounds the cache
+    @async_ttl_lru(maxsize=32, ttl=float("inf"), max_bytes=_MAX_ARTIFACT_MEMORY_BYTES)
     async def get_artifact(self, artifact_storage_key: str) -> bytes:
         """Download skill artifact from storage.
         
@@ -171,6 +310,10 @@ class SkillClient:
         from R2 storage. This is used by the agent-runner to extract skills
         into the sandbox at /bin/skills/{version_hash}/.
         
+        Downloads are cached by storage key, in memory and on disk under
+        SKILL_ARTIFACT_CACHE_DIR, so repeat pulls of a skill version skip
+        the RPC.
+        
         Args:
             artifact_storage_key: Storage key from skill.status.artifact_storage_key
             
@@ -183,12 +326,21 @@ class SkillClient:
         """
         from ai.stigmer.agentic.skill.v1.io_pb2 import GetArtifactRequest
         
+        if self._artifact_cache is not None:
+            cached = await asyncio.to_thread(self._artifact_cache.get, artifact_storage_key)
+            if cached is not None:
+                logger.debug(f"Artifact disk cache hit - key: {artifact_storage_key}")
+                return cached
+        
         logger.info(f"Downloading skill artifact - key: {artifact_storage_key}")
         
         request = GetArtifactRequest(artifact_storage_key=artifact_storage_key)
         
         try:
-            response = await self.stub.getArtifact(request)
+            # getArtifact is unary: the whole ZIP arrives as one message, bounded
+            # by grpc.max_receive_message_length in channel_factory. Chunked
+            # delivery needs a server-streaming RPC on SkillQueryController
+            response = await self._stub().getArtifact(request)
             
             artifact_bytes = response.artifact
             logger.info(
@@ -196,6 +348,9 @@ class SkillClient:
                 f"size: {len(artifact_bytes)} bytes"
             )
             
+            if self._artifact_cache is not None:
+                await asyncio.to_thread(self._artifact_cache.put, artifact_storage_key, artifact_bytes)
+            
             return artifact_bytes
             
         except grpc.RpcError as e:
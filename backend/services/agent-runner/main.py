@@ -2,10 +2,12 @@
 
 import asyncio
 import logging
+import os
 import signal
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
+from google.protobuf.internal import api_implementation
 from worker.worker import AgentRunner
 from worker.config import Config
 from worker.logging_config import setup_logging
@@ -16,6 +18,11 @@ from worker.logging_config import setup_logging
 # In production (Kubernetes), environment variables come from ConfigMaps/Secrets, not .env files.
 def load_env_file():
     """Load environment variables from .env file if it exists."""
+    # Production and Kubernetes pods never ship a .env file; skip the
+    # filesystem probes
+    if os.environ.get("ENV") == "prod" or "KUBERNETES_SERVICE_HOST" in os.environ:
+        return
+    
     # Try current directory first
     env_path = Path(".env")
     if env_path.exists():
@@ -85,6 +92,16 @@ async def main():
     logger.info(f"Temporal: {config.temporal_service_address} (namespace: {config.temporal_namespace})")
     logger.info(f"Backend: {config.stigmer_backend_endpoint}")
     
+    # protobuf 4+ uses the upb C runtime; the pure-Python fallback makes
+    # every proto build/parse on the gRPC path several times slower
+    proto_runtime = api_implementation.Type()
+    logger.info(f"Protobuf runtime: {proto_runtime}")
+    if proto_runtime == "python":
+        logger.warning(
+            "Using the pure-Python protobuf runtime; unset "
+            "PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION or install a protobuf wheel for this platform"
+        )
+    
     if config.is_local_mode():
         logger.info(f"Sandbox: {config.sandbox_type} (root: {config.sandbox_root_dir})")
         logger.info("Note: Using gRPC to Stigmer Daemon for state/streaming")
@@ -154,5 +171,15 @@ async def main():
         logger.info("Worker process exiting")
 
 
+def run() -> None:
+    """Run main() on uvloop when it's installed, else the stock asyncio loop."""
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    run()
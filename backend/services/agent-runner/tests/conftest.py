@@ -1,42 +1,49 @@
 """Shared pytest fixtures for agent-runner tests."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import MagicMock
 import zipfile
 import io
 
+from tests.factories import FakeSkillStub, make_skill
+
+# A valid ZIP with no entries is just its 22-byte end-of-central-directory record
+EMPTY_ZIP = b"PK\x05\x06" + b"\x00" * 18
+
 
 @pytest.fixture
 def mock_skill():
     """Create a mock Skill proto message."""
-    skill = MagicMock()
-    skill.metadata.id = "skill-123-abc"
-    skill.metadata.name = "test-skill"
-    skill.metadata.slug = "test-org/test-skill"
-    skill.spec.skill_md = "# Test Skill\n\nThis is a test skill."
-    skill.status.version_hash = "abc123def456"
-    skill.status.artifact_storage_key = "skills/test-org/test-skill/abc123def456.zip"
+    skill = make_skill(
+        id="skill-123-abc",
+        name="test-skill",
+        slug="test-org/test-skill",
+        skill_md="# Test Skill\n\nThis is a test skill.",
+        version_hash="abc123def456",
+        artifact_storage_key="skills/test-org/test-skill/abc123def456.zip",
+    )
     return skill
 
 
 @pytest.fixture
 def mock_skill_no_hash():
     """Create a mock Skill proto message without version_hash."""
-    skill = MagicMock()
-    skill.metadata.id = "skill-456-def"
-    skill.metadata.name = "no-hash-skill"
-    skill.metadata.slug = "test-org/no-hash-skill"
-    skill.spec.skill_md = "# No Hash Skill\n\nSkill without version hash."
-    skill.status.version_hash = ""  # Empty hash
-    skill.status.artifact_storage_key = ""
+    skill = make_skill(
+        id="skill-456-def",
+        name="no-hash-skill",
+        slug="test-org/no-hash-skill",
+        skill_md="# No Hash Skill\n\nSkill without version hash.",
+        version_hash="",  # Empty hash
+        artifact_storage_key="",
+    )
     return skill
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_artifact_zip() -> bytes:
-    """Create a sample artifact ZIP file as bytes."""
+    """Create a sample artifact ZIP file as bytes (built once per session)."""
     buffer = io.BytesIO()
-    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as zf:
         # Add SKILL.md
         zf.writestr("SKILL.md", "# Test Skill\n\nThis is a test skill from ZIP.")
         # Add a shell script
@@ -48,11 +55,11 @@ def sample_artifact_zip() -> bytes:
     return buffer.getvalue()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_artifact_zip_nested() -> bytes:
-    """Create a sample artifact ZIP file with nested directories."""
+    """Create a sample artifact ZIP file with nested directories (built once per session)."""
     buffer = io.BytesIO()
-    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as zf:
         zf.writestr("SKILL.md", "# Nested Skill")
         zf.writestr("src/main.py", "print('nested')")
         zf.writestr("scripts/run.sh", "#!/bin/bash\necho 'nested script'")
@@ -60,6 +67,12 @@ def sample_artifact_zip_nested() -> bytes:
     return buffer.getvalue()
 
 
+@pytest.fixture(scope="session")
+def empty_artifact_zip() -> bytes:
+    """Return a valid ZIP file with no entries."""
+    return EMPTY_ZIP
+
+
 @pytest.fixture
 def mock_grpc_channel():
     """Create a mock gRPC channel."""
@@ -68,9 +81,5 @@ def mock_grpc_channel():
 
 @pytest.fixture
 def mock_skill_stub():
-    """Create a mock SkillQueryController stub."""
-    stub = MagicMock()
-    stub.getArtifact = AsyncMock()
-    stub.get = AsyncMock()
-    stub.getByReference = AsyncMock()
-    return stub
+    """Create a fake SkillQueryController stub."""
+    return FakeSkillStub()
@@ -0,0 +1,79 @@
+"""Lightweight test doubles for Skill proto messages and the Skill query stub."""
+
+import inspect
+from types import SimpleNamespace
+
+
+def make_skill(
+    id: str = "",
+    name: str = "",
+    slug: str = "",
+    skill_md: str = "",
+    version_hash: str = "",
+    artifact_storage_key: str = "",
+    tag: str | None = None,
+) -> SimpleNamespace:
+    """Build an object with the Skill fields SkillWriter and SkillClient read.
+
+    Plain attributes are much cheaper than MagicMock's lazily created child
+    mocks, and a misspelled field fails loudly instead of returning a mock.
+    """
+    spec = SimpleNamespace(skill_md=skill_md)
+    if tag is not None:
+        spec.tag = tag
+    return SimpleNamespace(
+        metadata=SimpleNamespace(id=id, name=name, slug=slug),
+        spec=spec,
+        status=SimpleNamespace(
+            version_hash=version_hash,
+            artifact_storage_key=artifact_storage_key,
+        ),
+    )
+
+
+class FakeRpc:
+    """Async stand-in for one unary stub method that records its calls.
+
+    Supports the subset of the AsyncMock API the tests use: return_value,
+    side_effect (an exception or a sync/async callable), call_count,
+    call_args and assert_called_once().
+    """
+
+    def __init__(self):
+        self.return_value = None
+        self.side_effect = None
+        self.call_args_list = []
+
+    @property
+    def call_count(self) -> int:
+        return len(self.call_args_list)
+
+    @property
+    def call_args(self):
+        return self.call_args_list[-1] if self.call_args_list else None
+
+    async def __call__(self, *args, **kwargs):
+        self.call_args_list.append((args, kwargs))
+        effect = self.side_effect
+        if isinstance(effect, BaseException):
+            raise effect
+        if callable(effect):
+            result = effect(*args, **kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+        return self.return_value
+
+    def assert_called_once(self) -> None:
+        assert self.call_count == 1, f"Expected 1 call, got {self.call_count}"
+
+
+class FakeSkillStub:
+    """SkillQueryControllerStub double with only the RPCs SkillClient calls."""
+
+    __slots__ = ("get", "getByReference", "getArtifact")
+
+    def __init__(self):
+        self.get = FakeRpc()
+        self.getByReference = FakeRpc()
+        self.getArtifact = FakeRpc()
@@ -0,0 +1,104 @@
+"""Unit tests for AgentExecutionClient status coalescing."""
+
+import asyncio
+import pytest
+from unittest.mock import MagicMock, patch
+
+from ai.stigmer.agentic.agentexecution.v1.api_pb2 import AgentExecutionStatus, AgentMessage
+
+WINDOW = 0.05
+
+
+def _status(marker: str) -> AgentExecutionStatus:
+    """Build a status identified by the content of its only message."""
+    return AgentExecutionStatus(messages=[AgentMessage(content=marker)])
+
+
+class TestAgentExecutionClientCoalescing:
+    """Tests for queue_status_update(), flush() and close()."""
+
+    @pytest.fixture
+    def sent(self):
+        """(execution_id, marker) for every updateStatus RPC, in send order."""
+        return []
+
+    @pytest.fixture
+    def stub(self, sent):
+        """Command stub whose updateStatus records each sent status."""
+        stub = MagicMock()
+
+        async def update_status(update_input):
+            sent.append((update_input.execution_id, update_input.status.messages[0].content))
+
+        stub.updateStatus = update_status
+        return stub
+
+    @pytest.fixture
+    def client(self, stub):
+        """AgentExecutionClient with a coalescing window and a fake stub."""
+        with patch('grpc_client.agent_execution_client.get_channel'), \
+             patch('grpc_client.agent_execution_client.command_pb2_grpc') as mock_pb2_grpc:
+            mock_pb2_grpc.AgentExecutionCommandControllerStub.return_value = stub
+
+            from grpc_client.agent_execution_client import AgentExecutionClient
+            return AgentExecutionClient(api_key="test-api-key", coalesce_window=WINDOW)
+
+    @pytest.mark.asyncio
+    async def test_burst_sends_one_rpc_with_latest_status(self, client, sent):
+        """Test that a burst within the window is sent as one RPC carrying the last status."""
+        for marker in ("1", "2", "3"):
+            await client.queue_status_update("exec-1", _status(marker))
+        assert sent == []
+
+        await asyncio.sleep(WINDOW * 3)
+
+        assert sent == [("exec-1", "3")]
+
+    @pytest.mark.asyncio
+    async def test_update_status_drops_queued_status(self, client, sent):
+        """Test that a direct update supersedes a queued one, which is never sent."""
+        await client.queue_status_update("exec-1", _status("queued"))
+
+        await client.update_status("exec-1", _status("final"))
+        await asyncio.sleep(WINDOW * 3)
+
+        assert sent == [("exec-1", "final")]
+
+    @pytest.mark.asyncio
+    async def test_flush_in_progress_completes_before_direct_update(self, client, stub, sent):
+        """Test that a direct update waits for an in-flight flush, so the older status lands first."""
+        release = asyncio.Event()
+
+        async def slow_update_status(update_input):
+            if update_input.status.messages[0].content == "queued":
+                await release.wait()
+            sent.append((update_input.execution_id, update_input.status.messages[0].content))
+
+        stub.updateStatus = slow_update_status
+        await client.queue_status_update("exec-1", _status("queued"))
+        flush = asyncio.create_task(client.flush())
+        await asyncio.sleep(0)  # flush takes the send lock and starts its RPC
+
+        update = asyncio.create_task(client.update_status("exec-1", _status("final")))
+        await asyncio.sleep(0)
+        assert sent == []  # update is waiting on the flush
+
+        release.set()
+        await asyncio.gather(flush, update)
+
+        assert sent == [("exec-1", "queued"), ("exec-1", "final")]
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_window_task(self, client, sent):
+        """Test that close() stops the window task and nothing is sent after it returns."""
+        await client.queue_status_update("exec-1", _status("queued"))
+        window_task = client._flush_task
+
+        await client.close()
+        sent_at_close = list(sent)
+        await asyncio.sleep(WINDOW * 3)
+
+        assert window_task.cancelled()
+        assert client._flush_task is None
+        assert sent_at_close == [("exec-1", "queued")]
+        assert sent == sent_at_close
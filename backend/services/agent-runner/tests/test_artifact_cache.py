@@ -0,0 +1,118 @@
+"""Unit tests for the on-disk skill artifact cache."""
+
+import hashlib
+import os
+
+from grpc_client._artifact_cache import ArtifactDiskCache
+
+
+def _key(data: bytes) -> str:
+    """Storage key for data, in the server's skills/<sha256>.zip format."""
+    return f"skills/{hashlib.sha256(data).hexdigest()}.zip"
+
+
+class TestArtifactDiskCache:
+    """Tests for ArtifactDiskCache."""
+
+    def test_miss_then_hit(self, tmp_path):
+        """Test that a stored artifact is returned by key."""
+        cache = ArtifactDiskCache(str(tmp_path), max_bytes=1024)
+        key = _key(b"zip-bytes")
+
+        assert cache.get(key) is None
+        cache.put(key, b"zip-bytes")
+        assert cache.get(key) == b"zip-bytes"
+
+    def test_keys_cannot_escape_cache_dir(self, tmp_path):
+        """Test that path-like keys are stored inside the cache directory."""
+        root = tmp_path / "cache"
+        cache = ArtifactDiskCache(str(root), max_bytes=1024)
+
+        cache.put(f"../../etc/{hashlib.sha256(b'data').hexdigest()}.zip", b"data")
+
+        assert [p.parent for p in tmp_path.rglob("*.zip")] == [root]
+
+    def test_tampered_entry_is_discarded(self, tmp_path):
+        """Test that bytes not matching the key's hash are deleted, not returned."""
+        cache = ArtifactDiskCache(str(tmp_path), max_bytes=1024)
+        key = _key(b"zip-bytes")
+        cache.put(key, b"zip-bytes")
+
+        cache._path(key).write_bytes(b"planted")
+
+        assert cache.get(key) is None
+        assert not cache._path(key).exists()
+
+    def test_keys_without_hash_are_not_cached(self, tmp_path):
+        """Test that keys with no content hash to verify against bypass the cache."""
+        cache = ArtifactDiskCache(str(tmp_path), max_bytes=1024)
+
+        cache.put("skills/org/a/hash.zip", b"zip-bytes")
+
+        assert cache.get("skills/org/a/hash.zip") is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_root_is_private(self, tmp_path):
+        """Test that the cache directory is created, or tightened, to mode 0o700."""
+        root = tmp_path / "cache"
+        root.mkdir(mode=0o777)
+        os.chmod(root, 0o777)
+        cache = ArtifactDiskCache(str(root), max_bytes=1024)
+
+        cache.put(_key(b"data"), b"data")
+
+        assert os.stat(root).st_mode & 0o777 == 0o700
+
+    def test_root_owned_by_another_user_is_refused(self, tmp_path, monkeypatch):
+        """Test that a cache directory owned by someone else is never used."""
+        cache = ArtifactDiskCache(str(tmp_path), max_bytes=1024)
+        key = _key(b"data")
+        monkeypatch.setattr(os, "getuid", lambda: os.stat(tmp_path).st_uid + 1)
+
+        cache.put(key, b"data")
+
+        assert list(tmp_path.iterdir()) == []
+        assert cache.get(key) is None
+
+    def test_least_recently_used_entry_is_evicted(self, tmp_path):
+        """Test that writes beyond max_bytes evict the oldest entry."""
+        cache = ArtifactDiskCache(str(tmp_path), max_bytes=20)
+        a, b, c = (_key(bytes([i]) * 10) for i in range(3))
+
+        cache.put(a, bytes([0]) * 10)
+        cache.put(b, bytes([1]) * 10)
+        # Age "a" and "b", then read "a" so "b" is least recently used
+        for key in (a, b):
+            os.utime(cache._path(key), (1, 1))
+        cache.get(a)
+        cache.put(c, bytes([2]) * 10)
+
+        assert cache.get(a) is not None
+        assert cache.get(b) is None
+        assert cache.get(c) is not None
+
+    def test_stale_temp_files_are_evicted(self, tmp_path):
+        """Test that temp files left by a crashed write are removed, recent ones kept."""
+        cache = ArtifactDiskCache(str(tmp_path), max_bytes=1024)
+        stale = tmp_path / "crashed.tmp"
+        stale.write_bytes(b"partial")
+        os.utime(stale, (1, 1))
+        in_progress = tmp_path / "writing.tmp"
+        in_progress.write_bytes(b"partial")
+
+        cache.put(_key(b"data"), b"data")
+
+        assert not stale.exists()
+        assert in_progress.exists()
+
+    def test_scan_failure_does_not_fail_put(self, tmp_path, monkeypatch):
+        """Test that an unreadable cache directory only skips eviction."""
+        cache = ArtifactDiskCache(str(tmp_path), max_bytes=1024)
+
+        def failing_scandir(path):
+            raise PermissionError("denied")
+
+        monkeypatch.setattr(os, "scandir", failing_scandir)
+        cache.put(_key(b"data"), b"data")
+
+        assert cache._path(_key(b"data")).read_bytes() == b"data"
@@ -0,0 +1,201 @@
+"""Unit tests for the async_ttl_lru gRPC response cache."""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from grpc_client._cache import async_ttl_lru
+
+
+def _make_client_class(fetch, **cache_kwargs):
+    """Build a minimal client whose cached get() delegates to fetch."""
+
+    class FakeClient:
+        def __init__(self, api_key: str):
+            self.api_key = api_key
+
+        @async_ttl_lru(**cache_kwargs)
+        async def get(self, resource_id):
+            return await fetch(resource_id)
+
+    return FakeClient
+
+
+class TestAsyncTtlLru:
+    """Tests for async_ttl_lru."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_id_hits_cache(self):
+        """Test that a repeated ID is fetched once."""
+        fetch = AsyncMock(side_effect=lambda resource_id: f"value-{resource_id}")
+        client = _make_client_class(fetch)("key")
+
+        assert await client.get("a") == "value-a"
+        assert await client.get("a") == "value-a"
+        assert await client.get("b") == "value-b"
+
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_api_keys_do_not_share_entries(self):
+        """Test that clients with different API keys are cached separately."""
+        fetch = AsyncMock(return_value="value")
+        client_class = _make_client_class(fetch)
+
+        await client_class("key-1").get("a")
+        await client_class("key-2").get("a")
+
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self):
+        """Test that a failed call is retried instead of memoized."""
+        fetch = AsyncMock(side_effect=[ValueError("not found"), "value"])
+        client = _make_client_class(fetch)("key")
+
+        with pytest.raises(ValueError):
+            await client.get("a")
+        assert await client.get("a") == "value"
+
+    @pytest.mark.asyncio
+    async def test_entries_expire_after_ttl(self):
+        """Test that an entry older than ttl is refetched."""
+        fetch = AsyncMock(return_value="value")
+        client = _make_client_class(fetch, ttl=10.0)("key")
+
+        with patch("grpc_client._cache.time.monotonic", return_value=100.0):
+            await client.get("a")
+        with patch("grpc_client._cache.time.monotonic", return_value=105.0):
+            await client.get("a")
+        assert fetch.await_count == 1
+
+        with patch("grpc_client._cache.time.monotonic", return_value=111.0):
+            await client.get("a")
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted(self):
+        """Test that maxsize evicts the least recently used entry."""
+        fetch = AsyncMock(side_effect=lambda resource_id: resource_id)
+        client = _make_client_class(fetch, maxsize=2)("key")
+
+        await client.get("a")
+        await client.get("b")
+        await client.get("a")  # "b" is now least recently used
+        await client.get("c")
+        fetch.reset_mock()
+
+        await client.get("a")
+        fetch.assert_not_awaited()
+        await client.get("b")
+        fetch.assert_awaited_once_with("b")
+
+    @pytest.mark.asyncio
+    async def test_max_bytes_evicts_by_total_size(self):
+        """Test that max_bytes evicts old entries and skips oversized ones."""
+        fetch = AsyncMock(side_effect=lambda resource_id: resource_id * 4)
+        client = _make_client_class(fetch, max_bytes=10)("key")
+
+        await client.get("a")  # 4 bytes
+        await client.get("b")  # 8 bytes total
+        await client.get("c")  # 12 bytes total: "a" is evicted
+        await client.get("long-id")  # larger than max_bytes on its own
+        fetch.reset_mock()
+
+        await client.get("c")
+        fetch.assert_not_awaited()
+        await client.get("a")
+        fetch.assert_awaited_once_with("a")
+        fetch.reset_mock()
+        await client.get("long-id")
+        fetch.assert_awaited_once_with("long-id")
+
+    @pytest.mark.asyncio
+    async def test_invalidate_and_cache_clear(self):
+        """Test explicit invalidation of one entry and of the whole cache."""
+        fetch = AsyncMock(return_value="value")
+        client_class = _make_client_class(fetch)
+        client = client_class("key")
+
+        await client.get("a")
+        client_class.get.invalidate(client, "a")
+        await client.get("a")
+        assert fetch.await_count == 2
+
+        client_class.get.cache_clear()
+        await client.get("a")
+        assert fetch.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_custom_key_function(self):
+        """Test that unhashable arguments are cached through a key function."""
+        fetch = AsyncMock(return_value="value")
+        client = _make_client_class(fetch, key=lambda ref: tuple(sorted(ref.items())))("key")
+
+        await client.get({"slug": "a", "org": "x"})
+        await client.get({"org": "x", "slug": "a"})
+
+        assert fetch.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_request(self):
+        """Test that concurrent calls for the same key issue one request."""
+        release = asyncio.Event()
+
+        async def slow_fetch(resource_id):
+            await release.wait()
+            return f"value-{resource_id}"
+
+        fetch = AsyncMock(side_effect=slow_fetch)
+        client = _make_client_class(fetch)("key")
+
+        calls = [asyncio.create_task(client.get("a")) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*calls) == ["value-a"] * 3
+        assert fetch.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_errors(self):
+        """Test that followers of a failed in-flight request see its error."""
+        release = asyncio.Event()
+
+        async def failing_fetch(resource_id):
+            await release.wait()
+            raise ValueError("not found")
+
+        fetch = AsyncMock(side_effect=failing_fetch)
+        client = _make_client_class(fetch)("key")
+
+        calls = [asyncio.create_task(client.get("a")) for _ in range(2)]
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        assert all(isinstance(r, ValueError) for r in results)
+        assert fetch.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_follower_retries_when_leader_is_cancelled(self):
+        """Test that cancelling the leading caller doesn't cancel followers."""
+        release = asyncio.Event()
+
+        async def slow_fetch(resource_id):
+            await release.wait()
+            return f"value-{resource_id}"
+
+        fetch = AsyncMock(side_effect=slow_fetch)
+        client = _make_client_class(fetch)("key")
+
+        leader = asyncio.create_task(client.get("a"))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(client.get("a"))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await follower == "value-a"
+        assert leader.cancelled()
+        assert fetch.await_count == 2
@@ -15,65 +15,21 @@ Test Categories:
 """
 
 import pytest
-import tempfile
+import hashlib
 import os
 import zipfile
 import io
 import stat
-from unittest.mock import AsyncMock, MagicMock, patch
 
 # Import components under test
 from worker.activities.graphton.skill_writer import SkillWriter
+from tests.factories import make_skill
 
+# Payloads for TestFullPipelineIntegration.complex_artifact_zip, kept as bytes
+# so ZipFile.writestr stores them without re-encoding
 
-class TestFullPipelineIntegration:
-    """Integration tests for complete skill artifact pipeline."""
-
-    @pytest.fixture
-    def skill_with_artifact(self):
-        """Create a mock skill with artifact storage key."""
-        skill = MagicMock()
-        skill.metadata.id = "skill-integration-001"
-        skill.metadata.name = "integration-test-skill"
-        skill.metadata.slug = "test-org/integration-skill"
-        skill.spec.skill_md = """# Integration Test Skill
-
-## Description
-This skill demonstrates the full artifact pipeline.
-
-## Usage
-Run `./run.sh` to execute the skill.
-
-## Tools
-- `run.sh` - Main execution script
-- `helper.py` - Python helper module
-"""
-        skill.status.version_hash = "a1b2c3d4e5f6789012345678901234567890123456789012345678901234abcd"
-        skill.status.artifact_storage_key = "skills/test-org/integration-skill/a1b2c3d4e5f6.zip"
-        return skill
-
-    @pytest.fixture
-    def skill_without_artifact(self):
-        """Create a mock skill without artifact (SKILL.md only)."""
-        skill = MagicMock()
-        skill.metadata.id = "skill-no-artifact-002"
-        skill.metadata.name = "metadata-only-skill"
-        skill.metadata.slug = "test-org/metadata-skill"
-        skill.spec.skill_md = """# Metadata Only Skill
-
-This skill has no artifact ZIP, only SKILL.md content.
-"""
-        skill.status.version_hash = "b2c3d4e5f6789012345678901234567890123456789012345678901234abcdef"
-        skill.status.artifact_storage_key = ""  # No artifact
-        return skill
-
-    @pytest.fixture
-    def complex_artifact_zip(self) -> bytes:
-        """Create a realistic artifact ZIP with nested structure."""
-        buffer = io.BytesIO()
-        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
-            # SKILL.md - Required interface definition
-            zf.writestr("SKILL.md", """# Integration Test Skill
+# SKILL.md - Required interface definition
+_SKILL_MD = b"""# Integration Test Skill
 
 ## Description
 Full integration test skill with all artifact types.
@@ -86,15 +42,16 @@ Full integration test skill with all artifact types.
 ## Files
 - `config/settings.yaml` - Configuration
 - `data/sample.json` - Sample data
-""")
-            # Shell script (should be executable)
-            zf.writestr("run.sh", """#!/bin/bash
+"""
+
+# Scripts (should be executable)
+_RUN_SH = b"""#!/bin/bash
 set -e
 echo "Running integration skill..."
 python helper.py "$@"
-""")
-            # Python script (should be executable)
-            zf.writestr("helper.py", """#!/usr/bin/env python3
+"""
+
+_HELPER_PY = b"""#!/usr/bin/env python3
 import sys
 import json
 
@@ -104,154 +61,215 @@ def main():
 
 if __name__ == "__main__":
     sys.exit(main())
-""")
-            # JavaScript file (should be executable)
-            zf.writestr("index.js", """#!/usr/bin/env node
+"""
+
+_INDEX_JS = b"""#!/usr/bin/env node
 console.log("JavaScript runner executed");
-""")
-            # TypeScript file (should be executable)
-            zf.writestr("src/main.ts", """#!/usr/bin/env ts-node
+"""
+
+_MAIN_TS = b"""#!/usr/bin/env ts-node
 console.log("TypeScript main");
-""")
-            # Ruby script (should be executable)
-            zf.writestr("scripts/process.rb", """#!/usr/bin/env ruby
+"""
+
+_PROCESS_RB = b"""#!/usr/bin/env ruby
 puts "Ruby processor"
-""")
-            # Perl script (should be executable)
-            zf.writestr("scripts/legacy.pl", """#!/usr/bin/perl
+"""
+
+_LEGACY_PL = b"""#!/usr/bin/perl
 print "Perl legacy script\\n";
-""")
-            # Config file (should NOT be executable)
-            zf.writestr("config/settings.yaml", """version: "1.0.0"
+"""
+
+# Config, data and docs (should NOT be executable)
+_SETTINGS_YAML = b"""version: "1.0.0"
 debug: false
 features:
   - artifact_download
   - skill_injection
-""")
-            # Data file (should NOT be executable)
-            zf.writestr("data/sample.json", '{"items": [1, 2, 3]}')
-            # Nested README (should NOT be executable)
-            zf.writestr("docs/README.md", "# Documentation\n\nSee SKILL.md for usage.")
+"""
+
+_SAMPLE_JSON = b'{"items": [1, 2, 3]}'
+
+_README_MD = b"# Documentation\n\nSee SKILL.md for usage."
+
+_COMPLEX_ARTIFACT_ENTRIES = (
+    ("SKILL.md", _SKILL_MD),
+    ("run.sh", _RUN_SH),
+    ("helper.py", _HELPER_PY),
+    ("index.js", _INDEX_JS),
+    ("src/main.ts", _MAIN_TS),
+    ("scripts/process.rb", _PROCESS_RB),
+    ("scripts/legacy.pl", _LEGACY_PL),
+    ("config/settings.yaml", _SETTINGS_YAML),
+    ("data/sample.json", _SAMPLE_JSON),
+    ("docs/README.md", _README_MD),
+)
+
+
+class TestFullPipelineIntegration:
+    """Integration tests for complete skill artifact pipeline."""
+
+    @pytest.fixture
+    def skill_with_artifact(self):
+        """Create a mock skill with artifact storage key."""
+        skill = make_skill(
+            id="skill-integration-001",
+            name="integration-test-skill",
+            slug="test-org/integration-skill",
+            skill_md="""# Integration Test Skill
+
+## Description
+This skill demonstrates the full artifact pipeline.
+
+## Usage
+Run `./run.sh` to execute the skill.
+
+## Tools
+- `run.sh` - Main execution script
+- `helper.py` - Python helper module
+""",
+            version_hash="a1b2c3d4e5f6789012345678901234567890123456789012345678901234abcd",
+            artifact_storage_key="skills/test-org/integration-skill/a1b2c3d4e5f6.zip",
+        )
+        return skill
+
+    @pytest.fixture
+    def skill_without_artifact(self):
+        """Create a mock skill without artifact (SKILL.md only)."""
+        skill = make_skill(
+            id="skill-no-artifact-002",
+            name="metadata-only-skill",
+            slug="test-org/metadata-skill",
+            skill_md="""# Metadata Only Skill
+
+This skill has no artifact ZIP, only SKILL.md content.
+""",
+            version_hash="b2c3d4e5f6789012345678901234567890123456789012345678901234abcdef",
+            artifact_storage_key="",  # No artifact
+        )
+        return skill
+
+    @pytest.fixture(scope="class")
+    def complex_artifact_zip(self) -> bytes:
+        """Create a realistic artifact ZIP with nested structure (built once per class)."""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as zf:
+            for name, payload in _COMPLEX_ARTIFACT_ENTRIES:
+                zf.writestr(name, payload)
         return buffer.getvalue()
 
-    def test_full_pipeline_with_artifact(self, skill_with_artifact, complex_artifact_zip):
+    @pytest.fixture(scope="class")
+    def complex_artifact_files(self, complex_artifact_zip) -> dict[str, bytes]:
+        """Map each file in complex_artifact_zip to its contents (parsed once per class)."""
+        with zipfile.ZipFile(io.BytesIO(complex_artifact_zip)) as zf:
+            return {info.filename: zf.read(info) for info in zf.infolist() if not info.is_dir()}
+
+    def test_full_pipeline_with_artifact(
+        self, skill_with_artifact, complex_artifact_zip, complex_artifact_files, tmp_path
+    ):
         """Test complete pipeline: extract artifact → write files → generate prompt."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Setup
-            skill = skill_with_artifact
-            artifacts = {skill.metadata.id: complex_artifact_zip}
-            
-            # Execute pipeline
-            writer = SkillWriter(local_root=tmpdir)
-            skill_paths = writer.write_skills([skill], artifacts=artifacts)
-            
-            # Verify skill path returned
-            assert skill.metadata.id in skill_paths
-            expected_path = f"/bin/skills/{skill.status.version_hash}"
-            assert skill_paths[skill.metadata.id] == expected_path
-            
-            # Verify files extracted to correct location
-            local_skill_dir = f"{tmpdir}{expected_path}"
-            assert os.path.isdir(local_skill_dir)
-            
-            # Verify SKILL.md extracted from ZIP
-            skill_md_path = f"{local_skill_dir}/SKILL.md"
-            assert os.path.isfile(skill_md_path)
-            with open(skill_md_path, 'r') as f:
-                content = f.read()
-                assert "Integration Test Skill" in content
-            
-            # Verify shell script extracted and executable
-            run_sh_path = f"{local_skill_dir}/run.sh"
-            assert os.path.isfile(run_sh_path)
-            assert os.access(run_sh_path, os.X_OK), "run.sh should be executable"
-            
-            # Verify Python script executable
-            helper_py_path = f"{local_skill_dir}/helper.py"
-            assert os.path.isfile(helper_py_path)
-            assert os.access(helper_py_path, os.X_OK), "helper.py should be executable"
-            
-            # Verify JavaScript file executable
-            index_js_path = f"{local_skill_dir}/index.js"
-            assert os.path.isfile(index_js_path)
-            assert os.access(index_js_path, os.X_OK), "index.js should be executable"
-            
-            # Verify TypeScript file executable (nested)
-            main_ts_path = f"{local_skill_dir}/src/main.ts"
-            assert os.path.isfile(main_ts_path)
-            assert os.access(main_ts_path, os.X_OK), "main.ts should be executable"
-            
-            # Verify Ruby script executable
-            ruby_path = f"{local_skill_dir}/scripts/process.rb"
-            assert os.path.isfile(ruby_path)
-            assert os.access(ruby_path, os.X_OK), "process.rb should be executable"
-            
-            # Verify Perl script executable
-            perl_path = f"{local_skill_dir}/scripts/legacy.pl"
-            assert os.path.isfile(perl_path)
-            assert os.access(perl_path, os.X_OK), "legacy.pl should be executable"
-            
-            # Verify config file NOT executable (not a script)
-            config_path = f"{local_skill_dir}/config/settings.yaml"
-            assert os.path.isfile(config_path)
-            # YAML files should not be executable
-            mode = os.stat(config_path).st_mode
-            assert not (mode & stat.S_IXUSR), "settings.yaml should not be executable"
-            
-            # Verify data file NOT executable
-            data_path = f"{local_skill_dir}/data/sample.json"
-            assert os.path.isfile(data_path)
-
-    def test_full_pipeline_without_artifact_fallback(self, skill_without_artifact):
+        # Setup
+        skill = skill_with_artifact
+        artifacts = {skill.metadata.id: complex_artifact_zip}
+        
+        # Execute pipeline
+        writer = SkillWriter(local_root=str(tmp_path))
+        skill_paths = writer.write_skills([skill], artifacts=artifacts)
+        
+        # Verify skill path returned
+        assert skill.metadata.id in skill_paths
+        expected_path = f"/bin/skills/{skill.status.version_hash}"
+        assert skill_paths[skill.metadata.id] == expected_path
+        
+        # Verify files extracted to correct location
+        local_skill_dir = f"{tmp_path}{expected_path}"
+        assert os.path.isdir(local_skill_dir)
+        
+        # Collect every extracted file's mode in one walk
+        modes = {}
+        for root, _, files in os.walk(local_skill_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                modes[os.path.relpath(path, local_skill_dir)] = os.stat(path).st_mode
+        
+        # Verify SKILL.md extracted from ZIP byte-for-byte
+        assert "SKILL.md" in modes
+        expected_digest = hashlib.sha256(complex_artifact_files["SKILL.md"]).digest()
+        with open(f"{local_skill_dir}/SKILL.md", 'rb') as f:
+            assert hashlib.file_digest(f, "sha256").digest() == expected_digest
+        
+        # Verify scripts (including nested ones) extracted and executable
+        for script in (
+            "run.sh",
+            "helper.py",
+            "index.js",
+            "src/main.ts",
+            "scripts/process.rb",
+            "scripts/legacy.pl",
+        ):
+            assert script in modes, f"{script} should be extracted"
+            assert modes[script] & stat.S_IXUSR, f"{script} should be executable"
+        
+        # Verify config file NOT executable (not a script)
+        assert "config/settings.yaml" in modes
+        assert not (modes["config/settings.yaml"] & stat.S_IXUSR), "settings.yaml should not be executable"
+        
+        # Verify data file extracted
+        assert "data/sample.json" in modes
+
+    def test_full_pipeline_without_artifact_fallback(self, skill_without_artifact, tmp_path):
         """Test pipeline falls back to SKILL.md only when no artifact."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            skill = skill_without_artifact
-            
-            # Execute without artifacts
-            writer = SkillWriter(local_root=tmpdir)
-            skill_paths = writer.write_skills([skill], artifacts=None)
-            
-            # Verify skill path returned
-            assert skill.metadata.id in skill_paths
-            expected_path = f"/bin/skills/{skill.status.version_hash}"
-            assert skill_paths[skill.metadata.id] == expected_path
-            
-            # Verify SKILL.md written from spec (not from ZIP)
-            local_skill_dir = f"{tmpdir}{expected_path}"
-            skill_md_path = f"{local_skill_dir}/SKILL.md"
-            assert os.path.isfile(skill_md_path)
-            with open(skill_md_path, 'r') as f:
-                content = f.read()
-                assert "Metadata Only Skill" in content
-                assert "no artifact ZIP" in content
+        skill = skill_without_artifact
+        
+        # Execute without artifacts
+        writer = SkillWriter(local_root=str(tmp_path))
+        skill_paths = writer.write_skills([skill], artifacts=None)
+        
+        # Verify skill path returned
+        assert skill.metadata.id in skill_paths
+        expected_path = f"/bin/skills/{skill.status.version_hash}"
+        assert skill_paths[skill.metadata.id] == expected_path
+        
+        # Verify SKILL.md written from spec (not from ZIP)
+        local_skill_dir = f"{tmp_path}{expected_path}"
+        skill_md_path = f"{local_skill_dir}/SKILL.md"
+        assert os.path.isfile(skill_md_path)
+        with open(skill_md_path, 'r') as f:
+            content = f.read()
+            assert "Metadata Only Skill" in content
+            assert "no artifact ZIP" in content
 
     def test_mixed_skills_with_and_without_artifacts(
-        self, skill_with_artifact, skill_without_artifact, complex_artifact_zip
+        self, skill_with_artifact, skill_without_artifact, complex_artifact_zip,
+        complex_artifact_files, tmp_path
     ):
         """Test pipeline handles mix of skills with and without artifacts."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            skills = [skill_with_artifact, skill_without_artifact]
-            artifacts = {skill_with_artifact.metadata.id: complex_artifact_zip}
-            
-            writer = SkillWriter(local_root=tmpdir)
-            skill_paths = writer.write_skills(skills, artifacts=artifacts)
-            
-            # Both skills should have paths
-            assert len(skill_paths) == 2
-            assert skill_with_artifact.metadata.id in skill_paths
-            assert skill_without_artifact.metadata.id in skill_paths
-            
-            # Skill with artifact should have extracted files
-            artifact_skill_dir = f"{tmpdir}{skill_paths[skill_with_artifact.metadata.id]}"
-            assert os.path.isfile(f"{artifact_skill_dir}/run.sh")
-            assert os.path.isfile(f"{artifact_skill_dir}/helper.py")
-            
-            # Skill without artifact should only have SKILL.md
-            no_artifact_skill_dir = f"{tmpdir}{skill_paths[skill_without_artifact.metadata.id]}"
-            assert os.path.isfile(f"{no_artifact_skill_dir}/SKILL.md")
-            # Should not have any other files
-            files_in_dir = os.listdir(no_artifact_skill_dir)
-            assert files_in_dir == ["SKILL.md"]
+        skills = [skill_with_artifact, skill_without_artifact]
+        artifacts = {skill_with_artifact.metadata.id: complex_artifact_zip}
+        
+        writer = SkillWriter(local_root=str(tmp_path))
+        skill_paths = writer.write_skills(skills, artifacts=artifacts)
+        
+        # Both skills should have paths
+        assert len(skill_paths) == 2
+        assert skill_with_artifact.metadata.id in skill_paths
+        assert skill_without_artifact.metadata.id in skill_paths
+        
+        # Skill with artifact should have exactly the archive's files and contents
+        artifact_skill_dir = f"{tmp_path}{skill_paths[skill_with_artifact.metadata.id]}"
+        extracted_files = {}
+        for root, _, files in os.walk(artifact_skill_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                with open(path, 'rb') as f:
+                    extracted_files[os.path.relpath(path, artifact_skill_dir)] = f.read()
+        assert extracted_files == complex_artifact_files
+        
+        # Skill without artifact should only have SKILL.md
+        no_artifact_skill_dir = f"{tmp_path}{skill_paths[skill_without_artifact.metadata.id]}"
+        # Should be exactly one regular file; DirEntry carries the type, so no stat
+        with os.scandir(no_artifact_skill_dir) as it:
+            entries = [(entry.name, entry.is_file()) for entry in it]
+        assert entries == [("SKILL.md", True)]
 
 
 class TestADR001Compliance:
@@ -260,39 +278,37 @@ class TestADR001Compliance:
     @pytest.fixture
     def sample_skill(self):
         """Create a sample skill for ADR testing."""
-        skill = MagicMock()
-        skill.metadata.id = "adr-test-skill-001"
-        skill.metadata.name = "adr-compliance-skill"
-        skill.metadata.slug = "test-org/adr-skill"
-        skill.spec.skill_md = """# ADR Compliance Skill
+        skill = make_skill(
+            id="adr-test-skill-001",
+            name="adr-compliance-skill",
+            slug="test-org/adr-skill",
+            skill_md="""# ADR Compliance Skill
 
 ## Description
 Tests compliance with ADR 001.
 
 ## Commands
 - `./calculate.sh <args>` - Run calculation
-"""
-        skill.status.version_hash = "adr123abc456def789012345678901234567890123456789012345678901234"
+""",
+            version_hash="adr123abc456def789012345678901234567890123456789012345678901234",
+        )
         return skill
 
-    def test_prompt_includes_location_header(self, sample_skill):
+    @pytest.fixture
+    def skill_paths(self, sample_skill):
+        """Map the sample skill to the directory SkillWriter would use for it."""
+        return {sample_skill.metadata.id: SkillWriter()._get_skill_dir(sample_skill)}
+
+    def test_prompt_includes_location_header(self, sample_skill, skill_paths):
         """ADR Test 2: Generated prompt must contain LOCATION header."""
-        skill_paths = {
-            sample_skill.metadata.id: f"/bin/skills/{sample_skill.status.version_hash}"
-        }
-        
         prompt = SkillWriter.generate_prompt_section([sample_skill], skill_paths)
         
         # Must contain LOCATION header per ADR 001
         expected_location = f"LOCATION: /bin/skills/{sample_skill.status.version_hash}/"
         assert expected_location in prompt, f"Prompt must contain '{expected_location}'"
 
-    def test_prompt_includes_skill_md_content(self, sample_skill):
+    def test_prompt_includes_skill_md_content(self, sample_skill, skill_paths):
         """ADR Test 1: Generated prompt must contain SKILL.md text content."""
-        skill_paths = {
-            sample_skill.metadata.id: f"/bin/skills/{sample_skill.status.version_hash}"
-        }
-        
         prompt = SkillWriter.generate_prompt_section([sample_skill], skill_paths)
         
         # Must contain full SKILL.md content
@@ -300,12 +316,8 @@ Tests compliance with ADR 001.
         assert "Tests compliance with ADR 001" in prompt
         assert "./calculate.sh <args>" in prompt
 
-    def test_prompt_format_matches_adr_template(self, sample_skill):
+    def test_prompt_format_matches_adr_template(self, sample_skill, skill_paths):
         """Verify prompt format matches ADR 001 template."""
-        skill_paths = {
-            sample_skill.metadata.id: f"/bin/skills/{sample_skill.status.version_hash}"
-        }
-        
         prompt = SkillWriter.generate_prompt_section([sample_skill], skill_paths)
         
         # ADR format: ### SKILL: {name} followed by LOCATION header
@@ -316,33 +328,32 @@ Tests compliance with ADR 001.
         content_pos = prompt.find("# ADR Compliance Skill")
         assert location_pos < content_pos, "LOCATION header must precede SKILL.md content"
 
-    def test_skills_written_to_bin_skills_directory(self, sample_skill):
+    def test_skills_written_to_bin_skills_directory(self, sample_skill, tmp_path):
         """ADR Decision B: Skills must be written to /bin/skills/{version_hash}/."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            writer = SkillWriter(local_root=tmpdir)
-            skill_paths = writer.write_skills([sample_skill])
-            
-            # Path must be /bin/skills/{version_hash}
-            expected_path = f"/bin/skills/{sample_skill.status.version_hash}"
-            assert skill_paths[sample_skill.metadata.id] == expected_path
-            
-            # Actual directory must exist
-            local_path = f"{tmpdir}{expected_path}"
-            assert os.path.isdir(local_path)
+        writer = SkillWriter(local_root=str(tmp_path))
+        skill_paths = writer.write_skills([sample_skill])
+        
+        # Path must be /bin/skills/{version_hash}
+        expected_path = f"/bin/skills/{sample_skill.status.version_hash}"
+        assert skill_paths[sample_skill.metadata.id] == expected_path
+        
+        # Actual directory must exist
+        local_path = f"{tmp_path}{expected_path}"
+        assert os.path.isdir(local_path)
 
     def test_multiple_skills_generate_multiple_sections(self):
         """Test that multiple skills each get their own section."""
-        skills = []
-        skill_paths = {}
-        
-        for i in range(3):
-            skill = MagicMock()
-            skill.metadata.id = f"multi-skill-{i}"
-            skill.metadata.name = f"skill-{i}"
-            skill.spec.skill_md = f"# Skill {i} Content"
-            skill.status.version_hash = f"hash{i}00000000000000000000000000000000000000000000000000000000"
-            skills.append(skill)
-            skill_paths[skill.metadata.id] = f"/bin/skills/{skill.status.version_hash}"
+        skills = [
+            make_skill(
+                id=f"multi-skill-{i}",
+                name=f"skill-{i}",
+                skill_md=f"# Skill {i} Content",
+                version_hash=f"hash{i}00000000000000000000000000000000000000000000000000000000",
+            )
+            for i in range(3)
+        ]
+        writer = SkillWriter()
+        skill_paths = {skill.metadata.id: writer._get_skill_dir(skill) for skill in skills}
         
         prompt = SkillWriter.generate_prompt_section(skills, skill_paths)
         
@@ -356,84 +367,74 @@ Tests compliance with ADR 001.
 class TestVersionResolutionIntegration:
     """Integration tests for skill version resolution (latest/tag/hash)."""
 
-    @pytest.fixture
-    def skill_latest(self):
-        """Skill at 'latest' version."""
-        skill = MagicMock()
-        skill.metadata.id = "version-latest-001"
-        skill.metadata.name = "versioned-skill"
-        skill.metadata.slug = "test-org/versioned"
-        skill.spec.skill_md = "# Latest Version"
-        skill.spec.tag = "latest"
-        skill.status.version_hash = "latest123456789012345678901234567890123456789012345678901234ab"
-        skill.status.artifact_storage_key = "skills/test-org/versioned/latest123.zip"
-        return skill
+    # (id, skill_md, tag, version_hash) for latest / tagged / pinned-hash versions
+    VERSIONS = [
+        ("version-latest-001", "# Latest Version", "latest",
+         "latest123456789012345678901234567890123456789012345678901234ab"),
+        ("version-stable-002", "# Stable Version", "stable",
+         "stable789012345678901234567890123456789012345678901234567890ab"),
+        ("version-hash-003", "# Pinned Hash Version (Immutable)", "v1.2.3",
+         "pinned456789012345678901234567890123456789012345678901234567ab"),
+    ]
+
+    @staticmethod
+    def _versioned_skill(skill_id, skill_md, tag, version_hash):
+        return make_skill(
+            id=skill_id,
+            name="versioned-skill",
+            slug="test-org/versioned",
+            skill_md=skill_md,
+            tag=tag,
+            version_hash=version_hash,
+            artifact_storage_key=f"skills/test-org/versioned/{version_hash[:9]}.zip",
+        )
 
-    @pytest.fixture
-    def skill_tagged_stable(self):
-        """Skill at 'stable' tag."""
-        skill = MagicMock()
-        skill.metadata.id = "version-stable-002"
-        skill.metadata.name = "versioned-skill"
-        skill.metadata.slug = "test-org/versioned"
-        skill.spec.skill_md = "# Stable Version"
-        skill.spec.tag = "stable"
-        skill.status.version_hash = "stable789012345678901234567890123456789012345678901234567890ab"
-        skill.status.artifact_storage_key = "skills/test-org/versioned/stable789.zip"
-        return skill
+    @pytest.fixture(params=VERSIONS, ids=[v[2] for v in VERSIONS])
+    def versioned_skill(self, request):
+        """Skill at a 'latest', tagged, or pinned-hash version."""
+        return self._versioned_skill(*request.param)
 
-    @pytest.fixture
-    def skill_pinned_hash(self):
-        """Skill at exact hash version (immutable)."""
-        skill = MagicMock()
-        skill.metadata.id = "version-hash-003"
-        skill.metadata.name = "versioned-skill"
-        skill.metadata.slug = "test-org/versioned"
-        skill.spec.skill_md = "# Pinned Hash Version (Immutable)"
-        skill.spec.tag = "v1.2.3"
-        skill.status.version_hash = "pinned456789012345678901234567890123456789012345678901234567ab"
-        skill.status.artifact_storage_key = "skills/test-org/versioned/pinned456.zip"
-        return skill
+    def test_version_path_uses_version_hash(self, versioned_skill, tmp_path):
+        """Each resolved version is written under its own version_hash."""
+        writer = SkillWriter(local_root=str(tmp_path))
+        skill_paths = writer.write_skills([versioned_skill])
+        
+        assert skill_paths[versioned_skill.metadata.id] == (
+            f"/bin/skills/{versioned_skill.status.version_hash}"
+        )
 
-    def test_different_versions_have_different_paths(
-        self, skill_latest, skill_tagged_stable, skill_pinned_hash
-    ):
+    def test_different_versions_have_different_paths(self, tmp_path):
         """Different versions should result in different directories."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            skills = [skill_latest, skill_tagged_stable, skill_pinned_hash]
-            
-            writer = SkillWriter(local_root=tmpdir)
-            skill_paths = writer.write_skills(skills)
-            
-            # Each version should have unique path based on version_hash
-            paths = list(skill_paths.values())
-            assert len(set(paths)) == 3, "Each version should have unique path"
-            
-            # Verify paths use version_hash
-            assert skill_paths[skill_latest.metadata.id] == f"/bin/skills/{skill_latest.status.version_hash}"
-            assert skill_paths[skill_tagged_stable.metadata.id] == f"/bin/skills/{skill_tagged_stable.status.version_hash}"
-            assert skill_paths[skill_pinned_hash.metadata.id] == f"/bin/skills/{skill_pinned_hash.status.version_hash}"
-
-    def test_same_hash_reuses_directory(self):
+        skills = [self._versioned_skill(*version) for version in self.VERSIONS]
+        
+        writer = SkillWriter(local_root=str(tmp_path))
+        skill_paths = writer.write_skills(skills)
+        
+        # Each version should have unique path based on version_hash
+        paths = list(skill_paths.values())
+        assert len(set(paths)) == 3, "Each version should have unique path"
+
+    def test_same_hash_reuses_directory(self, tmp_path):
         """Skills with same version_hash should use same directory (deduplication)."""
-        skill1 = MagicMock()
-        skill1.metadata.id = "skill-a"
-        skill1.metadata.name = "skill-a"
-        skill1.spec.skill_md = "# Skill A"
-        skill1.status.version_hash = "shared123456789012345678901234567890123456789012345678901234ab"
-        
-        skill2 = MagicMock()
-        skill2.metadata.id = "skill-b"
-        skill2.metadata.name = "skill-b"
-        skill2.spec.skill_md = "# Skill B (same hash)"
-        skill2.status.version_hash = "shared123456789012345678901234567890123456789012345678901234ab"  # Same hash
-        
-        with tempfile.TemporaryDirectory() as tmpdir:
-            writer = SkillWriter(local_root=tmpdir)
-            skill_paths = writer.write_skills([skill1, skill2])
-            
-            # Both skills should have same path (based on hash)
-            assert skill_paths[skill1.metadata.id] == skill_paths[skill2.metadata.id]
+        skill1 = make_skill(
+            id="skill-a",
+            name="skill-a",
+            skill_md="# Skill A",
+            version_hash="shared123456789012345678901234567890123456789012345678901234ab",
+        )
+        
+        skill2 = make_skill(
+            id="skill-b",
+            name="skill-b",
+            skill_md="# Skill B (same hash)",
+            version_hash="shared123456789012345678901234567890123456789012345678901234ab",  # Same hash
+        )
+        
+        writer = SkillWriter(local_root=str(tmp_path))
+        skill_paths = writer.write_skills([skill1, skill2])
+        
+        # Both skills should have same path (based on hash)
+        assert skill_paths[skill1.metadata.id] == skill_paths[skill2.metadata.id]
 
 
 class TestErrorRecoveryIntegration:
@@ -442,44 +443,39 @@ class TestErrorRecoveryIntegration:
     @pytest.fixture
     def valid_skill(self):
         """Valid skill for error recovery tests."""
-        skill = MagicMock()
-        skill.metadata.id = "error-test-skill"
-        skill.metadata.name = "error-recovery-skill"
-        skill.metadata.slug = "test-org/error-skill"
-        skill.spec.skill_md = "# Error Recovery Skill"
-        skill.status.version_hash = "error123456789012345678901234567890123456789012345678901234ab"
-        skill.status.artifact_storage_key = "skills/test-org/error-skill/error123.zip"
+        skill = make_skill(
+            id="error-test-skill",
+            name="error-recovery-skill",
+            slug="test-org/error-skill",
+            skill_md="# Error Recovery Skill",
+            version_hash="error123456789012345678901234567890123456789012345678901234ab",
+            artifact_storage_key="skills/test-org/error-skill/error123.zip",
+        )
         return skill
 
-    def test_invalid_zip_raises_runtime_error(self, valid_skill):
+    def test_invalid_zip_raises_runtime_error(self, valid_skill, tmp_path):
         """Invalid ZIP file should raise RuntimeError."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            invalid_zip = b"this is not a valid zip file"
-            artifacts = {valid_skill.metadata.id: invalid_zip}
-            
-            writer = SkillWriter(local_root=tmpdir)
-            
-            with pytest.raises(RuntimeError) as exc_info:
-                writer.write_skills([valid_skill], artifacts=artifacts)
-            
-            assert "Invalid ZIP file" in str(exc_info.value)
-
-    def test_empty_zip_handles_gracefully(self, valid_skill):
+        invalid_zip = b"this is not a valid zip file"
+        artifacts = {valid_skill.metadata.id: invalid_zip}
+        
+        writer = SkillWriter(local_root=str(tmp_path))
+        
+        with pytest.raises(RuntimeError) as exc_info:
+            writer.write_skills([valid_skill], artifacts=artifacts)
+        
+        assert "Invalid ZIP file" in str(exc_info.value)
+        # The archive is rejected before the skill directory is created
+        assert not os.path.exists(f"{tmp_path}{writer._get_skill_dir(valid_skill)}")
+
+    def test_empty_zip_handles_gracefully(self, valid_skill, empty_artifact_zip, tmp_path):
         """Empty ZIP file should extract without error."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create empty but valid ZIP
-            buffer = io.BytesIO()
-            with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
-                pass  # Empty ZIP
-            empty_zip = buffer.getvalue()
-            
-            artifacts = {valid_skill.metadata.id: empty_zip}
-            
-            writer = SkillWriter(local_root=tmpdir)
-            skill_paths = writer.write_skills([valid_skill], artifacts=artifacts)
-            
-            # Should complete without error
-            assert valid_skill.metadata.id in skill_paths
+        artifacts = {valid_skill.metadata.id: empty_artifact_zip}
+        
+        writer = SkillWriter(local_root=str(tmp_path))
+        skill_paths = writer.write_skills([valid_skill], artifacts=artifacts)
+        
+        # Should complete without error
+        assert valid_skill.metadata.id in skill_paths
 
     def test_no_sandbox_or_local_root_raises_error(self, valid_skill):
         """SkillWriter without sandbox or local_root should raise error."""
@@ -490,31 +486,31 @@ class TestErrorRecoveryIntegration:
         
         assert "No sandbox or local_root configured" in str(exc_info.value)
 
-    def test_artifact_download_failure_allows_fallback(self):
+    def test_artifact_download_failure_allows_fallback(self, tmp_path):
         """
         Simulate the execute_graphton fallback behavior:
         When artifact download fails, skill should still work with SKILL.md only.
         """
-        skill = MagicMock()
-        skill.metadata.id = "fallback-skill"
-        skill.metadata.name = "fallback-skill"
-        skill.spec.skill_md = "# Fallback Skill Content"
-        skill.status.version_hash = "fallback1234567890123456789012345678901234567890123456789012ab"
-        skill.status.artifact_storage_key = "skills/test/fallback.zip"  # Has key but download will "fail"
-        
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Don't provide artifact (simulating download failure)
-            writer = SkillWriter(local_root=tmpdir)
-            skill_paths = writer.write_skills([skill], artifacts=None)
-            
-            # Should succeed with SKILL.md fallback
-            assert skill.metadata.id in skill_paths
-            
-            # SKILL.md should exist from spec (not from artifact)
-            skill_md_path = f"{tmpdir}{skill_paths[skill.metadata.id]}/SKILL.md"
-            assert os.path.isfile(skill_md_path)
-            with open(skill_md_path, 'r') as f:
-                assert "Fallback Skill Content" in f.read()
+        skill = make_skill(
+            id="fallback-skill",
+            name="fallback-skill",
+            skill_md="# Fallback Skill Content",
+            version_hash="fallback1234567890123456789012345678901234567890123456789012ab",
+            artifact_storage_key="skills/test/fallback.zip",  # Has key but download will "fail"
+        )
+        
+        # Don't provide artifact (simulating download failure)
+        writer = SkillWriter(local_root=str(tmp_path))
+        skill_paths = writer.write_skills([skill], artifacts=None)
+        
+        # Should succeed with SKILL.md fallback
+        assert skill.metadata.id in skill_paths
+        
+        # SKILL.md should exist from spec (not from artifact)
+        skill_md_path = f"{tmp_path}{skill_paths[skill.metadata.id]}/SKILL.md"
+        assert os.path.isfile(skill_md_path)
+        with open(skill_md_path, 'r') as f:
+            assert "Fallback Skill Content" in f.read()
 
 
 class TestPromptGenerationIntegration:
@@ -527,11 +523,12 @@ class TestPromptGenerationIntegration:
 
     def test_prompt_starts_with_section_header(self):
         """Prompt should start with Available Skills header."""
-        skill = MagicMock()
-        skill.metadata.id = "header-test"
-        skill.metadata.name = "test-skill"
-        skill.spec.skill_md = "# Test"
-        skill.status.version_hash = "header123456789012345678901234567890123456789012345678901234ab"
+        skill = make_skill(
+            id="header-test",
+            name="test-skill",
+            skill_md="# Test",
+            version_hash="header123456789012345678901234567890123456789012345678901234ab",
+        )
         
         prompt = SkillWriter.generate_prompt_section(
             [skill], 
@@ -543,11 +540,12 @@ class TestPromptGenerationIntegration:
 
     def test_prompt_handles_missing_skill_path_gracefully(self):
         """Skill not in paths dict should use fallback path."""
-        skill = MagicMock()
-        skill.metadata.id = "orphan-skill"
-        skill.metadata.name = "orphan"
-        skill.spec.skill_md = "# Orphan"
-        skill.status.version_hash = "orphan123456789012345678901234567890123456789012345678901234ab"
+        skill = make_skill(
+            id="orphan-skill",
+            name="orphan",
+            skill_md="# Orphan",
+            version_hash="orphan123456789012345678901234567890123456789012345678901234ab",
+        )
         
         # Don't include skill in paths (missing entry)
         prompt = SkillWriter.generate_prompt_section([skill], {})
@@ -557,10 +555,10 @@ class TestPromptGenerationIntegration:
 
     def test_prompt_preserves_skill_md_formatting(self):
         """SKILL.md content should preserve markdown formatting."""
-        skill = MagicMock()
-        skill.metadata.id = "format-test"
-        skill.metadata.name = "formatted-skill"
-        skill.spec.skill_md = """# Formatted Skill
+        skill = make_skill(
+            id="format-test",
+            name="formatted-skill",
+            skill_md="""# Formatted Skill
 
 ## Code Example
 ```python
@@ -576,8 +574,9 @@ def hello():
 | Col1 | Col2 |
 |------|------|
 | A    | B    |
-"""
-        skill.status.version_hash = "format123456789012345678901234567890123456789012345678901234ab"
+""",
+            version_hash="format123456789012345678901234567890123456789012345678901234ab",
+        )
         
         prompt = SkillWriter.generate_prompt_section(
             [skill],
@@ -596,22 +595,24 @@ class TestPathResolution:
 
     def test_skill_with_hash_uses_hash_for_path(self):
         """Skill with version_hash should use hash for directory name."""
-        skill = MagicMock()
-        skill.metadata.slug = "org/skill"
-        skill.status.version_hash = "abc12345678901234567890123456789012345678901234567890123456789a"
+        skill = make_skill(
+            slug="org/skill",
+            version_hash="abc12345678901234567890123456789012345678901234567890123456789a",
+        )
         
-        writer = SkillWriter(local_root="/tmp")
+        writer = SkillWriter()
         path = writer._get_skill_dir(skill)
         
         assert path == f"/bin/skills/{skill.status.version_hash}"
 
     def test_skill_without_hash_falls_back_to_slug(self):
         """Skill without version_hash should fall back to slugified name."""
-        skill = MagicMock()
-        skill.metadata.slug = "test-org/my-skill"
-        skill.status.version_hash = ""  # Empty hash
+        skill = make_skill(
+            slug="test-org/my-skill",
+            version_hash="",  # Empty hash
+        )
         
-        writer = SkillWriter(local_root="/tmp")
+        writer = SkillWriter()
         path = writer._get_skill_dir(skill)
         
         # Slug with / replaced by _
@@ -619,5 +620,5 @@ class TestPathResolution:
 
     def test_skill_dir_base_path_is_bin_skills(self):
         """All skill paths should be under /bin/skills/."""
-        writer = SkillWriter(local_root="/tmp")
+        writer = SkillWriter()
         assert writer.skills_base == "/bin/skills"
@@ -1,5 +1,6 @@
 """Unit tests for SkillClient.get_artifact() method."""
 
+import hashlib
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 import grpc
@@ -16,25 +17,28 @@ class TestSkillClientGetArtifact:
         return response
 
     @pytest.fixture
-    def skill_client_with_mock_stub(self, mock_skill_stub):
+    def skill_client_with_mock_stub(self, mock_skill_stub, tmp_path):
         """Create SkillClient with mocked stub and channel."""
         with patch('grpc_client.skill_client.Config') as mock_config_class, \
-             patch('grpc_client.skill_client.grpc.aio') as mock_grpc_aio, \
+             patch('grpc_client.skill_client.get_channel_pool') as mock_get_channel_pool, \
              patch('grpc_client.skill_client.query_pb2_grpc') as mock_pb2_grpc:
             
             # Mock config
             mock_config = MagicMock()
-            mock_config.stigmer_backend_endpoint = "localhost:9090"
+            mock_config.skill_cache_ttl = 60.0
+            mock_config.skill_artifact_cache_dir = str(tmp_path / "artifacts")
+            mock_config.skill_artifact_cache_max_bytes = 1024 * 1024
             mock_config_class.load_from_env.return_value = mock_config
             
             # Mock channel
             mock_channel = MagicMock()
-            mock_grpc_aio.insecure_channel.return_value = mock_channel
+            mock_get_channel_pool.return_value = [mock_channel]
             
             # Mock stub creation
             mock_pb2_grpc.SkillQueryControllerStub.return_value = mock_skill_stub
             
             from grpc_client.skill_client import SkillClient
+            SkillClient.get_artifact.cache_clear()
             client = SkillClient(api_key="test-api-key")
             
             return client
@@ -60,6 +64,43 @@ class TestSkillClientGetArtifact:
         request = call_args[0][0]
         assert request.artifact_storage_key == storage_key
 
+    @pytest.mark.asyncio
+    async def test_get_artifact_is_cached_by_storage_key(
+        self, skill_client_with_mock_stub, mock_skill_stub, mock_response
+    ):
+        """Test repeated downloads of the same storage key hit the cache."""
+        # Arrange
+        storage_key = "skills/test-org/test-skill/abc123.zip"
+        mock_skill_stub.getArtifact.return_value = mock_response
+        
+        # Act
+        first = await skill_client_with_mock_stub.get_artifact(storage_key)
+        second = await skill_client_with_mock_stub.get_artifact(storage_key)
+        
+        # Assert
+        assert first == second
+        mock_skill_stub.getArtifact.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_artifact_reads_from_disk_cache(
+        self, skill_client_with_mock_stub, mock_skill_stub, mock_response, sample_artifact_zip
+    ):
+        """Test an artifact downloaded once is served from disk afterwards."""
+        from grpc_client.skill_client import SkillClient
+        
+        # Arrange - disk entries are keyed and verified by the artifact's hash
+        storage_key = f"skills/{hashlib.sha256(sample_artifact_zip).hexdigest()}.zip"
+        mock_skill_stub.getArtifact.return_value = mock_response
+        await skill_client_with_mock_stub.get_artifact(storage_key)
+        
+        # Act - drop the in-memory entry so only the disk cache can answer
+        SkillClient.get_artifact.cache_clear()
+        result = await skill_client_with_mock_stub.get_artifact(storage_key)
+        
+        # Assert
+        assert result == sample_artifact_zip
+        mock_skill_stub.getArtifact.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_get_artifact_not_found(self, skill_client_with_mock_stub, mock_skill_stub):
         """Test artifact not found raises ValueError."""
@@ -155,18 +196,20 @@ class TestSkillClientListByRefs:
     def skill_client_with_mock_stub(self, mock_skill_stub):
         """Create SkillClient with mocked stub."""
         with patch('grpc_client.skill_client.Config') as mock_config_class, \
-             patch('grpc_client.skill_client.grpc.aio') as mock_grpc_aio, \
+             patch('grpc_client.skill_client.get_channel_pool') as mock_get_channel_pool, \
              patch('grpc_client.skill_client.query_pb2_grpc') as mock_pb2_grpc:
             
             mock_config = MagicMock()
-            mock_config.stigmer_backend_endpoint = "localhost:9090"
+            mock_config.skill_cache_ttl = 60.0
+            mock_config.skill_artifact_cache_dir = None
             mock_config_class.load_from_env.return_value = mock_config
             
             mock_channel = MagicMock()
-            mock_grpc_aio.insecure_channel.return_value = mock_channel
+            mock_get_channel_pool.return_value = [mock_channel]
             mock_pb2_grpc.SkillQueryControllerStub.return_value = mock_skill_stub
             
             from grpc_client.skill_client import SkillClient
+            SkillClient.get_by_reference.cache_clear()
             return SkillClient(api_key="test-api-key")
 
     @pytest.mark.asyncio
@@ -194,3 +237,150 @@ class TestSkillClientListByRefs:
         # Assert
         assert len(result) == 2
         assert mock_skill_stub.getByReference.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_list_by_refs_fetches_duplicates_once(
+        self, skill_client_with_mock_stub, mock_skill_stub, mock_skill
+    ):
+        """Test duplicate refs issue one RPC and keep their result positions."""
+        from ai.stigmer.commons.apiresource.io_pb2 import ApiResourceReference
+        
+        # Arrange
+        mock_skill_stub.getByReference.return_value = mock_skill
+        ref_a = ApiResourceReference(org="test-org", slug="skill-a")
+        ref_b = ApiResourceReference(org="test-org", slug="skill-b")
+        
+        # Act
+        result = await skill_client_with_mock_stub.list_by_refs(
+            [ref_a, ref_b, ApiResourceReference(org="test-org", slug="skill-a")]
+        )
+        
+        # Assert
+        assert len(result) == 3
+        assert mock_skill_stub.getByReference.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_list_by_refs_fails_fast(
+        self, skill_client_with_mock_stub, mock_skill_stub
+    ):
+        """Test a not-found ref cancels the other in-flight fetches."""
+        import asyncio
+        from ai.stigmer.commons.apiresource.io_pb2 import ApiResourceReference
+        
+        # Arrange
+        not_found = grpc.aio.AioRpcError(
+            code=grpc.StatusCode.NOT_FOUND,
+            initial_metadata=None,
+            trailing_metadata=None,
+            details="Skill not found",
+            debug_error_string=None
+        )
+        hanging = asyncio.Event()
+        
+        async def get_by_reference(ref, **kwargs):
+            if ref.slug == "missing":
+                raise not_found
+            await hanging.wait()
+        
+        mock_skill_stub.getByReference.side_effect = get_by_reference
+        refs = [
+            ApiResourceReference(org="test-org", slug="slow"),
+            ApiResourceReference(org="test-org", slug="missing"),
+        ]
+        
+        # Act / Assert - returns without waiting on the hanging fetch
+        with pytest.raises(ValueError, match="missing"):
+            await asyncio.wait_for(skill_client_with_mock_stub.list_by_refs(refs), timeout=1)
+
+
+class TestSkillClientIterByIds:
+    """Tests for SkillClient.iter_by_ids() method."""
+
+    @pytest.fixture
+    def skill_client_with_mock_stub(self, mock_skill_stub):
+        """Create SkillClient with mocked stub."""
+        with patch('grpc_client.skill_client.Config') as mock_config_class, \
+             patch('grpc_client.skill_client.get_channel_pool') as mock_get_channel_pool, \
+             patch('grpc_client.skill_client.query_pb2_grpc') as mock_pb2_grpc:
+            
+            mock_config = MagicMock()
+            mock_config.skill_cache_ttl = 60.0
+            mock_config.skill_artifact_cache_dir = None
+            mock_config_class.load_from_env.return_value = mock_config
+            
+            mock_get_channel_pool.return_value = [MagicMock()]
+            mock_pb2_grpc.SkillQueryControllerStub.return_value = mock_skill_stub
+            
+            from grpc_client.skill_client import SkillClient
+            SkillClient.get.cache_clear()
+            return SkillClient(api_key="test-api-key")
+
+    @pytest.mark.asyncio
+    async def test_iter_by_ids_yields_in_completion_order(
+        self, skill_client_with_mock_stub, mock_skill_stub
+    ):
+        """Test fast fetches are yielded before slow ones, duplicates once."""
+        import asyncio
+        
+        # Arrange
+        slow_released = asyncio.Event()
+        
+        async def get(request, **kwargs):
+            if request.value == "slow":
+                await slow_released.wait()
+            return request.value
+        
+        mock_skill_stub.get.side_effect = get
+        
+        # Act
+        results = []
+        async for skill in skill_client_with_mock_stub.iter_by_ids(["slow", "fast", "slow"]):
+            results.append(skill)
+            slow_released.set()
+        
+        # Assert
+        assert results == ["fast", "slow"]
+        assert mock_skill_stub.get.call_count == 2
+
+
+class TestSkillClientWarmup:
+    """Tests for SkillClient.warmup() method."""
+
+    @pytest.fixture
+    def mock_channel(self):
+        channel = MagicMock()
+        channel.channel_ready = AsyncMock()
+        return channel
+
+    @pytest.fixture
+    def skill_client(self, mock_channel):
+        """Create SkillClient over a single mocked channel."""
+        with patch('grpc_client.skill_client.Config') as mock_config_class, \
+             patch('grpc_client.skill_client.get_channel_pool') as mock_get_channel_pool, \
+             patch('grpc_client.skill_client.query_pb2_grpc'):
+            
+            mock_config = MagicMock()
+            mock_config.skill_artifact_cache_dir = None
+            mock_config_class.load_from_env.return_value = mock_config
+            mock_get_channel_pool.return_value = [mock_channel]
+            
+            from grpc_client.skill_client import SkillClient
+            return SkillClient(api_key="test-api-key")
+
+    @pytest.mark.asyncio
+    async def test_warmup_waits_for_channels(self, skill_client, mock_channel):
+        """Test warmup waits for each pooled channel to connect."""
+        await skill_client.warmup()
+        mock_channel.channel_ready.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_warmup_timeout_is_not_fatal(self, skill_client, mock_channel):
+        """Test an unreachable backend doesn't fail warmup."""
+        import asyncio
+        
+        async def never_ready():
+            await asyncio.sleep(10)
+        
+        mock_channel.channel_ready.side_effect = never_ready
+        
+        await skill_client.warmup(timeout=0.01)
@@ -4,154 +4,202 @@ import pytest
 from unittest.mock import MagicMock, patch
 import os
 import stat
-import tempfile
 import zipfile
 import io
 
 from worker.activities.graphton.skill_writer import SkillWriter
 
 
+def _stat_or_none(path):
+    """Return os.stat(path), or None if the path doesn't exist."""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
 class TestSkillWriterExtractArtifactLocal:
     """Tests for SkillWriter._extract_artifact_local() method."""
 
-    def test_extract_basic_zip(self, sample_artifact_zip):
+    @pytest.fixture
+    def writer(self):
+        """SkillWriter for calling _extract_artifact_local directly."""
+        return SkillWriter()
+
+    def test_extract_basic_zip(self, writer, sample_artifact_zip, tmp_path):
         """Test extracting a basic ZIP with SKILL.md and scripts."""
-        writer = SkillWriter(local_root="/tmp/test")
+        # Act
+        writer._extract_artifact_local(sample_artifact_zip, str(tmp_path))
         
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Act
-            writer._extract_artifact_local(sample_artifact_zip, tmpdir)
-            
-            # Assert - files exist
-            assert os.path.exists(os.path.join(tmpdir, "SKILL.md"))
-            assert os.path.exists(os.path.join(tmpdir, "run.sh"))
-            assert os.path.exists(os.path.join(tmpdir, "main.py"))
-            assert os.path.exists(os.path.join(tmpdir, "config.json"))
-            
-            # Assert - content is correct
-            with open(os.path.join(tmpdir, "SKILL.md")) as f:
-                content = f.read()
-                assert "Test Skill" in content
+        # Assert - files exist
+        assert os.path.exists(os.path.join(tmp_path, "SKILL.md"))
+        assert os.path.exists(os.path.join(tmp_path, "run.sh"))
+        assert os.path.exists(os.path.join(tmp_path, "main.py"))
+        assert os.path.exists(os.path.join(tmp_path, "config.json"))
+        
+        # Assert - content is correct
+        with open(os.path.join(tmp_path, "SKILL.md")) as f:
+            content = f.read()
+            assert "Test Skill" in content
 
-    def test_extract_makes_scripts_executable(self, sample_artifact_zip):
+    def test_extract_makes_scripts_executable(self, writer, sample_artifact_zip, tmp_path):
         """Test that script files are made executable."""
-        writer = SkillWriter(local_root="/tmp/test")
+        # Act
+        writer._extract_artifact_local(sample_artifact_zip, str(tmp_path))
         
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Act
-            writer._extract_artifact_local(sample_artifact_zip, tmpdir)
-            
-            # Assert - scripts are executable
-            sh_path = os.path.join(tmpdir, "run.sh")
-            py_path = os.path.join(tmpdir, "main.py")
-            json_path = os.path.join(tmpdir, "config.json")
-            
-            sh_mode = os.stat(sh_path).st_mode
-            py_mode = os.stat(py_path).st_mode
-            json_mode = os.stat(json_path).st_mode
-            
-            # Shell script should be executable
-            assert sh_mode & stat.S_IXUSR, "run.sh should be executable"
-            assert sh_mode & stat.S_IXGRP, "run.sh should be group executable"
-            assert sh_mode & stat.S_IXOTH, "run.sh should be other executable"
-            
-            # Python script should be executable
-            assert py_mode & stat.S_IXUSR, "main.py should be executable"
-            
-            # JSON config should NOT be executable (or at least we don't explicitly set it)
-            # Note: We don't explicitly remove execute bits, so this may vary by umask
+        # Assert - scripts are executable
+        sh_mode = os.stat(os.path.join(tmp_path, "run.sh")).st_mode
+        py_mode = os.stat(os.path.join(tmp_path, "main.py")).st_mode
+        
+        # Shell script should be executable
+        assert sh_mode & stat.S_IXUSR, "run.sh should be executable"
+        assert sh_mode & stat.S_IXGRP, "run.sh should be group executable"
+        assert sh_mode & stat.S_IXOTH, "run.sh should be other executable"
+        
+        # Python script should be executable
+        assert py_mode & stat.S_IXUSR, "main.py should be executable"
+        
+        # JSON config should NOT be executable (or at least we don't explicitly set it)
+        # Note: We don't explicitly remove execute bits, so this may vary by umask
 
-    def test_extract_nested_directories(self, sample_artifact_zip_nested):
+    def test_extract_nested_directories(self, writer, sample_artifact_zip_nested, tmp_path):
         """Test extracting ZIP with nested directories."""
-        writer = SkillWriter(local_root="/tmp/test")
+        # Act
+        writer._extract_artifact_local(sample_artifact_zip_nested, str(tmp_path))
         
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Act
-            writer._extract_artifact_local(sample_artifact_zip_nested, tmpdir)
-            
-            # Assert - nested files exist
-            assert os.path.exists(os.path.join(tmpdir, "SKILL.md"))
-            assert os.path.exists(os.path.join(tmpdir, "src", "main.py"))
-            assert os.path.exists(os.path.join(tmpdir, "scripts", "run.sh"))
-            assert os.path.exists(os.path.join(tmpdir, "data", "config.yaml"))
+        # Assert - nested files exist; one stat per file also gives the exec bits
+        for rel_path in ("SKILL.md", "src/main.py", "scripts/run.sh", "data/config.yaml"):
+            st = _stat_or_none(os.path.join(tmp_path, rel_path))
+            assert st is not None and stat.S_ISREG(st.st_mode), f"{rel_path} should be extracted"
             
             # Assert - nested scripts are executable
-            nested_py = os.path.join(tmpdir, "src", "main.py")
-            nested_sh = os.path.join(tmpdir, "scripts", "run.sh")
-            
-            assert os.stat(nested_py).st_mode & stat.S_IXUSR
-            assert os.stat(nested_sh).st_mode & stat.S_IXUSR
+            if rel_path.endswith((".py", ".sh")):
+                assert st.st_mode & stat.S_IXUSR, f"{rel_path} should be executable"
 
-    def test_extract_invalid_zip_raises_error(self):
+    def test_extract_deflated_zip(self, writer, tmp_path):
+        """Test extracting a DEFLATE-compressed ZIP."""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+            zf.writestr("SKILL.md", "# Compressed Skill\n" * 50)
+            zf.writestr("run.sh", "#!/bin/bash\necho 'compressed'")
+        
+        # Act
+        writer._extract_artifact_local(buffer.getvalue(), str(tmp_path))
+        
+        # Assert
+        with open(os.path.join(tmp_path, "SKILL.md")) as f:
+            assert f.read() == "# Compressed Skill\n" * 50
+        assert os.stat(os.path.join(tmp_path, "run.sh")).st_mode & stat.S_IXUSR
+
+    def test_extract_invalid_zip_raises_error(self, writer, tmp_path):
         """Test that invalid ZIP data raises RuntimeError."""
-        writer = SkillWriter(local_root="/tmp/test")
+        # Act & Assert
+        with pytest.raises(RuntimeError) as exc_info:
+            writer._extract_artifact_local(b"not a valid zip file", str(tmp_path))
         
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Act & Assert
-            with pytest.raises(RuntimeError) as exc_info:
-                writer._extract_artifact_local(b"not a valid zip file", tmpdir)
-            
-            assert "Invalid ZIP file" in str(exc_info.value)
+        assert "Invalid ZIP file" in str(exc_info.value)
 
-    def test_extract_empty_zip(self):
-        """Test extracting an empty ZIP file."""
-        writer = SkillWriter(local_root="/tmp/test")
+    def test_extract_large_zip_in_parallel(self, writer, tmp_path):
+        """Test that archives above the parallel threshold extract every entry."""
+        count = SkillWriter.PARALLEL_EXTRACT_MIN_ENTRIES * 2
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+            for i in range(count):
+                zf.writestr(f"scripts/run_{i}.sh", f"#!/bin/bash\necho {i}\n" * 100)
+        
+        # Act
+        writer._extract_artifact_local(buffer.getvalue(), str(tmp_path))
         
-        # Create empty ZIP
+        # Assert - every entry has its own content and is executable
+        for i in range(count):
+            path = os.path.join(tmp_path, "scripts", f"run_{i}.sh")
+            with open(path) as f:
+                assert f.read() == f"#!/bin/bash\necho {i}\n" * 100
+            assert os.stat(path).st_mode & stat.S_IXUSR
+
+    def test_extract_rejects_path_traversal(self, writer, tmp_path):
+        """Test that entries resolving outside the target directory are rejected."""
         buffer = io.BytesIO()
         with zipfile.ZipFile(buffer, 'w') as zf:
-            pass  # Empty ZIP
-        empty_zip = buffer.getvalue()
+            zf.writestr("../escaped.sh", "#!/bin/bash\necho 'escaped'")
+        target_dir = tmp_path / "skill"
         
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Act - should succeed without error
-            writer._extract_artifact_local(empty_zip, tmpdir)
-            
-            # Assert - directory is empty (except for what the OS might add)
-            files = [f for f in os.listdir(tmpdir) if not f.startswith('.')]
-            assert len(files) == 0
+        # Act & Assert
+        with pytest.raises(RuntimeError) as exc_info:
+            writer._extract_artifact_local(buffer.getvalue(), str(target_dir))
+        
+        assert "escapes skill directory" in str(exc_info.value)
+        assert not (tmp_path / "escaped.sh").exists()
+
+    def test_extract_empty_zip(self, writer, empty_artifact_zip, tmp_path):
+        """Test extracting an empty ZIP file."""
+        # Act - should succeed without error
+        writer._extract_artifact_local(empty_artifact_zip, str(tmp_path))
+        
+        # Assert - directory is empty (except for what the OS might add)
+        with os.scandir(tmp_path) as it:
+            files = [entry.name for entry in it if not entry.name.startswith('.')]
+        assert len(files) == 0
+
+
+class TestSkillWriterIsExecutable:
+    """Tests for SkillWriter._is_executable()."""
+
+    @pytest.mark.parametrize("name,expected", [
+        ("run.sh", True),
+        ("helper.py", True),
+        ("index.js", True),
+        ("src/main.ts", True),
+        ("scripts/process.rb", True),
+        ("scripts/legacy.pl", True),
+        ("SKILL.md", False),
+        ("config/settings.yaml", False),
+        ("data.json", False),
+        ("Makefile", False),
+    ])
+    def test_is_executable(self, name, expected):
+        """Test that only known script extensions are marked executable."""
+        assert SkillWriter._is_executable(name) is expected
 
 
 class TestSkillWriterWriteSkillsLocal:
     """Tests for SkillWriter._write_skills_local() method."""
 
-    def test_write_skills_without_artifacts(self, mock_skill):
+    def test_write_skills_without_artifacts(self, mock_skill, tmp_path):
         """Test writing skills without artifacts (backward compatibility)."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            writer = SkillWriter(local_root=tmpdir)
-            
-            # Act
-            result = writer.write_skills([mock_skill])
-            
-            # Assert
-            assert mock_skill.metadata.id in result
-            
-            # Verify SKILL.md was written
-            expected_path = f"{tmpdir}/bin/skills/{mock_skill.status.version_hash}/SKILL.md"
-            assert os.path.exists(expected_path)
-            
-            with open(expected_path) as f:
-                content = f.read()
-                assert content == mock_skill.spec.skill_md
+        writer = SkillWriter(local_root=str(tmp_path))
+        
+        # Act
+        result = writer.write_skills([mock_skill])
+        
+        # Assert
+        assert mock_skill.metadata.id in result
+        
+        # Verify SKILL.md was written
+        expected_path = f"{tmp_path}/bin/skills/{mock_skill.status.version_hash}/SKILL.md"
+        assert os.path.exists(expected_path)
+        
+        with open(expected_path) as f:
+            content = f.read()
+            assert content == mock_skill.spec.skill_md
 
-    def test_write_skills_with_artifacts(self, mock_skill, sample_artifact_zip):
+    def test_write_skills_with_artifacts(self, mock_skill, sample_artifact_zip, tmp_path):
         """Test writing skills with artifacts."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            writer = SkillWriter(local_root=tmpdir)
-            
-            artifacts = {mock_skill.metadata.id: sample_artifact_zip}
-            
-            # Act
-            result = writer.write_skills([mock_skill], artifacts=artifacts)
-            
-            # Assert
-            assert mock_skill.metadata.id in result
-            
-            # Verify artifact was extracted (not just SKILL.md written)
-            skill_dir = f"{tmpdir}/bin/skills/{mock_skill.status.version_hash}"
-            assert os.path.exists(os.path.join(skill_dir, "SKILL.md"))
-            assert os.path.exists(os.path.join(skill_dir, "run.sh"))
-            assert os.path.exists(os.path.join(skill_dir, "main.py"))
+        writer = SkillWriter(local_root=str(tmp_path))
+        
+        artifacts = {mock_skill.metadata.id: sample_artifact_zip}
+        
+        # Act
+        result = writer.write_skills([mock_skill], artifacts=artifacts)
+        
+        # Assert
+        assert mock_skill.metadata.id in result
+        
+        # Verify artifact was extracted (not just SKILL.md written)
+        skill_dir = f"{tmp_path}/bin/skills/{mock_skill.status.version_hash}"
+        assert os.path.exists(os.path.join(skill_dir, "SKILL.md"))
+        assert os.path.exists(os.path.join(skill_dir, "run.sh"))
+        assert os.path.exists(os.path.join(skill_dir, "main.py"))
 
     def test_write_skills_empty_list(self):
         """Test writing empty skill list."""
@@ -161,21 +209,20 @@ class TestSkillWriterWriteSkillsLocal:
         
         assert result == {}
 
-    def test_write_skills_fallback_to_slug_when_no_hash(self, mock_skill_no_hash):
+    def test_write_skills_fallback_to_slug_when_no_hash(self, mock_skill_no_hash, tmp_path):
         """Test skill directory uses slug when version_hash is empty."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            writer = SkillWriter(local_root=tmpdir)
-            
-            # Act
-            result = writer.write_skills([mock_skill_no_hash])
-            
-            # Assert - should use slug-based path (with / replaced by _)
-            assert mock_skill_no_hash.metadata.id in result
-            
-            # The path should contain the slug (normalized)
-            expected_slug = mock_skill_no_hash.metadata.slug.replace("/", "_")
-            expected_dir = f"{tmpdir}/bin/skills/{expected_slug}"
-            assert os.path.exists(expected_dir)
+        writer = SkillWriter(local_root=str(tmp_path))
+        
+        # Act
+        result = writer.write_skills([mock_skill_no_hash])
+        
+        # Assert - should use slug-based path (with / replaced by _)
+        assert mock_skill_no_hash.metadata.id in result
+        
+        # The path should contain the slug (normalized)
+        expected_slug = mock_skill_no_hash.metadata.slug.replace("/", "_")
+        expected_dir = f"{tmp_path}/bin/skills/{expected_slug}"
+        assert os.path.exists(expected_dir)
 
     def test_write_skills_no_sandbox_or_local_root_raises(self, mock_skill):
         """Test that missing both sandbox and local_root raises error."""
@@ -186,18 +233,58 @@ class TestSkillWriterWriteSkillsLocal:
         
         assert "No sandbox or local_root configured" in str(exc_info.value)
 
-    def test_write_multiple_skills(self, mock_skill, mock_skill_no_hash):
+    def test_write_multiple_skills(self, mock_skill, mock_skill_no_hash, tmp_path):
         """Test writing multiple skills at once."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            writer = SkillWriter(local_root=tmpdir)
-            
-            # Act
+        writer = SkillWriter(local_root=str(tmp_path))
+        
+        # Act
+        result = writer.write_skills([mock_skill, mock_skill_no_hash])
+        
+        # Assert
+        assert len(result) == 2
+        assert mock_skill.metadata.id in result
+        assert mock_skill_no_hash.metadata.id in result
+
+    def test_write_skill_md_only_skills_inline(self, mock_skill, mock_skill_no_hash, tmp_path):
+        """Test that skills without artifacts are written without a thread pool."""
+        writer = SkillWriter(local_root=str(tmp_path))
+        
+        # Act
+        with patch("worker.activities.graphton.skill_writer.ThreadPoolExecutor") as pool:
             result = writer.write_skills([mock_skill, mock_skill_no_hash])
-            
-            # Assert
-            assert len(result) == 2
-            assert mock_skill.metadata.id in result
-            assert mock_skill_no_hash.metadata.id in result
+        
+        # Assert
+        pool.assert_not_called()
+        with open(f"{tmp_path}{result[mock_skill.metadata.id]}/SKILL.md", encoding='utf-8') as f:
+            assert f.read() == mock_skill.spec.skill_md
+
+    def test_write_multiple_skills_with_artifacts_concurrently(
+        self, mock_skill, mock_skill_no_hash, sample_artifact_zip, sample_artifact_zip_nested, tmp_path
+    ):
+        """Test that skills extracted in parallel land in their own directories."""
+        writer = SkillWriter(local_root=str(tmp_path))
+        artifacts = {
+            mock_skill.metadata.id: sample_artifact_zip,
+            mock_skill_no_hash.metadata.id: sample_artifact_zip_nested,
+        }
+        
+        # Act
+        result = writer.write_skills([mock_skill, mock_skill_no_hash], artifacts=artifacts)
+        
+        # Assert - paths keep input order and each artifact went to its own skill
+        assert list(result) == [mock_skill.metadata.id, mock_skill_no_hash.metadata.id]
+        assert os.path.isfile(f"{tmp_path}{result[mock_skill.metadata.id]}/run.sh")
+        assert os.path.isfile(f"{tmp_path}{result[mock_skill_no_hash.metadata.id]}/scripts/run.sh")
+
+    def test_write_multiple_skills_propagates_worker_error(self, mock_skill, mock_skill_no_hash, tmp_path):
+        """Test that a failed extraction on a worker thread raises RuntimeError."""
+        writer = SkillWriter(local_root=str(tmp_path))
+        artifacts = {mock_skill_no_hash.metadata.id: b"not a valid zip file"}
+        
+        with pytest.raises(RuntimeError) as exc_info:
+            writer.write_skills([mock_skill, mock_skill_no_hash], artifacts=artifacts)
+        
+        assert mock_skill_no_hash.metadata.name in str(exc_info.value)
 
 
 class TestSkillWriterGeneratePromptSection:
@@ -287,12 +374,14 @@ class TestSkillWriterDaytona:
         # Act
         result = writer.write_skills([mock_skill])
         
-        # Assert - mkdir was called for base and skill directories
+        # Assert - one mkdir covers the base and skill directories
         mkdir_calls = [
-            call for call in mock_sandbox.process.exec.call_args_list
-            if 'mkdir' in str(call)
+            call.args[0] for call in mock_sandbox.process.exec.call_args_list
+            if 'mkdir' in call.args[0]
         ]
-        assert len(mkdir_calls) >= 2  # At least base dir + skill dir
+        assert len(mkdir_calls) == 1
+        assert "/bin/skills " in mkdir_calls[0]
+        assert result[mock_skill.metadata.id] in mkdir_calls[0]
 
     def test_write_skills_daytona_with_artifacts_extracts(
         self, mock_skill, sample_artifact_zip
@@ -313,6 +402,34 @@ class TestSkillWriterDaytona:
         assert any('unzip' in call for call in exec_calls), \
             "Expected unzip command in sandbox"
 
+    def test_write_skills_daytona_round_trips_do_not_grow_with_skills(
+        self, mock_skill, mock_skill_no_hash, sample_artifact_zip
+    ):
+        """Test that several skills are written with one mkdir, unzip and chmod."""
+        mock_sandbox = MagicMock()
+        mock_sandbox.process.exec.return_value = MagicMock(exit_code=0, output="")
+        mock_sandbox.fs.upload_files = MagicMock()
+        
+        writer = SkillWriter(sandbox=mock_sandbox)
+        artifacts = {
+            mock_skill.metadata.id: sample_artifact_zip,
+            mock_skill_no_hash.metadata.id: sample_artifact_zip,
+        }
+        
+        # Act
+        result = writer.write_skills([mock_skill, mock_skill_no_hash], artifacts=artifacts)
+        
+        # Assert - three exec round trips, each covering both skill directories
+        commands = [call.args[0] for call in mock_sandbox.process.exec.call_args_list]
+        assert len(commands) == 3
+        mkdir_cmd, extract_cmd, chmod_cmd = commands
+        assert mkdir_cmd.startswith("mkdir -p")
+        assert "unzip" in extract_cmd
+        assert "chmod" in chmod_cmd
+        for skill_dir in result.values():
+            assert all(skill_dir in cmd for cmd in commands)
+        mock_sandbox.fs.upload_files.assert_called_once()
+
     def test_write_skills_daytona_upload_failure_raises(self, mock_skill):
         """Test that upload failure raises RuntimeError."""
         mock_sandbox = MagicMock()
@@ -336,20 +453,39 @@ class TestSkillWriterDaytona:
         skill_dir = "/bin/skills/abc123"
         
         # Act
-        writer._extract_artifact_daytona(skill_dir)
+        writer._extract_artifacts_daytona([skill_dir])
         
         # Assert - chmod command was called
         exec_calls = [str(call) for call in mock_sandbox.process.exec.call_args_list]
         assert any('chmod' in call for call in exec_calls), \
             "Expected chmod command for making scripts executable"
 
+    def test_extract_artifact_daytona_batches_chmod(self):
+        """Test that one find invocation chmods every script extension in batches."""
+        mock_sandbox = MagicMock()
+        mock_sandbox.process.exec.return_value = MagicMock(exit_code=0, output="")
+        
+        writer = SkillWriter(sandbox=mock_sandbox)
+        
+        # Act
+        writer._extract_artifacts_daytona(["/bin/skills/abc123"])
+        
+        # Assert
+        chmod_cmd = next(
+            call.args[0] for call in mock_sandbox.process.exec.call_args_list
+            if 'chmod' in call.args[0]
+        )
+        assert chmod_cmd.endswith("-exec chmod +x {} +")
+        for ext in SkillWriter.SCRIPT_EXTENSIONS:
+            assert f"-name '*{ext}'" in chmod_cmd
+
 
 class TestSkillWriterGetSkillDir:
     """Tests for SkillWriter._get_skill_dir() method."""
 
     def test_get_skill_dir_with_hash(self, mock_skill):
         """Test directory path uses version_hash."""
-        writer = SkillWriter(local_root="/tmp")
+        writer = SkillWriter()
         
         result = writer._get_skill_dir(mock_skill)
         
@@ -357,7 +493,7 @@ class TestSkillWriterGetSkillDir:
 
     def test_get_skill_dir_without_hash_uses_slug(self, mock_skill_no_hash):
         """Test directory path falls back to normalized slug."""
-        writer = SkillWriter(local_root="/tmp")
+        writer = SkillWriter()
         
         result = writer._get_skill_dir(mock_skill_no_hash)
         
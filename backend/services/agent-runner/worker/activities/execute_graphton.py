@@ -120,7 +120,8 @@ async def _execute_graphton_impl(
     session_client = SessionClient(api_key)
     agent_instance_client = AgentInstanceClient(api_key)
     agent_client = AgentClient(api_key)
-    execution_client = AgentExecutionClient(api_key)
+    # Progressive updates are coalesced; final/failed updates are sent directly
+    execution_client = AgentExecutionClient(api_key, coalesce_window=0.05)
     
     # Initialize status builder (builds status locally, returns to workflow)
     status_builder = StatusBuilder(execution_id, execution.status)
@@ -495,19 +496,19 @@ async def _execute_graphton_impl(
             if events_processed - last_update_sent >= update_interval:
                 try:
                     activity_logger.debug(
-                        f"📤 Sending status update #{events_processed}: "
+                        f"📤 Queueing status update #{events_processed}: "
                         f"messages={len(status_builder.current_status.messages)}, "
                         f"tool_calls={len(status_builder.current_status.tool_calls)}"
                     )
                     
-                    # Call stigmer-service updateStatus endpoint (merges status)
-                    await execution_client.update_status(
+                    # Queue for stigmer-service updateStatus (merges status). Bursts
+                    # are coalesced into one RPC without blocking the event stream
+                    await execution_client.queue_status_update(
                         execution_id=execution_id,
                         status=status_builder.current_status
                     )
                     
                     last_update_sent = events_processed
-                    activity_logger.debug(f"✅ Status update sent successfully")
                     
                 except Exception as e:
                     # Log but don't fail - keep processing events
@@ -620,3 +621,12 @@ async def _execute_graphton_impl(
         
         # Return failed status to workflow (already persisted via gRPC above)
         return status_builder.current_status
+    
+    finally:
+        # Stop the coalescing window so no queued progress update is sent after
+        # the activity ends (including on cancellation, which skips the
+        # handlers above)
+        try:
+            await execution_client.close()
+        except Exception as close_error:
+            activity_logger.warning(f"Failed to flush queued status updates: {close_error}")
@@ -12,8 +12,11 @@ Directory Structure:
 """
 
 from ai.stigmer.agentic.skill.v1.api_pb2 import Skill
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import os
+import shlex
+import shutil
 import zipfile
 import io
 
@@ -30,6 +33,13 @@ class SkillWriter:
     """
     
     SKILLS_BASE_DIR = "/bin/skills"
+    SCRIPT_EXTENSIONS = ('.sh', '.py', '.js', '.ts', '.rb', '.pl')
+    # find(1) test matching SCRIPT_EXTENSIONS, for chmod inside the sandbox
+    _SCRIPT_FIND_EXPR = "\\( " + " -o ".join(f"-name '*{ext}'" for ext in SCRIPT_EXTENSIONS) + " \\)"
+    MAX_LOCAL_WRITE_WORKERS = 8
+    EXTRACT_BUFFER_SIZE = 1024 * 1024
+    MAX_EXTRACT_WORKERS = 8
+    PARALLEL_EXTRACT_MIN_ENTRIES = 16
     
     def __init__(self, sandbox=None, local_root: str | None = None):
         """Initialize SkillWriter.
@@ -59,6 +69,18 @@ class SkillWriter:
         
         return f"{self.skills_base}/{version_hash}"
     
+    @classmethod
+    def _is_executable(cls, name: str) -> bool:
+        """Return True if an extracted file should be made executable.
+        
+        Args:
+            name: File name or path inside the artifact
+            
+        Returns:
+            True for known script extensions
+        """
+        return name.endswith(cls.SCRIPT_EXTENSIONS)
+    
     def write_skills(self, skills: list[Skill], artifacts: dict[str, bytes] | None = None) -> dict[str, str]:
         """Write skills to sandbox.
         
@@ -104,42 +126,70 @@ class SkillWriter:
             Dictionary mapping skill ID to directory path
         """
         skill_paths = {}
+        # Skills that share a version hash share a directory; each group is
+        # written in order by one worker so no two threads touch the same path
+        groups: dict[str, list[Skill]] = {}
         
         for skill in skills:
-            skill_id = skill.metadata.id
             skill_dir = self._get_skill_dir(skill)
-            
-            # Local path: {local_root}/bin/skills/{version_hash}/
-            local_skill_dir = f"{self.local_root}{skill_dir}"
+            groups.setdefault(skill_dir, []).append(skill)
+            skill_paths[skill.metadata.id] = skill_dir
+        
+        # zlib inflate and file writes release the GIL, so distinct skills
+        # extract concurrently; SKILL.md-only writes are too cheap for a pool
+        if artifacts and len(groups) > 1:
+            max_workers = min(self.MAX_LOCAL_WRITE_WORKERS, len(groups))
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                futures = [
+                    pool.submit(self._write_skill_group_local, skill_dir, group, artifacts)
+                    for skill_dir, group in groups.items()
+                ]
+                for future in futures:
+                    future.result()
+        else:
+            for skill_dir, group in groups.items():
+                self._write_skill_group_local(skill_dir, group, artifacts)
+        
+        logger.info(
+            f"Successfully wrote {len(skills)} skills to local filesystem: "
+            f"{[s.metadata.name for s in skills]}"
+        )
+        
+        return skill_paths
+    
+    def _write_skill_group_local(
+        self, skill_dir: str, skills: list[Skill], artifacts: dict[str, bytes] | None
+    ) -> None:
+        """Write skills that share one directory to the local filesystem, in order.
+        
+        Args:
+            skill_dir: Sandbox directory path shared by the skills
+            skills: Skills resolving to skill_dir
+            artifacts: Optional dict mapping skill ID to artifact ZIP bytes
+        """
+        # Local path: {local_root}/bin/skills/{version_hash}/
+        local_skill_dir = f"{self.local_root}{skill_dir}"
+        
+        for skill in skills:
+            skill_id = skill.metadata.id
             
             try:
-                # Create directory
-                os.makedirs(local_skill_dir, exist_ok=True)
-                
-                # Extract artifact if provided
+                # Extract artifact if provided (creates the directory once the ZIP is valid)
                 if artifacts and skill_id in artifacts:
                     logger.info(f"Extracting artifact for skill {skill.metadata.name}")
                     self._extract_artifact_local(artifacts[skill_id], local_skill_dir)
                 else:
                     # Write SKILL.md only if no artifact (backward compatibility)
+                    os.makedirs(local_skill_dir, exist_ok=True)
                     skill_md_path = f"{local_skill_dir}/SKILL.md"
-                    with open(skill_md_path, 'w', encoding='utf-8') as f:
-                        f.write(skill.spec.skill_md)
+                    with open(skill_md_path, 'wb') as f:
+                        f.write(skill.spec.skill_md.encode('utf-8'))
                     logger.info(f"Wrote SKILL.md to local filesystem: {skill_md_path}")
                 
-                skill_paths[skill_id] = skill_dir
-                
             except Exception as e:
                 raise RuntimeError(
                     f"Failed to write skill {skill.metadata.name} to local filesystem: {e}"
                 ) from e
-        
-        logger.info(
-            f"Successfully wrote {len(skills)} skills to local filesystem: "
-            f"{[s.metadata.name for s in skills]}"
-        )
-        
-        return skill_paths
     
     def _extract_artifact_local(self, artifact_bytes: bytes, target_dir: str) -> None:
         """Extract skill artifact ZIP to local filesystem.
@@ -152,17 +202,45 @@ class SkillWriter:
             RuntimeError: If extraction fails
         """
         try:
+            # Opening the archive validates it, so bad input never touches disk
             with zipfile.ZipFile(io.BytesIO(artifact_bytes)) as zf:
-                # Extract all files
-                zf.extractall(target_dir)
+                os.makedirs(target_dir, exist_ok=True)
+                root = os.path.realpath(target_dir)
+                # Keyed by target so a name repeated in the archive is written once (last wins)
+                entries = {}
+                
+                # Resolve and create every directory first so entries can be written in any order
+                for info in zf.infolist():
+                    target = os.path.realpath(os.path.join(root, info.filename))
+                    if os.path.commonpath([root, target]) != root:
+                        raise RuntimeError(f"Artifact entry escapes skill directory: {info.filename}")
+                    
+                    if info.is_dir():
+                        os.makedirs(target, exist_ok=True)
+                        continue
+                    
+                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    entries[target] = info
+                
+                # ZipFile serialises seeks on the shared buffer but inflates
+                # outside that lock, so large archives extract across threads
+                if len(entries) >= self.PARALLEL_EXTRACT_MIN_ENTRIES:
+                    max_workers = min(self.MAX_EXTRACT_WORKERS, os.cpu_count() or 1)
+                    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                        futures = [
+                            pool.submit(self._extract_entry_local, zf, info, target)
+                            for target, info in entries.items()
+                        ]
+                        for future in futures:
+                            future.result()
+                else:
+                    for target, info in entries.items():
+                        self._extract_entry_local(zf, info, target)
                 
                 # Make scripts executable
-                for root, dirs, files in os.walk(target_dir):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        # Make files executable if they have a shebang or known script extension
-                        if file_path.endswith(('.sh', '.py', '.js', '.ts', '.rb', '.pl')):
-                            os.chmod(file_path, 0o755)
+                for target, info in entries.items():
+                    if self._is_executable(info.filename):
+                        os.chmod(target, 0o755)
                 
                 logger.info(f"Extracted artifact to {target_dir}")
                 
@@ -171,6 +249,11 @@ class SkillWriter:
         except Exception as e:
             raise RuntimeError(f"Failed to extract artifact: {e}") from e
     
+    def _extract_entry_local(self, zf: zipfile.ZipFile, info: zipfile.ZipInfo, target: str) -> None:
+        """Stream one archive entry to target with a large copy buffer."""
+        with zf.open(info) as src, open(target, 'wb') as dst:
+            shutil.copyfileobj(src, dst, self.EXTRACT_BUFFER_SIZE)
+    
     def _write_skills_daytona(self, skills: list[Skill], artifacts: dict[str, bytes] | None = None) -> dict[str, str]:
         """Write skills to Daytona sandbox.
         
@@ -183,33 +266,23 @@ class SkillWriter:
         """
         from daytona import FileUpload
         
-        # Step 1: Create base skills directory
-        mkdir_cmd = f"mkdir -p {self.skills_base}"
-        try:
-            result = self.sandbox.process.exec(mkdir_cmd, timeout=5)
-            if result.exit_code != 0:
-                raise RuntimeError(
-                    f"Failed to create skills base directory: {result.output}"
-                )
-            logger.info(f"Created skills base directory: {self.skills_base}")
-        except Exception as e:
-            raise RuntimeError(f"Failed to create skills base directory: {e}") from e
-        
-        # Step 2: Prepare file uploads and artifacts
+        # Step 1: Collect file uploads and skill directories
         file_uploads = []
         skill_paths = {}
-        skill_dirs = set()
+        skill_dirs = {}
+        artifact_dirs = {}
         
         for skill in skills:
             skill_id = skill.metadata.id
             skill_dir = self._get_skill_dir(skill)
-            skill_dirs.add(skill_dir)
+            skill_dirs[skill_dir] = None
             skill_paths[skill_id] = skill_dir
             
             # If artifact provided, upload ZIP and extract it
             # Otherwise, just upload SKILL.md (backward compatibility)
             if artifacts and skill_id in artifacts:
                 # Upload artifact ZIP for extraction
+                artifact_dirs[skill_dir] = None
                 artifact_zip_path = f"{skill_dir}/artifact.zip"
                 file_uploads.append(
                     FileUpload(
@@ -227,19 +300,21 @@ class SkillWriter:
                     )
                 )
         
-        # Step 3: Create skill directories
-        for skill_dir in skill_dirs:
-            mkdir_cmd = f"mkdir -p {skill_dir}"
-            try:
-                result = self.sandbox.process.exec(mkdir_cmd, timeout=5)
-                if result.exit_code != 0:
-                    raise RuntimeError(
-                        f"Failed to create skill directory {skill_dir}: {result.output}"
-                    )
-            except Exception as e:
-                raise RuntimeError(f"Failed to create skill directory {skill_dir}: {e}") from e
+        # Step 2: Create base and skill directories in one sandbox round trip
+        mkdir_cmd = "mkdir -p " + " ".join(
+            shlex.quote(path) for path in [self.skills_base, *skill_dirs]
+        )
+        try:
+            result = self.sandbox.process.exec(mkdir_cmd, timeout=5)
+            if result.exit_code != 0:
+                raise RuntimeError(
+                    f"Failed to create skill directories: {result.output}"
+                )
+            logger.info(f"Created skills directories under {self.skills_base}")
+        except Exception as e:
+            raise RuntimeError(f"Failed to create skill directories: {e}") from e
         
-        # Step 4: Batch upload all files
+        # Step 3: Batch upload all files
         try:
             self.sandbox.fs.upload_files(file_uploads)
             logger.info(
@@ -251,45 +326,51 @@ class SkillWriter:
                 f"Failed to upload skills to Daytona sandbox: {e}"
             ) from e
         
-        # Step 5: Extract artifacts if provided
-        if artifacts:
-            for skill in skills:
-                skill_id = skill.metadata.id
-                if skill_id in artifacts:
-                    skill_dir = self._get_skill_dir(skill)
-                    logger.info(f"Extracting artifact for skill {skill.metadata.name}")
-                    self._extract_artifact_daytona(skill_dir)
+        # Step 4: Extract artifacts if provided (skills sharing a directory share
+        # one uploaded artifact.zip, so each directory is extracted once)
+        if artifact_dirs:
+            logger.info(f"Extracting artifacts for {len(artifact_dirs)} skill directories")
+            self._extract_artifacts_daytona(list(artifact_dirs))
         
         return skill_paths
     
-    def _extract_artifact_daytona(self, skill_dir: str) -> None:
-        """Extract skill artifact ZIP in Daytona sandbox.
+    def _extract_artifacts_daytona(self, skill_dirs: list[str]) -> None:
+        """Extract uploaded skill artifact ZIPs in Daytona sandbox.
+        
+        All directories are extracted by one command, and scripts made
+        executable by a second, so the cost in sandbox round trips doesn't
+        grow with the number of skills.
         
         Args:
-            skill_dir: Skill directory path (e.g., /bin/skills/abc123/)
+            skill_dirs: Skill directory paths (e.g., /bin/skills/abc123/), each
+                holding an uploaded artifact.zip
             
         Raises:
             RuntimeError: If extraction fails
         """
-        artifact_zip_path = f"{skill_dir}/artifact.zip"
+        quoted_dirs = [shlex.quote(skill_dir) for skill_dir in skill_dirs]
         
         # Extract using unzip command in sandbox
-        extract_cmd = f"cd {skill_dir} && unzip -o artifact.zip && rm artifact.zip"
+        extract_cmd = " && ".join(
+            f"unzip -o {skill_dir}/artifact.zip -d {skill_dir} && rm {skill_dir}/artifact.zip"
+            for skill_dir in quoted_dirs
+        )
         
         try:
-            result = self.sandbox.process.exec(extract_cmd, timeout=30)
+            result = self.sandbox.process.exec(extract_cmd, timeout=30 * len(skill_dirs))
             if result.exit_code != 0:
                 raise RuntimeError(
-                    f"Failed to extract artifact in {skill_dir}: {result.output}"
+                    f"Failed to extract artifacts in {', '.join(skill_dirs)}: {result.output}"
                 )
             
-            # Make scripts executable
-            chmod_cmd = f"find {skill_dir} -type f \\( -name '*.sh' -o -name '*.py' -o -name '*.js' -o -name '*.ts' -o -name '*.rb' -o -name '*.pl' \\) -exec chmod +x {{}} \\;"
+            # Make scripts executable; "+" hands find's matches to chmod in
+            # batches instead of one process per file
+            chmod_cmd = f"find {' '.join(quoted_dirs)} -type f {self._SCRIPT_FIND_EXPR} -exec chmod +x {{}} +"
             result = self.sandbox.process.exec(chmod_cmd, timeout=10)
             if result.exit_code != 0:
-                logger.warning(f"Failed to make scripts executable in {skill_dir}: {result.output}")
+                logger.warning(f"Failed to make scripts executable in {', '.join(skill_dirs)}: {result.output}")
             
-            logger.info(f"Extracted artifact in Daytona sandbox: {skill_dir}")
+            logger.info(f"Extracted artifacts in Daytona sandbox: {', '.join(skill_dirs)}")
             
         except Exception as e:
             raise RuntimeError(f"Failed to extract artifact in sandbox: {e}") from e
@@ -28,7 +28,9 @@ How Polyglot Works:
 from dataclasses import dataclass
 from typing import Optional
 from enum import Enum
+import functools
 import os
+import tempfile
 
 
 class ExecutionMode(Enum):
@@ -219,7 +221,13 @@ class Config:
     
     # Stigmer backend configuration (required for both modes)
     stigmer_backend_endpoint: str
+    stigmer_backend_uds_path: str | None  # Unix socket for a same-host backend
     stigmer_api_key: str
+    skill_cache_ttl: float  # Seconds SkillClient caches skill lookups
+    skill_channel_pool_size: int  # Backend connections SkillClient spreads RPCs over
+    skill_rpc_compression: str  # "gzip" or "none" for skill metadata RPCs
+    skill_artifact_cache_dir: str | None  # On-disk skill artifact cache (None disables)
+    skill_artifact_cache_max_bytes: int  # Size the artifact cache is trimmed to
     
     # Sandbox configuration (mode-specific)
     sandbox_type: str  # "filesystem" for local, "daytona" for cloud
@@ -241,8 +249,15 @@ class Config:
     sandbox_ttl: int  # Container reuse TTL in seconds
 
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def load_from_env(cls):
-        """Load configuration from environment variables."""
+        """Load configuration from environment variables.
+
+        The result is cached for the life of the process, since every gRPC
+        client and activity would otherwise re-parse the environment. Code
+        that changes the environment afterwards (e.g. tests) must call
+        ``Config.load_from_env.cache_clear()``.
+        """
         # Detect execution mode (local vs cloud)
         mode = os.getenv("MODE", "cloud")
         is_local = mode == "local"
@@ -313,7 +328,16 @@ class Config:
             task_queue=task_queue,
             max_concurrency=int(os.getenv("TEMPORAL_MAX_CONCURRENCY", "10")),
             stigmer_backend_endpoint=os.getenv("STIGMER_BACKEND_ENDPOINT", default_endpoint),
+            stigmer_backend_uds_path=os.getenv("STIGMER_UDS_PATH") or None,
             stigmer_api_key=stigmer_api_key,
+            skill_cache_ttl=float(os.getenv("SKILL_CACHE_TTL", "60")),
+            skill_channel_pool_size=int(os.getenv("SKILL_CHANNEL_POOL_SIZE", "4")),
+            skill_rpc_compression=os.getenv("SKILL_RPC_COMPRESSION", "none").lower(),
+            skill_artifact_cache_dir=os.getenv(
+                "SKILL_ARTIFACT_CACHE_DIR",
+                os.path.join(tempfile.gettempdir(), "stigmer-skill-artifacts"),
+            ) or None,
+            skill_artifact_cache_max_bytes=int(os.getenv("SKILL_ARTIFACT_CACHE_MAX_MB", "1024")) * 1024 * 1024,
             sandbox_type=sandbox_type,
             sandbox_root_dir=sandbox_root_dir,
             redis_host=redis_host,
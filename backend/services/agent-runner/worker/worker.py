@@ -6,6 +6,7 @@ from temporalio.worker import Worker
 from .config import Config
 from .token_manager import set_api_key
 from .redis_config import RedisConfig, create_redis_client
+from grpc_client.channel_factory import close_all_channels
 import logging
 import redis
 
@@ -90,6 +91,11 @@ class AgentRunner:
             self.logger.error(f"❌ Failed to connect to Temporal: {e}")
             raise
         
+        # Connect backend channels now so the first execution doesn't pay
+        # the handshake (channels are shared, so activities reuse them)
+        from grpc_client.skill_client import SkillClient
+        await SkillClient(self.config.stigmer_api_key).warmup()
+        
         # Register worker
         self.worker = Worker(
             self.client,
@@ -136,6 +142,13 @@ class AgentRunner:
             except Exception as e:
                 self.logger.error(f"Error stopping worker: {e}")
         
+        # Close shared gRPC channels to the Stigmer backend
+        try:
+            await close_all_channels()
+            self.logger.info("✓ gRPC channels closed")
+        except Exception as e:
+            self.logger.error(f"Error closing gRPC channels: {e}")
+        
         # Close Redis connection (cloud mode only)
         if self.redis_client:
             try: